@@ -0,0 +1,50 @@
+"""
+Benchmark where ParallelPreprocessor should stop running requests inline.
+
+A request at or below inline_max_size is preprocessed on the event loop,
+blocking it for the whole run; a larger one pays a fixed cost to ship its
+chunks to the worker pool and back. For each request size this prints the
+inline (event-loop blocking) time next to the pooled wall time, with the
+pool already started.
+
+Usage:
+    python -m benchmarks.parallel_preprocess [workers]
+"""
+import sys
+import time
+import asyncio
+from src.preprocessing.preprocessor import EmailPreprocessor
+from src.preprocessing.parallel_preprocessor import ParallelPreprocessor
+from benchmarks.preprocess_throughput import generate_lines
+
+SIZES = [100, 250, 500, 1000, 2000, 5000]
+REPEATS = 5
+
+async def best_of(preprocess, lines: list) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        await preprocess(lines)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+async def run(workers: int):
+    inline = EmailPreprocessor()
+    pooled = ParallelPreprocessor(workers=workers, inline_max_size=0, cpu_budget_seconds=None)
+    try:
+        await pooled.preprocess(generate_lines(1000))
+        print(f"workers: {workers}")
+        print(f"{'emails':>8} {'inline':>10} {'pooled':>10}")
+        for size in SIZES:
+            lines = generate_lines(size)
+            inline_time = await best_of(inline.preprocess, lines)
+            pooled_time = await best_of(pooled.preprocess, lines)
+            print(f"{size:>8} {inline_time * 1000:>8.1f}ms {pooled_time * 1000:>8.1f}ms")
+    finally:
+        pooled.close()
+
+def main(workers: int = 2):
+    asyncio.run(run(workers))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Benchmark cleaning and format validation in EmailPreprocessor.
+
+Generates input lines that look like a typical upload (mostly well-formed
+addresses with stray case and whitespace, plus a share of malformed ones)
+and times the clean + format stage with and without the fused fast path.
+
+Usage:
+    python -m benchmarks.preprocess_throughput [lines] [invalid_percent]
+"""
+import sys
+import time
+import random
+from src.preprocessing.preprocessor import EmailPreprocessor
+from benchmarks.similarity_prefilter import generate_local_parts
+
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "example.org", "company.co.uk", "mail.ru"]
+DEFECTS = [
+    lambda email: email.replace("@", ""),
+    lambda email: email.replace("@", " @@ "),
+    lambda email: email.rsplit(".", 1)[0],
+    lambda email: "." + email,
+    lambda email: email.replace(".", "é", 1),
+]
+
+def generate_lines(count: int, invalid_percent: int = 5, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    local_parts = generate_local_parts(min(count, 20000), seed)
+    lines = []
+    for _ in range(count):
+        email = f"{rng.choice(local_parts)}@{rng.choice(DOMAINS)}"
+        if rng.random() < 0.3:
+            email = f" {email.title()}\n"
+        if rng.randrange(100) < invalid_percent:
+            email = rng.choice(DEFECTS)(email)
+        lines.append(email)
+    return lines
+
+def measure(preprocessor: EmailPreprocessor, lines: list) -> tuple:
+    start = time.perf_counter()
+    outcome = preprocessor.clean_and_validate(lines)
+    return time.perf_counter() - start, outcome
+
+def main(count: int = 1000000, invalid_percent: int = 5):
+    lines = generate_lines(count, invalid_percent)
+    
+    reference_time, expected = measure(EmailPreprocessor(fast_path=False), lines)
+    fast_time, outcome = measure(EmailPreprocessor(fast_path=True), lines)
+    
+    assert outcome == expected, "fast path changed the results"
+    print(f"lines:          {count}")
+    print(f"valid:          {len(outcome[1])}")
+    print(f"invalid:        {len(outcome[2])}")
+    print(f"reference path: {reference_time:.2f}s ({count / reference_time:,.0f} lines/s)")
+    print(f"fast path:      {fast_time:.2f}s ({count / fast_time:,.0f} lines/s, "
+          f"{reference_time / fast_time:.1f}x)")
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Benchmark SyntaxValidator on a mostly valid corpus.
+
+Times the single-match fast path against the full check-by-check
+breakdown (diagnostics=True), and validate_many against both, on the
+lines generated for the preprocessing benchmark.
+
+Usage:
+    python -m benchmarks.syntax_validator [count] [invalid_percent]
+"""
+import sys
+import time
+from src.validators.basic.syntax_validator import SyntaxValidator
+from benchmarks.preprocess_throughput import generate_lines
+
+def measure(addresses: list, diagnostics: bool) -> tuple:
+    validator = SyntaxValidator()
+    start = time.perf_counter()
+    results = [validator.validate(address, diagnostics) for address in addresses]
+    return time.perf_counter() - start, results
+
+def main(count: int = 500000, invalid_percent: int = 5):
+    addresses = generate_lines(count, invalid_percent)
+    
+    full_time, expected = measure(addresses, diagnostics=True)
+    fast_time, results = measure(addresses, diagnostics=False)
+    
+    validator = SyntaxValidator()
+    start = time.perf_counter()
+    batch = validator.validate_many(addresses)
+    many_time = time.perf_counter() - start
+    
+    assert results == expected, "fast path changed the results"
+    assert batch.is_valid.tolist() == [result["is_valid"] for result in expected]
+    print(f"addresses:        {count}")
+    print(f"valid:            {sum(result['is_valid'] for result in results)}")
+    print(f"full breakdown:   {full_time:.2f}s ({count / full_time:,.0f}/s)")
+    print(f"fast path:        {fast_time:.2f}s ({count / fast_time:,.0f}/s, {full_time / fast_time:.1f}x)")
+    print(f"validate_many:    {many_time:.2f}s ({count / many_time:,.0f}/s, {full_time / many_time:.1f}x)")
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
\ No newline at end of file
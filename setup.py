@@ -28,5 +28,8 @@ setup(
         "openpyxl==3.1.2",
         "xlrd==2.0.1"
     ],
+    extras_require={
+        "parquet": ["pyarrow==14.0.1"]
+    },
     package_dir={"": "."}
 )
\ No newline at end of file
@@ -1,9 +1,9 @@
 import logging
 from typing import Dict, List
 import json
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
+from ..utils.result_writers import CsvResultWriter
 
 class ReportGenerator:
     """Generates detailed validation reports."""
@@ -75,15 +75,9 @@ class ReportGenerator:
         try:
             filename = f"reports/validation_report_{timestamp}.csv"
             
-            # Convert results to DataFrame for easier CSV handling
-            df = pd.DataFrame(results)
-            
-            # Flatten nested dictionaries
-            df["checks"] = df["checks"].apply(json.dumps)
-            df["suggestions"] = df["suggestions"].apply(lambda x: "|".join(x))
-            df["issues"] = df["issues"].apply(lambda x: "|".join(x))
-            
-            df.to_csv(filename, index=False)
+            # Stream flattened rows instead of building a DataFrame
+            with CsvResultWriter(filename) as writer:
+                writer.write_many(results)
             return filename
             
         except Exception as e:
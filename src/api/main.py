@@ -1,20 +1,31 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
-from typing import List, Optional
+from typing import Dict, List, Optional
+import os
+import json
+import time
+import uuid
+import asyncio
 import logging
+from pathlib import Path
 from .models import (
     EmailValidationRequest,
     EmailValidationResponse,
     BatchValidationRequest,
     BatchValidationResponse,
+    BatchJobRequest,
+    BatchJobStatus,
     ValidationOptions,
     CacheStats,
     ReportRequest
 )
 from ..validators.email_validator import EmailValidator
 from ..preprocessing.preprocessor import EmailPreprocessor
+from ..preprocessing.parallel_preprocessor import ParallelPreprocessor, PreprocessingBudgetExceeded
+from ..batch.batch_processor import BatchProcessor
 from ..cache.cache_manager import CacheManager
+from ..validators.quality.typo_detector import get_domain_verdict_cache
 from ..visualization.report_generator import ReportGenerator
 
 # Setup logging
@@ -37,12 +48,60 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def load_production_options(section: str) -> Dict:
+    """Read one section of the production config ({} when missing or unreadable)."""
+    config_path = Path('config/config.json')
+    if not config_path.exists():
+        return {}
+    try:
+        with open(config_path, 'r') as f:
+            return json.load(f).get('production', {}).get(section, {})
+    except Exception as e:
+        logger.error(f"Error reading {section} config: {str(e)}")
+        return {}
+
+def load_duplicate_options() -> Dict:
+    """
+    Read the duplicate detector options from the production config.
+    
+    Exact mode (with similar-address detection) unless the config sets
+    "probabilistic": true, which bounds memory but only finds exact
+    duplicates.
+    """
+    return load_production_options('duplicate_options')
+
 # Initialize components
-validator = EmailValidator(cache_enabled=True)
+validator = EmailValidator(cache_enabled=True, duplicate_options=load_duplicate_options())
 preprocessor = EmailPreprocessor()
+# Batch preprocessing runs in worker processes to keep the event loop free
+parallel_preprocessor = ParallelPreprocessor(preprocessor, **{
+    "workers": os.cpu_count() or 1,
+    "cpu_budget_seconds": 30.0,
+    **load_production_options('preprocessing')
+})
 cache_manager = CacheManager()
 report_generator = ReportGenerator()
 
+# Background batch jobs by job ID; finished jobs are dropped after JOB_TTL_SECONDS
+batch_jobs: Dict[str, Dict] = {}
+JOB_TTL_SECONDS = 3600
+MAX_RESULTS_PAGE = 1000
+
+def _evict_finished_jobs():
+    """Drop finished jobs, with their results, once their TTL has passed."""
+    cutoff = time.time() - JOB_TTL_SECONDS
+    expired = [
+        job_id for job_id, job in batch_jobs.items()
+        if job.get("finished_at") is not None and job["finished_at"] < cutoff
+    ]
+    for job_id in expired:
+        del batch_jobs[job_id]
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the preprocessing worker processes."""
+    parallel_preprocessor.close()
+
 @app.get("/")
 async def root():
     """API health check endpoint."""
@@ -82,7 +141,7 @@ async def validate_batch(request: BatchValidationRequest):
     """
     try:
         # Preprocess emails
-        preprocess_results = await preprocessor.preprocess(request.emails)
+        preprocess_results = await parallel_preprocessor.preprocess(request.emails)
         
         # Validate each email
         validation_results = []
@@ -99,10 +158,99 @@ async def validate_batch(request: BatchValidationRequest):
             invalid_format=preprocess_results["invalid_format"],
             duplicates=preprocess_results["duplicates"]
         )
+    except PreprocessingBudgetExceeded as e:
+        logger.warning(f"Batch rejected: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Error in batch validation: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _run_batch_job(job_id: str, request: BatchJobRequest):
+    """Run a background batch job, recording progress events as it goes."""
+    job = batch_jobs[job_id]
+    processor = BatchProcessor(validator)
+    processor.set_progress_event_callback(
+        lambda event: job.update(progress=event.to_dict())
+    )
+    try:
+        job["status"] = "running"
+        job["results"] = await processor.process_emails(
+            request.emails,
+            request.options.dict() if request.options else None
+        )
+        job["status"] = "completed"
+    except Exception as e:
+        logger.error(f"Error in batch job {job_id}: {str(e)}")
+        job.update(status="failed", error=str(e))
+    finally:
+        job["finished_at"] = time.time()
+        job.pop("task", None)
+        processor.close()
+
+@app.post("/jobs/batch", response_model=BatchJobStatus)
+async def start_batch_job(request: BatchJobRequest):
+    """
+    Start validating a batch of email addresses in the background.
+    
+    Args:
+        request: Batch job request
+        
+    Returns:
+        Job status with the ID to poll
+    """
+    _evict_finished_jobs()
+    job_id = uuid.uuid4().hex
+    batch_jobs[job_id] = {
+        "status": "queued",
+        "progress": None,
+        "results": None,
+        "error": None,
+        "finished_at": None
+    }
+    batch_jobs[job_id]["task"] = asyncio.create_task(_run_batch_job(job_id, request))
+    return BatchJobStatus(job_id=job_id, status="queued")
+
+@app.get("/jobs/batch/{job_id}", response_model=BatchJobStatus)
+async def get_batch_job(
+    job_id: str,
+    include_results: bool = False,
+    offset: int = 0,
+    limit: int = 100
+):
+    """
+    Get the status and latest progress event of a batch job.
+    
+    Finished jobs are kept for JOB_TTL_SECONDS after they end.
+    
+    Args:
+        job_id: Job ID returned when the job was started
+        include_results: Include a page of the results once the job has completed
+        offset: Position of the first result of the page
+        limit: Page size (at most MAX_RESULTS_PAGE)
+        
+    Returns:
+        Job status, with total_results once results are available
+    """
+    _evict_finished_jobs()
+    job = batch_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+        
+    results = job["results"]
+    page = None
+    if include_results and results is not None:
+        offset = max(0, offset)
+        page = results[offset:offset + max(1, min(limit, MAX_RESULTS_PAGE))]
+        
+    return BatchJobStatus(
+        job_id=job_id,
+        status=job["status"],
+        progress=job["progress"],
+        results=page,
+        total_results=len(results) if results is not None else None,
+        error=job["error"]
+    )
+
 @app.post("/report")
 async def generate_report(request: ReportRequest):
     """
@@ -140,7 +288,7 @@ async def get_cache_stats():
     """Get cache statistics."""
     try:
         stats = await cache_manager.get_stats()
-        return CacheStats(**stats)
+        return CacheStats(**stats, typo_domains=get_domain_verdict_cache().metrics.get_stats())
     except Exception as e:
         logger.error(f"Error getting cache stats: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -38,11 +38,26 @@ class BatchValidationResponse(BaseModel):
     invalid_format: List[Dict[str, Any]]
     duplicates: Dict[str, List[str]]
 
+class BatchJobRequest(BaseModel):
+    """Background batch job request."""
+    emails: List[str] = Field(..., min_items=1, max_items=100000)
+    options: Optional[ValidationOptions] = None
+
+class BatchJobStatus(BaseModel):
+    """Background batch job status."""
+    job_id: str
+    status: str
+    progress: Optional[Dict[str, Any]] = None
+    results: Optional[List[Optional[Dict[str, Any]]]] = None
+    total_results: Optional[int] = None
+    error: Optional[str] = None
+
 class CacheStats(BaseModel):
     """Cache statistics."""
     total_entries: int
     active_entries: int
     expired_entries: int
+    typo_domains: Optional[Dict[str, Any]] = None
 
 class ReportRequest(BaseModel):
     """Report generation request."""
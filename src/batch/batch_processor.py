@@ -1,94 +1,510 @@
+import time
 import logging
 import asyncio
-from typing import List, Dict, Callable
-from concurrent.futures import ThreadPoolExecutor
-import pandas as pd
+from typing import List, Dict, Callable, Iterator, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from .domain_scheduler import DomainScheduler
+from .checkpoint import BatchCheckpoint
+from .offline_screener import OfflineScreener
+from .progress import ProgressEvent, ProgressTracker
+from .cpu_checks import (
+    run_offline_checks,
+    expand_offline_results,
+    enabled_offline_checks
+)
+from ..validators.email_validator import DEFAULT_VALIDATION_OPTIONS
+from ..cache.validation_index import ValidationIndex
+from ..utils.file_handler import FileHandler
 
 class BatchProcessor:
     """Handles batch processing of email validations."""
     
-    def __init__(self, validator, batch_size: int = 100):
+    def __init__(
+        self,
+        validator,
+        batch_size: int = 100,
+        per_host_limit: int = 10,
+        domain_affinity: bool = True,
+        mx_providers: Optional[Dict[str, str]] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 10,
+        cpu_workers: int = 0,
+        cpu_chunk_size: int = 5000,
+        tiered: bool = False,
+        progress_interval: float = 1.0,
+        index_path: Optional[str] = None,
+        freshness_seconds: float = 7 * 24 * 3600
+    ):
         self.logger = logging.getLogger(__name__)
         self.validator = validator
         self.batch_size = batch_size
+        self.domain_affinity = domain_affinity
+        self.scheduler = DomainScheduler(batch_size, per_host_limit, mx_providers)
+        self.checkpoint = BatchCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.checkpoint_interval = max(1, checkpoint_interval)
         self.progress_callback = None
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.progress_event_callback = None
+        self.progress_interval = progress_interval
+        self.tracker: Optional[ProgressTracker] = None
+        # Input positions of the last job that got an error result
+        self.failed_positions: List[int] = []
+        self.cpu_workers = cpu_workers
+        self.cpu_chunk_size = max(1, cpu_chunk_size)
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.screener = OfflineScreener(validator) if tiered else None
+        self.validation_index = ValidationIndex(index_path) if index_path else None
+        self.freshness_seconds = freshness_seconds
         
     def set_progress_callback(self, callback: Callable[[int, int], None]):
         """Set callback for progress updates."""
         self.progress_callback = callback
         
-    async def process_file(self, file_path: str) -> List[Dict]:
+    def set_progress_event_callback(self, callback: Callable[[ProgressEvent], None]):
+        """
+        Set callback for structured progress events.
+        
+        Events carry throughput, per-stage latency percentiles, cache hit
+        rates, in-flight and failed batch counts and an ETA, and are
+        emitted at most once per progress_interval seconds plus once at the
+        end.
+        """
+        self.progress_event_callback = callback
+        
+    def close(self):
+        """Shut down the worker process pool, if one was started."""
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+        
+    async def process_file(
+        self,
+        file_path: str,
+        validation_options: Optional[Dict] = None,
+        resume: bool = False
+    ) -> List[Dict]:
         """
         Process emails from a file in batches.
         
         Args:
             file_path: Path to file containing emails
+            validation_options: Optional validation configuration
+            resume: Skip work saved in the checkpoint by a previous run
             
         Returns:
             List of validation results
         """
         try:
             emails = self._load_emails(file_path)
-            return await self.process_emails(emails)
+            return await self.process_emails(emails, validation_options, resume)
             
         except Exception as e:
             self.logger.error(f"Error processing file {file_path}: {str(e)}")
             return []
             
-    async def process_emails(self, emails: List[str]) -> List[Dict]:
+    async def process_emails(
+        self,
+        emails: List[str],
+        validation_options: Optional[Dict] = None,
+        resume: bool = False
+    ) -> List[Dict]:
         """
         Process a list of emails in batches.
         
+        With domain affinity enabled, batches are built by the domain
+        scheduler and domain-scoped checks run once per domain; results are
+        still returned in input order. When a checkpoint path is configured,
+        completed results are saved every checkpoint_interval batches and
+        resume=True skips the work a previous run of the same job finished;
+        the checkpoint is removed once every address has a result.
+        
+        With cpu_workers > 0, the CPU-bound checks (syntax, spam, typo) run
+        in a process pool, one window of about cpu_workers * cpu_chunk_size
+        addresses ahead of the batch loop, so checkpoints and progress
+        events keep coming; network checks stay on the event loop, and
+        duplicate checks stay with the validator's own detector.
+        
+        With tiered=True, each batch is first screened with offline checks
+        only; DNS, disposable-API, SMTP and reputation checks then run just
+        for the addresses that can still end up valid.
+        
+        With an index_path, addresses whose verdict in the validation index
+        is younger than freshness_seconds are not validated again; their
+        results carry the stored verdict with from_index=True. New verdicts
+        are added to the index when the job ends, except those of addresses
+        rejected by the offline tier.
+        
+        Addresses whose batch failed get an error result (is_valid False,
+        empty checks, a "Validation error" issue) and their positions are
+        listed in failed_positions; with a checkpoint, resume=True retries
+        them.
+        
         Args:
             emails: List of emails to validate
+            validation_options: Optional validation configuration
+            resume: Skip work saved in the checkpoint by a previous run
             
         Returns:
             List of validation results
         """
         try:
             total_emails = len(emails)
-            results = []
-            processed = 0
-            
-            # Process in batches
-            for i in range(0, total_emails, self.batch_size):
-                batch = emails[i:i + self.batch_size]
-                batch_results = await self._process_batch(batch)
-                results.extend(batch_results)
+            results: List[Optional[Dict]] = [None] * total_emails
+            domain_checks: Dict[str, Dict] = {}
+            
+            completed: Dict[int, Dict] = {}
+            if self.checkpoint:
+                job_id = BatchCheckpoint.job_id(emails, validation_options)
+                completed = self.checkpoint.start(job_id, total_emails, resume)
+                for position, result in completed.items():
+                    results[position] = result
+                    
+            remaining = [i for i in range(total_emails) if i not in completed]
+            self.tracker = ProgressTracker(total_emails, self.progress_interval)
+            
+            if self.validation_index is not None and remaining:
+                fresh = self.validation_index.fresh_results(
+                    [emails[i] for i in remaining],
+                    self.freshness_seconds,
+                    validation_options or DEFAULT_VALIDATION_OPTIONS
+                )
+                for k, result in fresh.items():
+                    results[remaining[k]] = result
+                self.tracker.record_cache(
+                    "validation_index", hits=len(fresh), misses=len(remaining) - len(fresh)
+                )
+                remaining = [i for k, i in enumerate(remaining) if k not in fresh]
                 
-                processed += len(batch)
-                if self.progress_callback:
-                    self.progress_callback(processed, total_emails)
+            processed = total_emails - len(remaining)
+            self.tracker.advance(processed)
+            
+            # Process in batches; with a process pool, the CPU-bound checks of
+            # the next window of batches run while this one is validated
+            number = 0
+            windows = self._iter_windows(emails, remaining)
+            window = next(windows, None)
+            upcoming = self._start_offline_checks(emails, window, validation_options)
+            try:
+                while window is not None:
+                    offline_checks = await upcoming if upcoming else {}
+                    next_window = next(windows, None)
+                    upcoming = self._start_offline_checks(emails, next_window, validation_options)
+                
+                    for positions in window:
+                        number += 1
+                        batch = [emails[i] for i in positions]
+                        batch_results, validated = await self._process_batch(
+                            batch,
+                            validation_options,
+                            domain_checks,
+                            [offline_checks.pop(i, {}) for i in positions]
+                        )
+                        for position, result in zip(positions, batch_results):
+                            results[position] = result
+                
+                        if self.checkpoint:
+                            self.checkpoint.record(positions, batch_results)
+                            if number % self.checkpoint_interval == 0:
+                                self.checkpoint.flush()
+                        if self.validation_index is not None:
+                            # Offline rejections lack the network checks, so
+                            # they are not stored as full-options verdicts
+                            self.validation_index.record(
+                                [batch_results[k] for k in validated],
+                                options=validation_options or DEFAULT_VALIDATION_OPTIONS
+                            )
+                        
+                        processed += len(batch)
+                        self.tracker.advance(len(batch))
+                        if len(batch_results) != len(batch):
+                            self.tracker.failed_batches += 1
+                        if self.progress_callback:
+                            self.progress_callback(processed, total_emails)
+                        self._emit_progress()
+                    window = next_window
+            finally:
+                if upcoming:
+                    upcoming.cancel()
+                
+            self._emit_progress(force=True)
+            if self.validation_index is not None:
+                self.validation_index.flush()
+                    
+            if self.screener:
+                self.logger.info(
+                    f"Tiered screening rejected {self.screener.rejected} of "
+                    f"{self.screener.screened} addresses offline"
+                )
+                
+            self.failed_positions = [i for i, result in enumerate(results) if result is None]
+            if self.checkpoint:
+                # Keep the checkpoint while failed batches remain to be retried
+                if self.failed_positions:
+                    self.checkpoint.flush()
+                else:
+                    self.checkpoint.clear()
+            for position in self.failed_positions:
+                results[position] = self._error_result(emails[position])
                     
             return results
             
         except Exception as e:
             self.logger.error(f"Error in batch processing: {str(e)}")
+            if self.checkpoint:
+                self.checkpoint.flush()
+            if self.validation_index is not None:
+                self.validation_index.flush()
             return []
             
-    async def _process_batch(self, batch: List[str]) -> List[Dict]:
-        """Process a single batch of emails."""
+    @staticmethod
+    def _error_result(email: str) -> Dict:
+        """Build the result of an address whose batch failed."""
+        return {
+            "email": email,
+            "is_valid": False,
+            "score": 0,
+            "issues": ["Validation error: batch processing failed"],
+            "checks": {},
+            "suggestions": []
+        }
+            
+    def _emit_progress(self, force: bool = False):
+        """Send a progress event unless throttled."""
+        if not self.progress_event_callback or not self.tracker:
+            return
+        event = self.tracker.poll(force)
+        if event:
+            self.progress_event_callback(event)
+            
+    async def _timed(self, stage: str, awaitable):
+        """Await a stage while tracking its latency and the in-flight count."""
+        tracker = self.tracker
+        start = time.monotonic()
+        if tracker:
+            tracker.in_flight += 1
+        try:
+            return await awaitable
+        finally:
+            if tracker:
+                tracker.in_flight -= 1
+                tracker.record_latency(stage, time.monotonic() - start)
+            
+    def _iter_batches(
+        self,
+        emails: List[str],
+        positions: List[int]
+    ) -> Iterator[List[int]]:
+        """Yield batches of the given input positions in processing order."""
+        if self.domain_affinity:
+            pending = [emails[i] for i in positions]
+            for batch in self.scheduler.schedule(pending):
+                yield [positions[j] for j in batch]
+        else:
+            for i in range(0, len(positions), self.batch_size):
+                yield positions[i:i + self.batch_size]
+                
+    async def _process_batch(
+        self,
+        batch: List[str],
+        validation_options: Optional[Dict] = None,
+        domain_checks: Optional[Dict[str, Dict]] = None,
+        offline_checks: Optional[List[Dict[str, Dict]]] = None
+    ) -> Tuple[List[Dict], List[int]]:
+        """
+        Process a single batch of emails.
+        
+        Returns:
+            Tuple of (results in batch order, positions of the results that
+            went through full validation rather than being rejected by the
+            offline screener); both empty if the batch failed
+        """
         try:
+            if domain_checks is None:
+                domain_checks = {}
+            if offline_checks is None:
+                offline_checks = [{} for _ in batch]
+                
+            # Tier one: addresses rejected offline are final
+            if self.screener:
+                results, offline_checks = await self._timed(
+                    "screening_batch",
+                    self.screener.screen(batch, validation_options, offline_checks)
+                )
+            else:
+                results = [None] * len(batch)
+            pending = [k for k, result in enumerate(results) if result is None]
+            
+            # Syntax of the whole batch in one pass, so addresses that fail it
+            # never reach domain checks; validate() reuses the result
+            unchecked = [k for k in pending if "syntax" not in offline_checks[k]]
+            if unchecked:
+                syntax = self.validator.syntax_validator.validate_many([batch[k] for k in unchecked])
+                for i, k in enumerate(unchecked):
+                    offline_checks[k] = {**offline_checks[k], "syntax": syntax.result(i)}
+                    
+            await self._run_domain_checks(
+                [
+                    batch[k] for k in pending
+                    if offline_checks[k]["syntax"]["is_valid"]
+                ],
+                validation_options,
+                domain_checks
+            )
+            
             tasks = [
-                self.validator.validate(email)
-                for email in batch
+                self._timed("validation", self.validator.validate(
+                    batch[k],
+                    validation_options,
+                    precomputed_checks={
+                        **domain_checks.get(DomainScheduler.domain_of(batch[k]), {}),
+                        **offline_checks[k]
+                    }
+                ))
+                for k in pending
             ]
-            return await asyncio.gather(*tasks)
+            for k, result in zip(pending, await asyncio.gather(*tasks)):
+                results[k] = result
+            return results, pending
             
         except Exception as e:
             self.logger.error(f"Error processing batch: {str(e)}")
-            return []
+            return [], []
+            
+    async def _run_domain_checks(
+        self,
+        batch: List[str],
+        validation_options: Optional[Dict],
+        domain_checks: Dict[str, Dict]
+    ):
+        """Run domain-scoped checks once for each domain not seen yet."""
+        new_domains = {}
+        hits = 0
+        for email in batch:
+            domain = DomainScheduler.domain_of(email)
+            if domain in domain_checks or domain in new_domains:
+                hits += 1
+            elif domain:
+                new_domains[domain] = email
+                
+        if self.tracker:
+            self.tracker.record_cache("domain_checks", hits=hits, misses=len(new_domains))
+        if not new_domains:
+            return
+            
+        checks = await asyncio.gather(*[
+            self._timed(
+                "domain_lookup",
+                self.validator.validate_domain(domain, validation_options, email)
+            )
+            for domain, email in new_domains.items()
+        ])
+        domain_checks.update(zip(new_domains, checks))
+            
+    def _iter_windows(
+        self,
+        emails: List[str],
+        positions: List[int]
+    ) -> Iterator[List[List[int]]]:
+        """
+        Group batches into windows for the offline checks.
+        
+        Windows hold about cpu_workers * cpu_chunk_size positions, enough to
+        keep every worker busy; without a pool each batch is its own window.
+        """
+        size = self.cpu_workers * self.cpu_chunk_size if self.cpu_workers > 0 else 0
+        window: List[List[int]] = []
+        count = 0
+        for batch in self._iter_batches(emails, positions):
+            window.append(batch)
+            count += len(batch)
+            if count >= size:
+                yield window
+                window, count = [], 0
+        if window:
+            yield window
             
+    def _start_offline_checks(
+        self,
+        emails: List[str],
+        window: Optional[List[List[int]]],
+        validation_options: Optional[Dict]
+    ) -> Optional[asyncio.Task]:
+        """Start the offline checks of a window in the background, if a pool is configured."""
+        if window is None or self.cpu_workers <= 0:
+            return None
+        positions = [position for batch in window for position in batch]
+        return asyncio.ensure_future(self._run_offline_checks(emails, positions, validation_options))
+        
+    async def _run_offline_checks(
+        self,
+        emails: List[str],
+        positions: List[int],
+        validation_options: Optional[Dict]
+    ) -> Dict[int, Dict[str, Dict]]:
+        """Run the CPU-bound checks for the given positions in the process pool."""
+        try:
+            check_names = enabled_offline_checks(
+                validation_options or DEFAULT_VALIDATION_OPTIONS
+            )
+            chunks = self._build_offline_chunks(emails, positions)
+            
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.cpu_workers)
+                
+            loop = asyncio.get_running_loop()
+            chunk_rows = await asyncio.gather(*[
+                self._timed("offline_chunk", loop.run_in_executor(
+                    self.executor,
+                    run_offline_checks,
+                    [emails[i] for i in chunk],
+                    check_names
+                ))
+                for chunk in chunks
+            ])
+            
+            offline_checks = {}
+            for chunk, rows in zip(chunks, chunk_rows):
+                offline_checks.update(zip(chunk, expand_offline_results(rows, check_names)))
+            return offline_checks
+            
+        except Exception as e:
+            self.logger.error(f"Error running offline checks: {str(e)}")
+            return {}
+            
+    def _build_offline_chunks(self, emails: List[str], positions: List[int]) -> List[List[int]]:
+        """
+        Pack whole domain groups into chunks of about cpu_chunk_size positions.
+        
+        Keeping a domain inside one chunk means each domain's typo verdict is
+        computed and cached by one worker only.
+        """
+        groups: Dict[str, List[int]] = {}
+        for position in positions:
+            domain = DomainScheduler.domain_of(emails[position])
+            groups.setdefault(domain, []).append(position)
+            
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        for group in groups.values():
+            if current and len(current) + len(group) > self.cpu_chunk_size:
+                chunks.append(current)
+                current = []
+            current.extend(group)
+        if current:
+            chunks.append(current)
+        return chunks
+        
     def _load_emails(self, file_path: str) -> List[str]:
         """Load emails from file."""
         try:
             path = Path(file_path)
-            if path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
-                # Assume first column contains emails
-                return df.iloc[:, 0].tolist()
+            if path.suffix.lower() in FileHandler.TABULAR_FORMATS:
+                # Only the email column is read, chunk by chunk
+                return [
+                    email
+                    for chunk in FileHandler().iter_chunks(file_path)
+                    for email in chunk
+                ]
             else:
                 with open(file_path, 'r') as f:
                     return [line.strip() for line in f if line.strip()]
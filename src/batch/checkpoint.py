@@ -0,0 +1,124 @@
+import json
+import logging
+import os
+import hashlib
+from typing import Dict, List, Optional
+from pathlib import Path
+
+class BatchCheckpoint:
+    """Append-only checkpoint of completed batch results on local disk."""
+    
+    def __init__(self, path: str):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self._buffer: List[str] = []
+        
+    @staticmethod
+    def job_id(emails: List[str], validation_options: Optional[Dict] = None) -> str:
+        """
+        Fingerprint a job so a checkpoint is only resumed for the same input.
+        
+        Args:
+            emails: Job input
+            validation_options: Validation options used for the job
+            
+        Returns:
+            Hex digest identifying the job
+        """
+        digest = hashlib.sha1()
+        digest.update(json.dumps(validation_options, sort_keys=True).encode())
+        for email in emails:
+            digest.update(email.encode('utf-8', 'replace'))
+            digest.update(b'\n')
+        return digest.hexdigest()
+        
+    def start(self, job_id: str, total: int, resume: bool = False) -> Dict[int, Dict]:
+        """
+        Open the checkpoint for a job.
+        
+        Args:
+            job_id: Job fingerprint from job_id()
+            total: Number of addresses in the job
+            resume: Load completed results from an existing checkpoint
+            
+        Returns:
+            Dict mapping input position to its saved result
+        """
+        completed = self._load(job_id) if resume else {}
+        
+        if not completed:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w') as f:
+                f.write(json.dumps({"job_id": job_id, "total": total}) + "\n")
+        else:
+            self.logger.info(
+                f"Resuming job {job_id[:12]} with {len(completed)}/{total} completed"
+            )
+            
+        self._buffer = []
+        return completed
+        
+    def record(self, positions: List[int], results: List[Dict]):
+        """Buffer completed results; they are written on the next flush."""
+        for position, result in zip(positions, results):
+            self._buffer.append(
+                json.dumps({"i": position, "r": result}, default=str) + "\n"
+            )
+            
+    def flush(self):
+        """Append buffered results to the checkpoint file and sync it."""
+        if not self._buffer:
+            return
+            
+        try:
+            with open(self.path, 'a') as f:
+                f.writelines(self._buffer)
+                f.flush()
+                os.fsync(f.fileno())
+            self._buffer = []
+            
+        except Exception as e:
+            self.logger.error(f"Error writing checkpoint {self.path}: {str(e)}")
+            
+    def clear(self):
+        """Remove the checkpoint once the job has completed."""
+        self._buffer = []
+        try:
+            self.path.unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.error(f"Error removing checkpoint {self.path}: {str(e)}")
+            
+    def _load(self, job_id: str) -> Dict[int, Dict]:
+        """Read saved results, truncating a torn final line."""
+        completed: Dict[int, Dict] = {}
+        if not self.path.exists():
+            return completed
+            
+        try:
+            with open(self.path, 'rb+') as f:
+                header = json.loads(f.readline() or b"{}")
+                if header.get("job_id") != job_id:
+                    self.logger.warning(
+                        f"Checkpoint {self.path} belongs to another job, starting over"
+                    )
+                    return {}
+                    
+                good_offset = f.tell()
+                for line in iter(f.readline, b""):
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    completed[entry["i"]] = entry["r"]
+                    good_offset = f.tell()
+                    
+                # Drop a partially written line so later appends stay readable
+                f.truncate(good_offset)
+                
+        except Exception as e:
+            self.logger.error(f"Error reading checkpoint {self.path}: {str(e)}")
+            return {}
+            
+        return completed
\ No newline at end of file
@@ -0,0 +1,83 @@
+from typing import Dict, List, Optional, Tuple
+from ..validators.basic.syntax_validator import SyntaxValidator
+from ..validators.security.spam_detector import SpamDetector
+from ..validators.quality.typo_detector import TypoDetector
+
+# Validation option -> check name for the CPU-bound checks run in worker processes.
+# Duplicate checks need the validator's history and options, so they stay in
+# the parent process.
+OFFLINE_CHECKS: Tuple[Tuple[str, str], ...] = (
+    ("check_spam", "spam"),
+    ("check_typos", "typo"),
+)
+
+_validators: Optional[Dict] = None
+
+def _get_validators() -> Dict:
+    """Create the stateless validators once per worker process."""
+    global _validators
+    if _validators is None:
+        _validators = {
+            "syntax": SyntaxValidator(),
+            "spam": SpamDetector(),
+            "typo": TypoDetector()
+        }
+    return _validators
+
+def run_offline_checks(emails: List[str], check_names: Tuple[str, ...]) -> List[Tuple]:
+    """
+    Run the CPU-bound checks for one chunk of addresses.
+    
+    Executed inside a worker process. The checks are stateless, so any
+    split of the addresses gives the same results.
+    
+    Args:
+        emails: Addresses of the chunk
+        check_names: Checks to run besides syntax, e.g. ("spam", "typo")
+        
+    Returns:
+        One tuple per address: the syntax result followed by one result per
+        check name, or just the syntax result when the syntax is invalid
+    """
+    validators = _get_validators()
+    results = []
+    
+    for email in emails:
+        syntax_result = validators["syntax"].validate(email)
+        if not syntax_result["is_valid"]:
+            results.append((syntax_result,))
+            continue
+            
+        row = [syntax_result]
+        for name in check_names:
+            if name == "spam":
+                row.append(validators["spam"].analyze(email))
+            elif name == "typo":
+                row.append(validators["typo"].check(email))
+        results.append(tuple(row))
+        
+    return results
+
+def expand_offline_results(
+    rows: List[Tuple],
+    check_names: Tuple[str, ...]
+) -> List[Dict[str, Dict]]:
+    """
+    Turn compact worker rows back into precomputed_checks dicts.
+    
+    Args:
+        rows: Rows returned by run_offline_checks
+        check_names: Check names passed to run_offline_checks
+        
+    Returns:
+        One dict per address mapping check name to result
+    """
+    names = ("syntax",) + tuple(check_names)
+    return [dict(zip(names, row)) for row in rows]
+
+def enabled_offline_checks(validation_options: Dict) -> Tuple[str, ...]:
+    """Return the offline check names enabled by the validation options."""
+    return tuple(
+        name for option, name in OFFLINE_CHECKS
+        if validation_options.get(option)
+    )
\ No newline at end of file
@@ -0,0 +1,82 @@
+import logging
+from typing import Dict, Iterator, List, Optional
+from collections import deque
+
+class DomainScheduler:
+    """Schedules batch work so addresses of the same domain run together."""
+    
+    def __init__(
+        self,
+        batch_size: int = 100,
+        per_host_limit: int = 10,
+        mx_providers: Optional[Dict[str, str]] = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.batch_size = max(1, batch_size)
+        self.per_host_limit = max(1, per_host_limit)
+        self.mx_providers = mx_providers or {}
+        
+    @staticmethod
+    def domain_of(email: str) -> str:
+        """Return the lowercased domain of an address, or '' if it has none."""
+        if '@' not in email:
+            return ''
+        return email.rsplit('@', 1)[1].strip().lower()
+        
+    def group_key(self, email: str) -> str:
+        """Return the MX provider for an address when known, else its domain."""
+        domain = self.domain_of(email)
+        return self.mx_providers.get(domain, domain)
+        
+    def group(self, emails: List[str]) -> Dict[str, List[int]]:
+        """
+        Group input positions by MX provider or domain.
+        
+        Args:
+            emails: List of email addresses
+            
+        Returns:
+            Dict mapping group key to input positions, in order of first appearance
+        """
+        groups: Dict[str, List[int]] = {}
+        for position, email in enumerate(emails):
+            groups.setdefault(self.group_key(email), []).append(position)
+        return groups
+        
+    def schedule(self, emails: List[str]) -> Iterator[List[int]]:
+        """
+        Yield batches of input positions grouped by domain.
+        
+        A batch takes at most per_host_limit positions from any one group and
+        fills the rest from other groups, so concurrent lookups against a
+        single host stay bounded. A new group is only opened when the open
+        ones cannot fill the batch, so each domain's addresses land in
+        consecutive batches while its cached data and SMTP sessions are warm.
+        
+        Args:
+            emails: List of email addresses
+            
+        Yields:
+            Lists of input positions, each at most batch_size long
+        """
+        pending = deque(self.group(emails).values())
+        active = deque()
+        
+        while pending or active:
+            batch: List[int] = []
+            carried = deque()
+            
+            while len(batch) < self.batch_size:
+                if not active:
+                    if not pending:
+                        break
+                    active.append(deque(pending.popleft()))
+                    
+                group = active.popleft()
+                take = min(self.per_host_limit, len(group), self.batch_size - len(batch))
+                batch.extend(group.popleft() for _ in range(take))
+                if group:
+                    carried.append(group)
+                    
+            active.extend(carried)
+            yield batch
\ No newline at end of file
@@ -0,0 +1,108 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .domain_scheduler import DomainScheduler
+from ..validators.email_validator import DEFAULT_VALIDATION_OPTIONS
+
+# Checks that need a network round-trip and are deferred to the second tier
+NETWORK_OPTIONS = ("check_domain", "check_disposable", "check_smtp", "check_reputation")
+
+class OfflineScreener:
+    """First tier of batch validation: cheap offline checks over a whole chunk."""
+    
+    def __init__(self, validator):
+        self.logger = logging.getLogger(__name__)
+        self.validator = validator
+        self.screened = 0
+        self.rejected = 0
+        
+    async def screen(
+        self,
+        emails: List[str],
+        validation_options: Optional[Dict] = None,
+        precomputed: Optional[List[Dict[str, Dict]]] = None
+    ) -> Tuple[List[Optional[Dict]], List[Dict[str, Dict]]]:
+        """
+        Run syntax, spam/role, duplicate, typo and local disposable checks.
+        
+        Network checks only ever lower the score, so an address whose
+        offline-only result is already invalid cannot become valid and is
+        finalised here without a network round-trip.
+        
+        Syntax is checked for the whole chunk in one validate_many() pass;
+        typo and local disposable verdicts are computed over the
+        syntactically valid addresses with one lookup per unique domain.
+        Spam and duplicate checks, which keep per-address state, and the
+        scoring still run per address in validator.validate(), which
+        reuses the verdicts computed here.
+        
+        Args:
+            emails: Addresses of the chunk
+            validation_options: Optional validation configuration
+            precomputed: Optional per-address checks already computed
+                (e.g. by the CPU worker pool)
+                
+        Returns:
+            Tuple of (final result for rejected addresses or None for
+            survivors, per-address offline checks to reuse in the second tier)
+        """
+        options = validation_options or DEFAULT_VALIDATION_OPTIONS
+        precomputed = precomputed or [{} for _ in emails]
+        screening_options = {
+            key: value for key, value in options.items()
+            if key not in NETWORK_OPTIONS
+        }
+        
+        offline_checks = [dict(checks) for checks in precomputed]
+        syntax = self.validator.syntax_validator.validate_many(emails)
+        for position, checks in enumerate(offline_checks):
+            if "syntax" not in checks:
+                checks["syntax"] = syntax.result(position)
+        valid = np.flatnonzero([checks["syntax"]["is_valid"] for checks in offline_checks])
+        valid_emails = [emails[i] for i in valid]
+        
+        if options.get("check_typos"):
+            missing = [i for i in valid if "typo" not in offline_checks[i]]
+            typos = self.validator.typo_detector.check_many([emails[i] for i in missing])
+            for position, typo in zip(missing, typos):
+                offline_checks[position]["typo"] = typo
+                
+        listed = np.zeros(len(emails), dtype=bool)
+        listed[valid] = self._disposable_mask(valid_emails, options)
+        for position in np.flatnonzero(listed):
+            offline_checks[position]["disposable"] = self.validator.disposable_detector.check_local(
+                DomainScheduler.domain_of(emails[position])
+            )
+        
+        final: List[Optional[Dict]] = []
+        for email, checks, is_listed in zip(emails, offline_checks, listed):
+            email_options = screening_options
+            if is_listed:
+                email_options = {**screening_options, "check_disposable": True}
+                
+            result = await self.validator.validate(
+                email, email_options, precomputed_checks=checks
+            )
+            checks.update(result.get("checks", {}))
+            final.append(None if result.get("is_valid") else result)
+            
+        self.screened += len(emails)
+        self.rejected += sum(result is not None for result in final)
+        return final, offline_checks
+        
+    def _disposable_mask(self, emails: List[str], options: Dict) -> np.ndarray:
+        """Flag addresses on the local disposable list, one lookup per unique domain."""
+        if not options.get("check_disposable") or not emails:
+            return np.zeros(len(emails), dtype=bool)
+            
+        listed_domains = self.validator.disposable_detector.disposable_domains
+        codes, uniques = pd.factorize(
+            np.array([DomainScheduler.domain_of(email) for email in emails], dtype=object)
+        )
+        unique_listed = np.fromiter(
+            (domain in listed_domains for domain in uniques),
+            dtype=bool,
+            count=len(uniques)
+        )
+        return unique_listed[codes]
\ No newline at end of file
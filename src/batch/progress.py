@@ -0,0 +1,104 @@
+import time
+import logging
+from typing import Any, Deque, Dict, Optional
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, asdict
+import numpy as np
+
+@dataclass
+class ProgressEvent:
+    """Snapshot of a running batch job."""
+    processed: int
+    total: int
+    elapsed_seconds: float
+    addresses_per_second: float
+    eta_seconds: Optional[float]
+    in_flight: int
+    failed_batches: int
+    stage_latency: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    cache_hit_rates: Dict[str, float] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to a JSON-serializable dict."""
+        return asdict(self)
+
+class ProgressTracker:
+    """Collects batch job metrics and emits throttled progress events."""
+    
+    def __init__(self, total: int, min_interval: float = 1.0, sample_size: int = 1000):
+        self.logger = logging.getLogger(__name__)
+        self.total = total
+        self.min_interval = min_interval
+        self.processed = 0
+        self.in_flight = 0
+        self.failed_batches = 0
+        self._start = time.monotonic()
+        self._last_emit: Optional[float] = None
+        self._latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=sample_size)
+        )
+        self._cache_counts: Dict[str, list] = defaultdict(lambda: [0, 0])
+        
+    def record_latency(self, stage: str, seconds: float):
+        """Record one latency sample for a stage."""
+        self._latencies[stage].append(seconds)
+        
+    def record_cache(self, name: str, hits: int = 0, misses: int = 0):
+        """Add hit/miss counts for a cache."""
+        counts = self._cache_counts[name]
+        counts[0] += hits
+        counts[1] += misses
+        
+    def advance(self, count: int):
+        """Mark addresses as processed."""
+        self.processed += count
+        
+    def snapshot(self) -> ProgressEvent:
+        """Build a progress event from the current metrics."""
+        elapsed = time.monotonic() - self._start
+        rate = self.processed / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.processed
+        eta = remaining / rate if rate > 0 else None
+        
+        stage_latency = {}
+        for stage, samples in self._latencies.items():
+            if samples:
+                p50, p95, p99 = np.percentile(np.fromiter(samples, dtype=float), [50, 95, 99])
+                stage_latency[stage] = {
+                    "p50": float(p50),
+                    "p95": float(p95),
+                    "p99": float(p99),
+                    "samples": len(samples)
+                }
+                
+        return ProgressEvent(
+            processed=self.processed,
+            total=self.total,
+            elapsed_seconds=elapsed,
+            addresses_per_second=rate,
+            eta_seconds=eta,
+            in_flight=self.in_flight,
+            failed_batches=self.failed_batches,
+            stage_latency=stage_latency,
+            cache_hit_rates={
+                name: hits / (hits + misses)
+                for name, (hits, misses) in self._cache_counts.items()
+                if hits + misses
+            }
+        )
+        
+    def poll(self, force: bool = False) -> Optional[ProgressEvent]:
+        """
+        Return an event if min_interval has passed since the last one.
+        
+        Args:
+            force: Emit regardless of the interval (e.g. for the final event)
+            
+        Returns:
+            Progress event, or None when throttled
+        """
+        now = time.monotonic()
+        if not force and self._last_emit is not None and now - self._last_emit < self.min_interval:
+            return None
+        self._last_emit = now
+        return self.snapshot()
\ No newline at end of file
@@ -0,0 +1,213 @@
+import json
+import sys
+import heapq
+import zlib
+import logging
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional
+from pathlib import Path
+from tld import get_fld
+from .domain_scheduler import DomainScheduler
+from ..utils.file_handler import FileHandler
+
+class ShardLauncher(ABC):
+    """Starts shard worker commands; subclass to run them elsewhere."""
+    
+    @abstractmethod
+    async def launch(self, command: List[str], shard: int) -> int:
+        """
+        Run a worker command to completion.
+        
+        Args:
+            command: Worker command line
+            shard: Shard number the command processes
+            
+        Returns:
+            Worker exit code
+        """
+
+class LocalLauncher(ShardLauncher):
+    """Runs shard workers as local subprocesses."""
+    
+    def __init__(self, cwd: Optional[str] = None):
+        self.cwd = cwd
+        
+    async def launch(self, command: List[str], shard: int) -> int:
+        process = await asyncio.create_subprocess_exec(*command, cwd=self.cwd)
+        return await process.wait()
+
+class SSHLauncher(ShardLauncher):
+    """
+    Runs shard workers on remote hosts over ssh, assigning shards round-robin.
+    
+    Shard input and output paths must resolve to the same files on every
+    host (e.g. a shared NFS work directory).
+    """
+    
+    def __init__(
+        self,
+        hosts: List[str],
+        remote_cwd: str,
+        ssh_command: Optional[List[str]] = None,
+        python: str = "python3"
+    ):
+        if not hosts:
+            raise ValueError("SSHLauncher needs at least one host")
+        self.hosts = hosts
+        self.remote_cwd = remote_cwd
+        self.ssh_command = ssh_command or ["ssh", "-o", "BatchMode=yes"]
+        self.python = python
+        
+    async def launch(self, command: List[str], shard: int) -> int:
+        host = self.hosts[shard % len(self.hosts)]
+        remote = [self.python] + command[1:]
+        script = f"cd {_quote(self.remote_cwd)} && " + " ".join(_quote(arg) for arg in remote)
+        process = await asyncio.create_subprocess_exec(*self.ssh_command, host, script)
+        return await process.wait()
+
+def _quote(arg: str) -> str:
+    """Quote an argument for a POSIX remote shell."""
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+class ShardCoordinator:
+    """Splits a batch job into domain-hashed shards, runs them and merges the output."""
+    
+    def __init__(
+        self,
+        num_shards: int,
+        work_dir: str,
+        launcher: Optional[ShardLauncher] = None,
+        validation_options: Optional[Dict] = None,
+        batch_size: int = 100
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.num_shards = max(1, num_shards)
+        self.work_dir = Path(work_dir)
+        self.launcher = launcher or LocalLauncher()
+        self.validation_options = validation_options
+        self.batch_size = batch_size
+        
+    @staticmethod
+    def registrable_domain(email: str) -> str:
+        """Return the registrable domain of an address (e.g. example.co.uk)."""
+        domain = DomainScheduler.domain_of(email)
+        return get_fld(domain, fix_protocol=True, fail_silently=True) or domain
+        
+    def shard_for(self, email: str) -> int:
+        """Map an address to a shard by a stable hash of its registrable domain."""
+        return zlib.crc32(self.registrable_domain(email).encode('utf-8', 'replace')) % self.num_shards
+        
+    def partition(self, emails: Iterable[str]) -> List[Path]:
+        """
+        Write each address with its input position to its shard file.
+        
+        Args:
+            emails: Job input, streamed once
+            
+        Returns:
+            Paths of the shard input files
+        """
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        paths = [self.work_dir / f"shard_{k}.tsv" for k in range(self.num_shards)]
+        files = [open(path, 'w') for path in paths]
+        try:
+            for position, email in enumerate(emails):
+                files[self.shard_for(email)].write(f"{position}\t{email}\n")
+        finally:
+            for f in files:
+                f.close()
+        return paths
+        
+    def worker_command(self, shard_input: Path, shard_output: Path) -> List[str]:
+        """Build the command line that processes one shard."""
+        return [
+            sys.executable, "-m", "src.batch.shard_worker",
+            str(shard_input), str(shard_output),
+            "--options", json.dumps(self.validation_options),
+            "--batch-size", str(self.batch_size)
+        ]
+        
+    async def run_file(self, input_path: str, output_path: str) -> int:
+        """
+        Validate the addresses of an input file across shard workers.
+        
+        Args:
+            input_path: CSV or Excel file (email column) or text file with
+                one address per line
+            output_path: NDJSON file receiving the results in input order
+            
+        Returns:
+            Number of results written
+        """
+        return await self.run(self._iter_file(input_path), output_path)
+        
+    async def run(self, emails: Iterable[str], output_path: str) -> int:
+        """
+        Validate a job across shard workers and merge the results.
+        
+        Args:
+            emails: Job input, streamed once
+            output_path: NDJSON file receiving one result per input address,
+                in input order
+                
+        Returns:
+            Number of results written
+            
+        Raises:
+            RuntimeError: If any shard worker fails
+        """
+        inputs = self.partition(emails)
+        outputs = [path.with_suffix(".ndjson") for path in inputs]
+        
+        exit_codes = await asyncio.gather(*[
+            self.launcher.launch(self.worker_command(shard_input, shard_output), shard)
+            for shard, (shard_input, shard_output) in enumerate(zip(inputs, outputs))
+        ])
+        failed = [shard for shard, code in enumerate(exit_codes) if code != 0]
+        if failed:
+            raise RuntimeError(f"Shard workers failed: {failed}")
+            
+        return self.merge(outputs, output_path)
+        
+    def merge(self, shard_outputs: List[Path], output_path: str) -> int:
+        """
+        Merge position-sorted shard outputs back into input order.
+        
+        Args:
+            shard_outputs: NDJSON shard outputs with {"i": position, "r": result} lines
+            output_path: NDJSON file receiving the results in input order
+            
+        Returns:
+            Number of results written
+        """
+        files = [open(path, 'r') for path in shard_outputs]
+        written = 0
+        try:
+            with open(output_path, 'w') as out:
+                for _, line in heapq.merge(*[self._read_entries(f) for f in files]):
+                    out.write(line)
+                    written += 1
+        finally:
+            for f in files:
+                f.close()
+        return written
+        
+    @staticmethod
+    def _iter_file(input_path: str) -> Iterator[str]:
+        """Stream addresses from an input file without loading it whole."""
+        if Path(input_path).suffix.lower() in FileHandler.TABULAR_FORMATS:
+            for chunk in FileHandler().iter_chunks(input_path):
+                yield from chunk
+        else:
+            with open(input_path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        yield line.strip()
+                        
+    @staticmethod
+    def _read_entries(f) -> Iterator:
+        """Yield (position, result line) pairs from a shard output."""
+        for line in f:
+            entry = json.loads(line)
+            yield entry["i"], json.dumps(entry["r"]) + "\n"
\ No newline at end of file
@@ -0,0 +1,76 @@
+import sys
+import json
+import asyncio
+import logging
+import argparse
+from typing import List, Optional
+from .batch_processor import BatchProcessor
+from ..validators.email_validator import EmailValidator
+
+async def process_shard(
+    shard_input: str,
+    shard_output: str,
+    validation_options: Optional[dict] = None,
+    batch_size: int = 100
+) -> int:
+    """
+    Validate one shard written by ShardCoordinator.partition.
+    
+    The worker checkpoints next to its output, so relaunching a failed
+    shard resumes where it stopped.
+    
+    Args:
+        shard_input: TSV file of "position<TAB>email" lines
+        shard_output: NDJSON file receiving {"i": position, "r": result} lines
+        validation_options: Optional validation configuration
+        batch_size: Batch size for the shard's BatchProcessor
+        
+    Returns:
+        Number of results written
+    """
+    positions: List[int] = []
+    emails: List[str] = []
+    with open(shard_input, 'r') as f:
+        for line in f:
+            position, email = line.rstrip('\n').split('\t', 1)
+            positions.append(int(position))
+            emails.append(email)
+            
+    processor = BatchProcessor(
+        EmailValidator(cache_enabled=False),
+        batch_size=batch_size,
+        checkpoint_path=f"{shard_output}.ckpt"
+    )
+    results = await processor.process_emails(emails, validation_options, resume=True)
+    if len(results) != len(emails) or processor.failed_positions:
+        raise RuntimeError(f"Shard {shard_input} finished with missing results")
+        
+    with open(shard_output, 'w') as f:
+        for position, result in zip(positions, results):
+            f.write(json.dumps({"i": position, "r": result}, default=str) + "\n")
+    return len(results)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point for a shard worker process."""
+    parser = argparse.ArgumentParser(description="Validate one batch shard")
+    parser.add_argument("shard_input")
+    parser.add_argument("shard_output")
+    parser.add_argument("--options", default="null", help="Validation options as JSON")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(process_shard(
+            args.shard_input,
+            args.shard_output,
+            json.loads(args.options),
+            args.batch_size
+        ))
+        return 0
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Shard worker failed: {str(e)}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
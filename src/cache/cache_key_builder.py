@@ -1,5 +1,14 @@
 import hashlib
+from functools import lru_cache
 from typing import Dict, Optional, Any
+from ..utils.domain_table import idna_form
+
+DOMAIN_KEY_CACHE_SIZE = 10000
+
+@lru_cache(maxsize=DOMAIN_KEY_CACHE_SIZE)
+def _domain_key_part(domain: str) -> str:
+    """Return the lowercased IDNA form of a domain, memoized for recent domains."""
+    return idna_form(domain.strip().lower())
 
 class CacheKeyBuilder:
     """Builds consistent cache keys for different types of cached data"""
@@ -30,6 +39,24 @@ class CacheKeyBuilder:
             
         return ":".join(key_parts)
         
+    @staticmethod
+    def domain_key_part(domain: str) -> str:
+        """
+        Return the form of a domain used in cache keys.
+        
+        The lowercased IDNA form, so Unicode and punycode spellings of the
+        same domain share cache entries. Recent domains are memoized in a
+        bounded LRU; the domain table is not used here, as it would grow
+        with every domain ever requested.
+        
+        Args:
+            domain: Domain name
+            
+        Returns:
+            Normalized ASCII domain
+        """
+        return _domain_key_part(domain)
+        
     @staticmethod
     def build_domain_key(domain: str) -> str:
         """
@@ -41,4 +68,30 @@ class CacheKeyBuilder:
         Returns:
             Cache key string
         """
-        return f"domain:{domain.lower()}"
\ No newline at end of file
+        return f"domain:{CacheKeyBuilder.domain_key_part(domain)}"
+        
+    @staticmethod
+    def build_mx_key(domain: str) -> str:
+        """
+        Build cache key for domain DNS/MX validation results.
+        
+        Args:
+            domain: Domain name
+            
+        Returns:
+            Cache key string
+        """
+        return f"mx:{CacheKeyBuilder.domain_key_part(domain)}"
+        
+    @staticmethod
+    def build_reputation_key(domain: str) -> str:
+        """
+        Build cache key for domain reputation results.
+        
+        Args:
+            domain: Domain name
+            
+        Returns:
+            Cache key string
+        """
+        return f"reputation:{CacheKeyBuilder.domain_key_part(domain)}"
\ No newline at end of file
@@ -0,0 +1,66 @@
+import threading
+from typing import Any, Hashable, Optional
+from collections import OrderedDict
+from .cache_metrics import CacheMetrics
+
+class LRUCache:
+    """
+    Bounded in-memory cache that evicts the least recently used entry.
+    
+    Meant for small, hot, process-local results such as per-domain
+    verdicts; hits, misses and evictions are counted in metrics. Safe to
+    share between threads.
+    """
+    
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max(1, max_size)
+        self.metrics = CacheMetrics()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+        
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a value and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if missing
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.metrics.record_miss()
+                return None
+            self._entries.move_to_end(key)
+            self.metrics.record_hit()
+            return value
+            
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the least recently used entry when full.
+        
+        Args:
+            key: Cache key
+            value: Value to cache (None is not cacheable)
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.metrics.record_eviction()
+            self.metrics.update_total_entries(len(self._entries))
+            
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.metrics.update_total_entries(0)
\ No newline at end of file
@@ -0,0 +1,221 @@
+import os
+import time
+import logging
+import hashlib
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+import numpy as np
+from .cache_metrics import CacheMetrics
+
+# One index entry: canonical address hash, last verdict and when it was checked
+RECORD_DTYPE = np.dtype([
+    ("key", "<u8"),
+    ("is_valid", "?"),
+    ("score", "<i2"),
+    ("checked_at", "<u4"),
+])
+
+class ValidationIndex:
+    """
+    On-disk index of previously validated addresses.
+    
+    Entries are kept sorted by a 64-bit hash of the canonical address in a
+    .npy file that is memory-mapped for reading, so lookups are a
+    vectorized binary search and only the touched pages are loaded. New
+    verdicts collect in memory and are merged into a new sorted file on
+    flush(), which replaces the old one atomically.
+    
+    Keys cover the set of checks that produced a verdict as well as the
+    address, so a verdict recorded with reduced validation options (e.g.
+    offline checks only) is never served to a lookup with other options.
+    Pass the options actually used, with defaults already applied.
+    """
+    
+    def __init__(self, path: str):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.metrics = CacheMetrics()
+        self._pending: Dict[int, Tuple[bool, int, int]] = {}
+        self._records = self._open()
+        self.metrics.update_total_entries(len(self._records))
+        
+    @staticmethod
+    def canonical(email: str) -> str:
+        """Return the form addresses are indexed under."""
+        return email.strip().lower()
+        
+    @staticmethod
+    def options_fingerprint(options: Optional[Dict] = None) -> bytes:
+        """Return the part of a key that identifies the enabled checks."""
+        enabled = sorted(name for name, value in (options or {}).items() if value)
+        return ",".join(enabled).encode() + b"\n"
+        
+    @classmethod
+    def key_of(cls, email: str, options: Optional[Dict] = None) -> int:
+        """Return the 64-bit index key of an address validated with options."""
+        digest = hashlib.blake2b(cls.options_fingerprint(options), digest_size=8)
+        digest.update(cls.canonical(email).encode('utf-8', 'replace'))
+        return int.from_bytes(digest.digest(), 'little')
+        
+    @classmethod
+    def keys_of(cls, emails: List[str], options: Optional[Dict] = None) -> np.ndarray:
+        """Return the index keys of many addresses as a uint64 array."""
+        prefix = hashlib.blake2b(cls.options_fingerprint(options), digest_size=8)
+        keys = np.empty(len(emails), dtype=np.uint64)
+        for i, email in enumerate(emails):
+            digest = prefix.copy()
+            digest.update(cls.canonical(email).encode('utf-8', 'replace'))
+            keys[i] = int.from_bytes(digest.digest(), 'little')
+        return keys
+        
+    def __len__(self) -> int:
+        return len(self._records) + len(self._pending)
+        
+    def lookup(
+        self,
+        emails: List[str],
+        max_age_seconds: Optional[float] = None,
+        options: Optional[Dict] = None
+    ) -> np.ndarray:
+        """
+        Look up the last verdicts of addresses.
+        
+        Args:
+            emails: Addresses to look up
+            max_age_seconds: Treat verdicts older than this as missing
+            options: Validation options the verdicts must have been made with
+            
+        Returns:
+            RECORD_DTYPE array aligned with emails; entries not found (or
+            too old) have key 0
+        """
+        keys = self.keys_of(emails, options)
+        found = np.zeros(len(keys), dtype=RECORD_DTYPE)
+        
+        if len(self._records):
+            stored_keys = self._records["key"]
+            slots = np.searchsorted(stored_keys, keys)
+            slots[slots == len(stored_keys)] = 0
+            hits = stored_keys[slots] == keys
+            found[hits] = self._records[slots[hits]]
+            
+        if self._pending:
+            for i, key in enumerate(keys.tolist()):
+                entry = self._pending.get(key)
+                if entry:
+                    found[i] = (key,) + entry
+                    
+        if max_age_seconds is not None:
+            cutoff = time.time() - max_age_seconds
+            found["key"][found["checked_at"] < cutoff] = 0
+            
+        hit_count = int(np.count_nonzero(found["key"]))
+        self.metrics.hits += hit_count
+        self.metrics.misses += len(keys) - hit_count
+        return found
+        
+    def fresh_results(
+        self,
+        emails: List[str],
+        max_age_seconds: float,
+        options: Optional[Dict] = None
+    ) -> Dict[int, Dict]:
+        """
+        Build results for addresses validated within the freshness window.
+        
+        Args:
+            emails: Addresses to look up
+            max_age_seconds: Freshness window
+            options: Validation options of the current job
+            
+        Returns:
+            Dict mapping position in emails to a result rebuilt from the
+            stored verdict
+        """
+        found = self.lookup(emails, max_age_seconds, options)
+        results = {}
+        for i in np.flatnonzero(found["key"]):
+            entry = found[i]
+            results[int(i)] = {
+                "email": emails[i],
+                "is_valid": bool(entry["is_valid"]),
+                "score": int(entry["score"]),
+                "issues": [],
+                "checks": {},
+                "suggestions": [],
+                "from_index": True,
+                "checked_at": int(entry["checked_at"])
+            }
+        return results
+        
+    def record(
+        self,
+        results: List[Dict],
+        checked_at: Optional[float] = None,
+        options: Optional[Dict] = None
+    ):
+        """
+        Buffer the verdicts of completed validations.
+        
+        Results without checks (validation errors) and results that came
+        from the index are skipped. Call flush() to persist them.
+        
+        Args:
+            results: Validation results
+            checked_at: Verdict time (now when None)
+            options: Validation options the results were produced with
+        """
+        timestamp = int(checked_at if checked_at is not None else time.time())
+        for result in results:
+            if not result or not result.get("checks") or result.get("from_index"):
+                continue
+            self._pending[self.key_of(result["email"], options)] = (
+                bool(result.get("is_valid")),
+                int(result.get("score", 0)),
+                timestamp
+            )
+            
+    def flush(self):
+        """Merge buffered verdicts into the index file."""
+        if not self._pending:
+            return
+            
+        try:
+            pending = np.array(
+                [(key,) + entry for key, entry in self._pending.items()],
+                dtype=RECORD_DTYPE
+            )
+            # New verdicts first so the stable sort keeps them ahead of older ones
+            merged = np.concatenate([pending, np.asarray(self._records)])
+            merged = merged[np.argsort(merged["key"], kind="stable")]
+            keep = np.ones(len(merged), dtype=bool)
+            keep[1:] = merged["key"][1:] != merged["key"][:-1]
+            merged = merged[keep]
+            
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, 'wb') as f:
+                np.save(f, merged)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            
+            self._pending = {}
+            self._records = self._open()
+            self.metrics.update_total_entries(len(self._records))
+            
+        except Exception as e:
+            self.logger.error(f"Error writing validation index {self.path}: {str(e)}")
+            
+    def _open(self) -> np.ndarray:
+        """Memory-map the index file, or return an empty index."""
+        if not self.path.exists():
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        try:
+            records = np.load(self.path, mmap_mode='r')
+            if records.dtype != RECORD_DTYPE:
+                raise ValueError(f"unexpected record layout {records.dtype}")
+            return records
+        except Exception as e:
+            self.logger.error(f"Error opening validation index {self.path}: {str(e)}")
+            return np.zeros(0, dtype=RECORD_DTYPE)
\ No newline at end of file
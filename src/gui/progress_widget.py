@@ -48,6 +48,26 @@ class ProgressWidget(QWidget):
         
         layout.addLayout(stats_layout)
         
+        # Throughput layout
+        throughput_layout = QHBoxLayout()
+        
+        self.rate_label = QLabel("Rate: -")
+        throughput_layout.addWidget(self.rate_label)
+        
+        self.eta_label = QLabel("ETA: -")
+        throughput_layout.addWidget(self.eta_label)
+        
+        self.in_flight_label = QLabel("In flight: 0")
+        throughput_layout.addWidget(self.in_flight_label)
+        
+        self.failed_label = QLabel("Failed batches: 0")
+        throughput_layout.addWidget(self.failed_label)
+        
+        self.slowest_stage_label = QLabel("Slowest stage: -")
+        throughput_layout.addWidget(self.slowest_stage_label)
+        
+        layout.addLayout(throughput_layout)
+        
     def update_progress(self, current: int, total: int):
         """Update progress display."""
         try:
@@ -59,12 +79,34 @@ class ProgressWidget(QWidget):
             self.logger.error(f"Error updating progress: {str(e)}")
             
     def update_stats(self, stats: dict):
-        """Update validation statistics."""
+        """
+        Update validation statistics.
+        
+        Accepts the summary counts and, optionally, the fields of a batch
+        ProgressEvent dict (throughput, ETA, in-flight and failed batch counts and
+        per-stage latency percentiles).
+        """
         try:
             self.valid_label.setText(f"Valid: {stats.get('valid_count', 0)}")
             self.invalid_label.setText(f"Invalid: {stats.get('invalid_count', 0)}")
             self.avg_score_label.setText(f"Avg Score: {stats.get('avg_score', 0):.1f}")
             
+            if 'addresses_per_second' in stats:
+                self.rate_label.setText(f"Rate: {stats['addresses_per_second']:.1f}/s")
+                eta = stats.get('eta_seconds')
+                self.eta_label.setText(
+                    f"ETA: {int(eta) // 60}m {int(eta) % 60}s" if eta is not None else "ETA: -"
+                )
+                self.in_flight_label.setText(f"In flight: {stats.get('in_flight', 0)}")
+                self.failed_label.setText(f"Failed batches: {stats.get('failed_batches', 0)}")
+                
+                stage_latency = stats.get('stage_latency') or {}
+                if stage_latency:
+                    stage, latency = max(stage_latency.items(), key=lambda item: item[1]['p95'])
+                    self.slowest_stage_label.setText(
+                        f"Slowest stage: {stage} (p95 {latency['p95'] * 1000:.0f} ms)"
+                    )
+            
         except Exception as e:
             self.logger.error(f"Error updating stats: {str(e)}")
             
@@ -1,14 +1,45 @@
 import logging
-from typing import Dict, List, Set, Tuple
-from Levenshtein import distance
+from typing import Dict, List, Optional, Set
+from concurrent.futures import Executor, ProcessPoolExecutor
 from collections import defaultdict
+from ..utils.union_find import UnionFind
+from ..utils.domain_table import DomainTable, get_domain_table
+from .similarity_edges import MAX_DELETION_DISTANCE, exact_edge_finder, groups_from_clusters
+from .minhash_deduplicator import MinHashDeduplicator
 
 class BatchDeduplicator:
-    """Handles efficient deduplication of large email lists"""
+    """
+    Handles efficient deduplication of large email lists
     
-    def __init__(self, similarity_threshold: int = 2):
+    Similar emails are clustered per domain. Domains with at least
+    parallel_min_size addresses have their similarity search split across
+    `workers` processes (0 runs everything in-process).
+    
+    With approximate=True, groups come from MinHash/LSH instead (see
+    MinHashDeduplicator, configured by minhash_options), and when
+    recall_sample_size > 0 the recall against the exact path is measured
+    on a sample of the largest domain and reported in the stats.
+    """
+    
+    MAX_INDEX_DISTANCE = MAX_DELETION_DISTANCE
+    
+    def __init__(
+        self,
+        similarity_threshold: int = 2,
+        workers: int = 0,
+        parallel_min_size: int = 50000,
+        approximate: bool = False,
+        minhash_options: Optional[Dict] = None,
+        recall_sample_size: int = 0
+    ):
         self.logger = logging.getLogger(__name__)
         self.similarity_threshold = similarity_threshold
+        self.workers = workers
+        self.parallel_min_size = parallel_min_size
+        self.minhash = MinHashDeduplicator(
+            similarity_threshold, **(minhash_options or {})
+        ) if approximate else None
+        self.recall_sample_size = recall_sample_size
         
     def deduplicate(self, emails: List[str]) -> Dict[str, any]:
         """
@@ -25,38 +56,33 @@ class BatchDeduplicator:
                 - stats: Deduplication statistics
         """
         try:
-            results = {
-                "unique_emails": [],
-                "duplicates": defaultdict(list),
-                "similar_groups": defaultdict(list),
-                "stats": {
-                    "total": len(emails),
-                    "unique": 0,
-                    "exact_duplicates": 0,
-                    "similar": 0
-                }
-            }
-            
             # First pass: Exact duplicates
-            email_set: Set[str] = set()
-            for email in emails:
-                normalized = email.lower().strip()
-                if normalized in email_set:
-                    results["duplicates"][normalized].append(email)
-                    results["stats"]["exact_duplicates"] += 1
-                else:
-                    email_set.add(normalized)
-                    results["unique_emails"].append(email)
+            results = self.deduplicate_exact(emails)
                     
             # Second pass: Similar emails
-            domain_groups = self._group_by_domain(results["unique_emails"])
+            domain_groups = self.group_by_domain(results["unique_emails"])
+            if self.minhash and self.recall_sample_size and domain_groups:
+                largest = max(domain_groups.values(), key=len)
+                report = self.minhash.measure_recall(largest, self.recall_sample_size)
+                results["stats"]["approximate_recall"] = report["recall"]
+                
+            executor = None
+            if not self.minhash and self.workers > 1 and any(
+                len(domain_emails) >= self.parallel_min_size
+                for domain_emails in domain_groups.values()
+            ):
+                executor = ProcessPoolExecutor(max_workers=self.workers)
             
-            for domain, domain_emails in domain_groups.items():
-                similar_groups = self._find_similar_groups(domain_emails)
-                for primary, similar in similar_groups.items():
-                    if similar:
-                        results["similar_groups"][primary].extend(similar)
-                        results["stats"]["similar"] += len(similar)
+            try:
+                for domain, domain_emails in domain_groups.items():
+                    similar_groups = self.find_similar_groups(domain_emails, executor)
+                    for primary, similar in similar_groups.items():
+                        if similar:
+                            results["similar_groups"][primary].extend(similar)
+                            results["stats"]["similar"] += len(similar)
+            finally:
+                if executor:
+                    executor.shutdown()
                         
             # Update statistics
             results["stats"]["unique"] = len(results["unique_emails"])
@@ -78,38 +104,86 @@ class BatchDeduplicator:
                 }
             }
             
-    def _group_by_domain(self, emails: List[str]) -> Dict[str, List[str]]:
-        """Group emails by domain for efficient similarity checking."""
-        domain_groups = defaultdict(list)
-        for email in emails:
-            try:
-                _, domain = email.lower().split('@')
-                domain_groups[domain].append(email)
-            except ValueError:
-                continue
-        return domain_groups
+    def deduplicate_exact(self, emails: List[str]) -> Dict[str, any]:
+        """
+        Remove exact duplicates, keeping the first occurrence.
         
-    def _find_similar_groups(self, emails: List[str]) -> Dict[str, List[str]]:
-        """Find groups of similar emails within the same domain."""
-        similar_groups = {}
-        processed = set()
+        Args:
+            emails: List of email addresses
+            
+        Returns:
+            Dict in the format of deduplicate() with similar_groups left
+            empty and stats["unique"] not yet set
+        """
+        results = {
+            "unique_emails": [],
+            "duplicates": defaultdict(list),
+            "similar_groups": defaultdict(list),
+            "stats": {
+                "total": len(emails),
+                "unique": 0,
+                "exact_duplicates": 0,
+                "similar": 0
+            }
+        }
         
+        email_set: Set[str] = set()
         for email in emails:
-            if email in processed:
-                continue
-                
-            similar = []
-            local_part1 = email.split('@')[0].lower()
+            normalized = email.lower().strip()
+            if normalized in email_set:
+                results["duplicates"][normalized].append(email)
+                results["stats"]["exact_duplicates"] += 1
+            else:
+                email_set.add(normalized)
+                results["unique_emails"].append(email)
+        return results
             
-            for other in emails:
-                if other != email and other not in processed:
-                    local_part2 = other.split('@')[0].lower()
-                    if distance(local_part1, local_part2) <= self.similarity_threshold:
-                        similar.append(other)
-                        processed.add(other)
-                        
-            if similar:
-                similar_groups[email] = similar
-                processed.add(email)
-                
-        return similar_groups
\ No newline at end of file
+    def group_by_domain(self, emails: List[str]) -> Dict[str, List[str]]:
+        """Group emails by domain for efficient similarity checking."""
+        table = get_domain_table()
+        domain_ids = table.ids_of(emails)
+        # Addresses with more than one @ are not grouped
+        domain_ids[[email.count('@') != 1 for email in emails]] = DomainTable.NO_DOMAIN
+        return {
+            table.domain(domain_id): [emails[position] for position in positions]
+            for domain_id, positions in table.group_positions(domain_ids).items()
+            if domain_id != DomainTable.NO_DOMAIN
+        }
+        
+    def find_similar_groups(
+        self,
+        emails: List[str],
+        executor: Optional[Executor] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Find groups of similar emails within the same domain.
+        
+        Emails are linked when their local parts are within
+        similarity_threshold edits, and each group is a connected component
+        of those links, so the result does not depend on input order. The
+        shortest (then alphabetically first) email of a group is its
+        primary; the others follow in the same order.
+        
+        With an executor and at least parallel_min_size emails, the edge
+        search is split into one slice per worker and the slices' edges
+        are merged before clustering.
+        """
+        if self.minhash:
+            return self.minhash.find_similar_groups(emails)
+            
+        local_parts = [email.split('@')[0].lower() for email in emails]
+        find_edges = exact_edge_finder(self.similarity_threshold)
+        
+        clusters = UnionFind(len(emails))
+        if executor and len(emails) >= self.parallel_min_size:
+            parts = self.workers
+            futures = [
+                executor.submit(find_edges, local_parts, self.similarity_threshold, part, parts)
+                for part in range(parts)
+            ]
+            for future in futures:
+                clusters.union_all(future.result())
+        else:
+            clusters.union_all(find_edges(local_parts, self.similarity_threshold))
+            
+        return groups_from_clusters(emails, clusters)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import logging
 from typing import List, Set, Dict, Tuple
 from Levenshtein import distance
+from ..utils.qgram_filter import QGramFilter
 
 class Deduplicator:
     """Removes duplicate and similar email addresses"""
@@ -22,13 +23,15 @@ class Deduplicator:
         try:
             unique_emails: Set[str] = set()
             similar_groups: Dict[str, List[str]] = {}
+            # Domain -> (prefilter over local parts, unique emails in filter order)
+            domain_index: Dict[str, Tuple[QGramFilter, List[str]]] = {}
             
             for email in emails:
                 if email in unique_emails:
                     continue
                     
                 # Check for similar emails
-                similar = self._find_similar(email, unique_emails)
+                similar = self._find_similar(email, domain_index)
                 if similar:
                     primary = min(similar, key=len)  # Use shortest as primary
                     if primary not in similar_groups:
@@ -36,6 +39,13 @@ class Deduplicator:
                     similar_groups[primary].append(email)
                 else:
                     unique_emails.add(email)
+                    if email.count('@') == 1:
+                        local_part, domain = email.split('@')
+                        qgram_filter, domain_emails = domain_index.setdefault(
+                            domain, (QGramFilter(self.similarity_threshold), [])
+                        )
+                        qgram_filter.add(local_part)
+                        domain_emails.append(email)
                     
             return list(unique_emails), similar_groups
             
@@ -43,22 +53,28 @@ class Deduplicator:
             self.logger.error(f"Error deduplicating emails: {str(e)}")
             return [], {}
             
-    def _find_similar(self, email: str, existing: Set[str]) -> Set[str]:
-        """Find similar emails in existing set."""
+    def _find_similar(
+        self,
+        email: str,
+        domain_index: Dict[str, Tuple[QGramFilter, List[str]]]
+    ) -> List[str]:
+        """Find similar emails among the unique emails of the same domain."""
         try:
-            similar = set()
+            similar = []
             local_part, domain = email.split('@')
+            if domain not in domain_index:
+                return similar
             
-            for existing_email in existing:
-                existing_local, existing_domain = existing_email.split('@')
-                
-                # Only compare emails with same domain
-                if domain == existing_domain:
-                    if distance(local_part, existing_local) <= self.similarity_threshold:
-                        similar.add(existing_email)
+            # Only pairs surviving the length/q-gram prefilter get an exact distance
+            qgram_filter, domain_emails = domain_index[domain]
+            for position in qgram_filter.candidates(local_part):
+                existing_email = domain_emails[position]
+                existing_local = existing_email.split('@')[0]
+                if distance(local_part, existing_local) <= self.similarity_threshold:
+                    similar.append(existing_email)
                         
             return similar
             
         except Exception as e:
             self.logger.error(f"Error finding similar emails: {str(e)}")
-            return set()
\ No newline at end of file
+            return []
\ No newline at end of file
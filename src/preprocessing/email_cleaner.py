@@ -1,6 +1,7 @@
 import logging
 from typing import List, Set
 import re
+import pandas as pd
 
 class EmailCleaner:
     """Cleans and normalizes email addresses"""
@@ -58,4 +59,26 @@ class EmailCleaner:
             
         except Exception as e:
             self.logger.error(f"Error cleaning email list: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+            
+    def clean_column(self, column: pd.Series) -> pd.Series:
+        """
+        Clean a column of email addresses with vectorized string operations.
+        
+        Gives the same result as clean_email on every string row. Missing values
+        and rows that clean to nothing become empty strings.
+        
+        Args:
+            column: Raw email addresses
+            
+        Returns:
+            Column of cleaned email addresses with the same index
+        """
+        # Whitespace is outside the allowed characters, so one pass removes both
+        return (
+            column.astype(object)
+            .where(column.notna(), "")
+            .astype(str)
+            .str.lower()
+            .str.replace(self.invalid_chars_pattern, '', regex=True)
+        )
\ No newline at end of file
@@ -2,6 +2,8 @@ import logging
 from typing import List, Dict
 import re
 from email.utils import parseaddr
+import numpy as np
+import pandas as pd
 
 class FormatValidator:
     """Validates email format and structure"""
@@ -62,4 +64,47 @@ class FormatValidator:
             
         except Exception as e:
             self.logger.error(f"Error validating format: {str(e)}")
-            return {"is_valid": False, "issues": ["Validation error"]}
\ No newline at end of file
+            return {"is_valid": False, "issues": ["Validation error"]}
+            
+    def validate_column(self, column: pd.Series) -> pd.DataFrame:
+        """
+        Validate the format of a column of cleaned email addresses.
+        
+        Length and pattern checks run as vectorized string operations over
+        the whole column; validate_format is only called for the rows that
+        fail them, to build their issue lists.
+        
+        Args:
+            column: Cleaned email addresses
+            
+        Returns:
+            DataFrame with the column's index and columns is_valid (bool),
+            domain (None for invalid rows) and issues (None for valid rows)
+        """
+        at = column.str.find('@').to_numpy()
+        is_valid = (
+            column.str.match(self.email_pattern).to_numpy(dtype=bool)
+            & (column.str.len().to_numpy() <= 254)
+            & (at <= 64)
+        )
+        values = column.to_numpy(dtype=object)
+        issues = np.full(len(column), None, dtype=object)
+        
+        for position in np.flatnonzero(~is_valid):
+            validation = self.validate_format(values[position])
+            if validation["is_valid"]:
+                is_valid[position] = True
+            else:
+                issues[position] = validation["issues"]
+                
+        domain = np.full(len(column), None, dtype=object)
+        valid_positions = np.flatnonzero(is_valid)
+        domain[valid_positions] = [
+            values[position].split('@', 1)[1] for position in valid_positions
+        ]
+        
+        return pd.DataFrame({
+            "is_valid": is_valid,
+            "domain": domain,
+            "issues": issues
+        }, index=column.index)
\ No newline at end of file
@@ -0,0 +1,188 @@
+import zlib
+import random
+import logging
+from typing import Dict, List, Set, Tuple
+import numpy as np
+from Levenshtein import distance
+from ..utils.union_find import UnionFind
+from .similarity_edges import exact_edge_finder, groups_from_clusters
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+class MinHashDeduplicator:
+    """
+    Approximate similar-email grouping with MinHash and banded LSH.
+    
+    Local parts are reduced to character-shingle sets and summarized by
+    num_bands * rows_per_band MinHash values. Emails whose signatures agree
+    on every row of at least one band share a bucket and become candidate
+    pairs, so work grows roughly linearly with the number of emails rather
+    than with the number of pairs. More bands or fewer rows per band raise
+    recall at the cost of more candidates.
+    
+    Candidates are verified with the exact Levenshtein threshold when
+    verify=True (no false links, recall < 1), or accepted when their
+    estimated shingle Jaccard similarity reaches jaccard_threshold. Buckets
+    larger than max_bucket_size are linked as a chain of consecutive
+    members instead of all pairs, keeping the cost bounded on very common
+    signatures; measure_recall() reports what that costs on a sample.
+    """
+    
+    def __init__(
+        self,
+        similarity_threshold: int = 2,
+        num_bands: int = 20,
+        rows_per_band: int = 3,
+        shingle_size: int = 2,
+        max_bucket_size: int = 50,
+        verify: bool = True,
+        jaccard_threshold: float = 0.5,
+        seed: int = 1
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.similarity_threshold = similarity_threshold
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.shingle_size = shingle_size
+        self.max_bucket_size = max(2, max_bucket_size)
+        self.verify = verify
+        self.jaccard_threshold = jaccard_threshold
+        
+        num_perm = num_bands * rows_per_band
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 32, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=(num_perm, 1), dtype=np.uint64)
+        
+    def shingles(self, local_part: str) -> np.ndarray:
+        """Hash the character shingles of a local part, with boundary markers."""
+        padded = f"^{local_part}$"
+        size = min(self.shingle_size, len(padded))
+        grams = {padded[i:i + size] for i in range(len(padded) - size + 1)}
+        return np.fromiter(
+            (zlib.crc32(gram.encode('utf-8', 'replace')) for gram in grams),
+            dtype=np.uint64,
+            count=len(grams)
+        )
+        
+    def signatures(self, local_parts: List[str]) -> np.ndarray:
+        """
+        Compute MinHash signatures.
+        
+        Returns:
+            Array of shape (len(local_parts), num_bands * rows_per_band)
+        """
+        result = np.empty((len(local_parts), len(self._a)), dtype=np.uint64)
+        for i, local_part in enumerate(local_parts):
+            hashes = self.shingles(local_part)
+            permuted = ((self._a * hashes + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+            result[i] = permuted.min(axis=1)
+        return result
+        
+    def candidate_edges(self, local_parts: List[str]) -> Set[Tuple[int, int]]:
+        """
+        Find likely similar (i, j), i < j, pairs of local parts.
+        
+        Args:
+            local_parts: Local parts of one domain
+            
+        Returns:
+            Set of accepted edges
+        """
+        signatures = self.signatures(local_parts)
+        rows = self.rows_per_band
+        edges: Set[Tuple[int, int]] = set()
+        rejected: Set[Tuple[int, int]] = set()
+        
+        for band in range(self.num_bands):
+            band_keys = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+            buckets: Dict[bytes, List[int]] = {}
+            for i, key in enumerate(band_keys):
+                buckets.setdefault(key.tobytes(), []).append(i)
+                
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                if len(members) <= self.max_bucket_size:
+                    pairs = (
+                        (i, j) for x, i in enumerate(members) for j in members[x + 1:]
+                    )
+                else:
+                    pairs = zip(members, members[1:])
+                for pair in pairs:
+                    if pair in edges or pair in rejected:
+                        continue
+                    if self._accept(local_parts, signatures, *pair):
+                        edges.add(pair)
+                    else:
+                        rejected.add(pair)
+        return edges
+        
+    def find_similar_groups(self, emails: List[str]) -> Dict[str, List[str]]:
+        """
+        Group likely similar emails of one domain.
+        
+        Args:
+            emails: Emails of one domain
+            
+        Returns:
+            Dict mapping each group's primary to the rest of the group, in
+            the same format as the exact path
+        """
+        local_parts = [email.split('@')[0].lower() for email in emails]
+        clusters = UnionFind(len(emails))
+        clusters.union_all(self.candidate_edges(local_parts))
+        return groups_from_clusters(emails, clusters)
+        
+    def measure_recall(
+        self,
+        emails: List[str],
+        sample_size: int = 2000,
+        seed: int = 0
+    ) -> Dict[str, float]:
+        """
+        Compare the approximate grouping with the exact one on a sample.
+        
+        Recall is the share of exact similar pairs in the sample whose
+        emails the approximate path places in the same group; precision is
+        the share of approximate links that are exact similar pairs.
+        
+        Args:
+            emails: Emails of one domain
+            sample_size: Emails to sample
+            seed: Sampling seed
+            
+        Returns:
+            Dict with sample_size, exact_pairs, approximate_links, recall
+            and precision
+        """
+        sample = emails
+        if len(emails) > sample_size:
+            sample = random.Random(seed).sample(emails, sample_size)
+        local_parts = [email.split('@')[0].lower() for email in sample]
+        
+        exact = exact_edge_finder(self.similarity_threshold)(local_parts, self.similarity_threshold)
+        approximate = self.candidate_edges(local_parts)
+        
+        clusters = UnionFind(len(sample))
+        clusters.union_all(approximate)
+        found = sum(clusters.find(i) == clusters.find(j) for i, j in exact)
+        
+        report = {
+            "sample_size": len(sample),
+            "exact_pairs": len(exact),
+            "approximate_links": len(approximate),
+            "recall": found / len(exact) if exact else 1.0,
+            "precision": len(approximate & exact) / len(approximate) if approximate else 1.0
+        }
+        self.logger.info(
+            f"MinHash recall {report['recall']:.3f}, precision {report['precision']:.3f} "
+            f"on {report['sample_size']} sampled emails ({report['exact_pairs']} exact pairs)"
+        )
+        return report
+        
+    def _accept(self, local_parts: List[str], signatures: np.ndarray, i: int, j: int) -> bool:
+        """Decide whether a candidate pair is a similar pair."""
+        if self.verify:
+            return distance(local_parts[i], local_parts[j]) <= self.similarity_threshold
+        return float(np.mean(signatures[i] == signatures[j])) >= self.jaccard_threshold
\ No newline at end of file
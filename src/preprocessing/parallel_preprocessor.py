@@ -0,0 +1,193 @@
+import math
+import time
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from .preprocessor import EmailPreprocessor
+from .batch_deduplicator import BatchDeduplicator
+
+class PreprocessingBudgetExceeded(Exception):
+    """Raised when a request uses more preprocessing CPU time than allowed."""
+
+def _timed_call(func: Callable, *args) -> Tuple[Any, float]:
+    """Run func in a worker and report the CPU time it used."""
+    start = time.process_time()
+    result = func(*args)
+    return result, time.process_time() - start
+
+def _clean_chunk(preprocessor: EmailPreprocessor, emails: List[str]) -> Tuple[int, List[str], List[Dict]]:
+    """Clean and format-check one chunk."""
+    return preprocessor.clean_and_validate(emails)
+
+def _group_domains(deduplicator: BatchDeduplicator, domains: List[List[str]]) -> List[Dict[str, List[str]]]:
+    """Find the similar groups of several domains."""
+    return [deduplicator.find_similar_groups(domain_emails) for domain_emails in domains]
+
+class ParallelPreprocessor:
+    """
+    Runs EmailPreprocessor stages in a process pool.
+    
+    Cleaning and format validation run over chunks of the input and
+    similarity grouping over bundles of domains, spread across `workers`
+    processes, so the calling event loop only does the linear exact
+    deduplication and result assembly. Results are those of
+    EmailPreprocessor.preprocess, with the CPU time used added to the
+    stats as cpu_milliseconds.
+    
+    The CPU time reported by the workers counts against a per-request
+    budget (cpu_budget_seconds, None for no limit); once it is exceeded,
+    tasks that have not started are cancelled and
+    PreprocessingBudgetExceeded is raised. Cancelling the calling task
+    cancels the pending tasks the same way. Tasks already running finish
+    in the background, so the overrun is bounded by the chunk size.
+    Requests of at most inline_max_size emails run in-process, blocking
+    the event loop for about 70ms per 1000 emails; above that the pool
+    costs a few milliseconds per request to dispatch (see
+    benchmarks/parallel_preprocess.py). The API reads it from the
+    "preprocessing" section of the production config.
+    """
+    
+    def __init__(
+        self,
+        preprocessor: Optional[EmailPreprocessor] = None,
+        workers: int = 2,
+        chunk_size: int = 5000,
+        min_chunk_size: int = 250,
+        cpu_budget_seconds: Optional[float] = 30.0,
+        inline_max_size: int = 250
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.preprocessor = preprocessor or EmailPreprocessor()
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.min_chunk_size = max(1, min_chunk_size)
+        self.cpu_budget_seconds = cpu_budget_seconds
+        self.inline_max_size = inline_max_size
+        self.executor: Optional[ProcessPoolExecutor] = None
+        
+    def close(self):
+        """Shut down the worker processes."""
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            
+    async def preprocess(
+        self,
+        emails: List[str],
+        cpu_budget_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Preprocess a list of email addresses without blocking the event loop.
+        
+        Args:
+            emails: List of raw email addresses
+            cpu_budget_seconds: Override the configured CPU budget
+            
+        Returns:
+            Dict containing preprocessing results
+            
+        Raises:
+            PreprocessingBudgetExceeded: When the CPU budget runs out
+        """
+        if len(emails) <= self.inline_max_size:
+            return await self.preprocessor.preprocess(emails)
+            
+        budget = cpu_budget_seconds if cpu_budget_seconds is not None else self.cpu_budget_seconds
+        usage = {"cpu_seconds": 0.0}
+        
+        # Clean and validate format, chunk by chunk
+        size = max(self.min_chunk_size, min(self.chunk_size, math.ceil(len(emails) / self.workers)))
+        chunks = [emails[i:i + size] for i in range(0, len(emails), size)]
+        cleaned = await self._run_all(
+            [(_clean_chunk, self.preprocessor, chunk) for chunk in chunks], usage, budget
+        )
+        cleaned_count = sum(count for count, _, _ in cleaned)
+        valid_emails = [email for _, valid, _ in cleaned for email in valid]
+        invalid_format = [entry for _, _, invalid in cleaned for entry in invalid]
+        
+        # Exact duplicates in-process, similar groups per bundle of domains
+        deduplicator = self.preprocessor.deduplicator
+        dedup_results = deduplicator.deduplicate_exact(valid_emails)
+        domain_groups = [
+            domain_emails
+            for domain_emails in deduplicator.group_by_domain(dedup_results["unique_emails"]).values()
+            if len(domain_emails) > 1
+        ]
+        bundles = self._bundle(domain_groups)
+        grouped = await self._run_all(
+            [(_group_domains, deduplicator, bundle) for bundle in bundles], usage, budget
+        )
+        for bundle_groups in grouped:
+            for similar_groups in bundle_groups:
+                for primary, similar in similar_groups.items():
+                    if similar:
+                        dedup_results["similar_groups"][primary].extend(similar)
+                        dedup_results["stats"]["similar"] += len(similar)
+        dedup_results["stats"]["unique"] = len(dedup_results["unique_emails"])
+        
+        results = self.preprocessor.build_results(
+            len(emails), cleaned_count, valid_emails, invalid_format, dedup_results
+        )
+        results["stats"]["cpu_milliseconds"] = round(usage["cpu_seconds"] * 1000)
+        return results
+        
+    def _bundle(self, domain_groups: List[List[str]]) -> List[List[List[str]]]:
+        """
+        Split domains into bundles of roughly chunk_size emails, in order.
+        
+        A domain is never split, so a domain larger than chunk_size forms a
+        bundle of its own.
+        """
+        bundles: List[List[List[str]]] = []
+        current: List[List[str]] = []
+        current_size = 0
+        for domain_emails in domain_groups:
+            if current and current_size + len(domain_emails) > self.chunk_size:
+                bundles.append(current)
+                current, current_size = [], 0
+            current.append(domain_emails)
+            current_size += len(domain_emails)
+        if current:
+            bundles.append(current)
+        return bundles
+        
+    async def _run_all(
+        self,
+        tasks: List[Tuple],
+        usage: Dict[str, float],
+        budget: Optional[float]
+    ) -> List[Any]:
+        """
+        Run tasks in the pool and return their results in order.
+        
+        Args:
+            tasks: (function, *args) tuples
+            usage: Running CPU usage of the request, updated in place
+            budget: CPU budget in seconds, or None
+            
+        Returns:
+            Task results, in task order
+        """
+        if not tasks:
+            return []
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            
+        loop = asyncio.get_running_loop()
+        futures = [loop.run_in_executor(self.executor, _timed_call, *task) for task in tasks]
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    usage["cpu_seconds"] += future.result()[1]
+                if budget is not None and usage["cpu_seconds"] > budget:
+                    raise PreprocessingBudgetExceeded(
+                        f"Preprocessing used {usage['cpu_seconds']:.1f}s of CPU, budget is {budget:.1f}s"
+                    )
+            return [future.result()[0] for future in futures]
+            
+        finally:
+            for future in futures:
+                future.cancel()
\ No newline at end of file
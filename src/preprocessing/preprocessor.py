@@ -1,17 +1,35 @@
+import re
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import pandas as pd
 from .email_cleaner import EmailCleaner
 from .batch_deduplicator import BatchDeduplicator
 from .format_validator import FormatValidator
 
+# Addresses that EmailCleaner leaves unchanged apart from case and
+# surrounding whitespace, and that FormatValidator accepts
+_FAST_EMAIL_PATTERN = re.compile(
+    r"\s*((?!\.)[a-z0-9._+-]{1,64}@(?![-.])[a-z0-9.-]+\.[a-z]{2,})\s*",
+    re.IGNORECASE | re.ASCII
+)
+MAX_EMAIL_LENGTH = 254
+
 class EmailPreprocessor:
-    """Coordinates email preprocessing tasks"""
+    """
+    Coordinates email preprocessing tasks.
+    
+    With fast_path=True, ASCII addresses that are already well-formed are
+    cleaned and format-checked with a single precompiled match; everything
+    else goes through EmailCleaner and FormatValidator, which build the
+    issue list for rejected addresses. Both paths give the same results.
+    """
     
-    def __init__(self):
+    def __init__(self, fast_path: bool = True):
         self.logger = logging.getLogger(__name__)
         self.cleaner = EmailCleaner()
         self.deduplicator = BatchDeduplicator()
         self.format_validator = FormatValidator()
+        self.fast_path = fast_path
         
     async def preprocess(self, emails: List[str]) -> Dict[str, Any]:
         """
@@ -24,49 +42,15 @@ class EmailPreprocessor:
             Dict containing preprocessing results
         """
         try:
-            results = {
-                "original_count": len(emails),
-                "processed_count": 0,
-                "invalid_format": [],
-                "duplicates": {},
-                "similar_groups": {},
-                "processed_emails": [],
-                "stats": {}
-            }
-            
-            # Clean emails
-            cleaned_emails = self.cleaner.clean_list(emails)
-            
-            # Validate format
-            valid_emails = []
-            for email in cleaned_emails:
-                validation = self.format_validator.validate_format(email)
-                if validation["is_valid"]:
-                    valid_emails.append(email)
-                else:
-                    results["invalid_format"].append({
-                        "email": email,
-                        "issues": validation["issues"]
-                    })
+            # Clean emails and validate format
+            cleaned_count, valid_emails, invalid_format = self.clean_and_validate(emails)
             
             # Deduplicate emails
             dedup_results = self.deduplicator.deduplicate(valid_emails)
-            results["processed_emails"] = dedup_results["unique_emails"]
-            results["duplicates"] = dedup_results["duplicates"]
-            results["similar_groups"] = dedup_results["similar_groups"]
             
-            # Calculate statistics
-            results["processed_count"] = len(results["processed_emails"])
-            results["stats"] = {
-                "total_cleaned": len(cleaned_emails),
-                "total_valid": len(valid_emails),
-                "total_unique": len(results["processed_emails"]),
-                "exact_duplicates": dedup_results["stats"]["exact_duplicates"],
-                "similar_emails": dedup_results["stats"]["similar"],
-                "invalid_count": len(results["invalid_format"])
-            }
-            
-            return results
+            return self.build_results(
+                len(emails), cleaned_count, valid_emails, invalid_format, dedup_results
+            )
             
         except Exception as e:
             self.logger.error(f"Error preprocessing emails: {str(e)}")
@@ -79,4 +63,118 @@ class EmailPreprocessor:
                 "processed_emails": [],
                 "stats": {},
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+            
+    def build_results(
+        self,
+        original_count: int,
+        cleaned_count: int,
+        valid_emails: List[str],
+        invalid_format: List[Dict],
+        dedup_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Assemble preprocessing results from the outputs of each stage.
+        
+        Args:
+            original_count: Number of raw emails
+            cleaned_count: Number of non-empty cleaned emails
+            valid_emails: Emails that passed format validation
+            invalid_format: Rejected emails with their issues
+            dedup_results: Result of BatchDeduplicator.deduplicate
+            
+        Returns:
+            Dict containing preprocessing results
+        """
+        processed_emails = dedup_results["unique_emails"]
+        return {
+            "original_count": original_count,
+            "processed_count": len(processed_emails),
+            "invalid_format": invalid_format,
+            "duplicates": dedup_results["duplicates"],
+            "similar_groups": dedup_results["similar_groups"],
+            "processed_emails": processed_emails,
+            "stats": {
+                "total_cleaned": cleaned_count,
+                "total_valid": len(valid_emails),
+                "total_unique": len(processed_emails),
+                "exact_duplicates": dedup_results["stats"]["exact_duplicates"],
+                "similar_emails": dedup_results["stats"]["similar"],
+                "invalid_count": len(invalid_format)
+            }
+        }
+            
+    def preprocess_column(self, column: pd.Series) -> pd.DataFrame:
+        """
+        Clean and format-check a column of email addresses.
+        
+        Columnar counterpart of the cleaning and format stages of
+        preprocess() for data that is already a pandas column, such as a
+        chunk read by FileHandler. Every row is kept, so the result aligns
+        with the input; rows that clean to an empty string are invalid with
+        no issues, matching their removal in preprocess().
+        
+        Args:
+            column: Raw email addresses
+            
+        Returns:
+            DataFrame with the column's index and columns email (cleaned),
+            is_valid (the validity mask), domain and issues
+        """
+        try:
+            cleaned = self.cleaner.clean_column(column)
+            validated = self.format_validator.validate_column(cleaned)
+            
+            # Rows that clean to nothing are dropped by preprocess(), not reported
+            empty = (cleaned == "").to_numpy(dtype=bool)
+            validated.loc[empty, "issues"] = None
+            validated.insert(0, "email", cleaned)
+            return validated
+            
+        except Exception as e:
+            self.logger.error(f"Error preprocessing email column: {str(e)}")
+            return pd.DataFrame(
+                {"email": column, "is_valid": False, "domain": None, "issues": None},
+                index=column.index
+            )
+            
+    def clean_and_validate(self, emails: List[str]) -> Tuple[int, List[str], List[Dict]]:
+        """
+        Clean emails and validate their format in one pass.
+        
+        Args:
+            emails: List of raw email addresses
+            
+        Returns:
+            Tuple of (number of non-empty cleaned emails, valid emails,
+            invalid emails with their issues)
+        """
+        match = _FAST_EMAIL_PATTERN.fullmatch if self.fast_path else None
+        cleaned_count = 0
+        valid_emails = []
+        invalid_format = []
+        
+        for email in emails:
+            if match and isinstance(email, str) and email.isascii():
+                found = match(email)
+                if found:
+                    address = found.group(1)
+                    if len(address) <= MAX_EMAIL_LENGTH:
+                        valid_emails.append(address.lower())
+                        cleaned_count += 1
+                        continue
+                        
+            cleaned = self.cleaner.clean_email(email)
+            if not cleaned:
+                continue
+            cleaned_count += 1
+            validation = self.format_validator.validate_format(cleaned)
+            if validation["is_valid"]:
+                valid_emails.append(cleaned)
+            else:
+                invalid_format.append({
+                    "email": cleaned,
+                    "issues": validation["issues"]
+                })
+                
+        return cleaned_count, valid_emails, invalid_format
\ No newline at end of file
@@ -0,0 +1,107 @@
+import zlib
+from typing import Callable, Dict, List, Set, Tuple
+from Levenshtein import distance
+from ..utils.deletion_index import deletion_variants
+from ..utils.qgram_filter import QGramFilter
+from ..utils.union_find import UnionFind
+
+# Above this distance deletion variants grow too numerous per address and
+# edges come from the q-gram prefilter instead
+MAX_DELETION_DISTANCE = 2
+
+def deletion_edges(
+    local_parts: List[str],
+    threshold: int,
+    part: int = 0,
+    parts: int = 1
+) -> Set[Tuple[int, int]]:
+    """
+    Find the (i, j), i < j, pairs of local parts within threshold edits.
+    
+    Pairs are found through shared deletion variants. With parts > 1 only
+    the variants whose stable hash falls in slice `part` are used, so the
+    slices can run in separate processes with a fraction of the memory
+    each; together they find every pair.
+    
+    Args:
+        local_parts: Local parts of one domain
+        threshold: Maximum Levenshtein distance
+        part: Slice of the variant hash space to use
+        parts: Number of slices
+        
+    Returns:
+        Set of verified edges
+    """
+    buckets: Dict[str, List[int]] = {}
+    for i, local_part in enumerate(local_parts):
+        for variant in deletion_variants(local_part, threshold):
+            if parts == 1 or zlib.crc32(variant.encode('utf-8', 'replace')) % parts == part:
+                buckets.setdefault(variant, []).append(i)
+                
+    edges = set()
+    for members in buckets.values():
+        for x, i in enumerate(members):
+            for j in members[x + 1:]:
+                if (i, j) not in edges and distance(local_parts[i], local_parts[j]) <= threshold:
+                    edges.add((i, j))
+    return edges
+
+def qgram_edges(
+    local_parts: List[str],
+    threshold: int,
+    part: int = 0,
+    parts: int = 1
+) -> Set[Tuple[int, int]]:
+    """
+    Find the (i, j), i < j, pairs of local parts within threshold edits.
+    
+    Candidates come from the length/q-gram prefilter. With parts > 1 only
+    the rows i with i % parts == part are queried.
+    
+    Args:
+        local_parts: Local parts of one domain
+        threshold: Maximum Levenshtein distance
+        part: Slice of rows to query
+        parts: Number of slices
+        
+    Returns:
+        Set of verified edges
+    """
+    qgram_filter = QGramFilter(threshold, capacity=len(local_parts))
+    qgram_filter.add_many(local_parts)
+    
+    edges = set()
+    for i in range(part, len(local_parts), parts):
+        for j in qgram_filter.candidates(local_parts[i]):
+            j = int(j)
+            if j > i and distance(local_parts[i], local_parts[j]) <= threshold:
+                edges.add((i, j))
+    return edges
+
+def exact_edge_finder(threshold: int) -> Callable[..., Set[Tuple[int, int]]]:
+    """Return the exact edge search suited to a distance threshold."""
+    return deletion_edges if threshold <= MAX_DELETION_DISTANCE else qgram_edges
+
+def groups_from_clusters(emails: List[str], clusters: UnionFind) -> Dict[str, List[str]]:
+    """
+    Turn clustered emails into similar groups.
+    
+    The shortest (then alphabetically first) email of each cluster is its
+    primary and the others follow in the same order, so the result only
+    depends on which emails are clustered together.
+    
+    Args:
+        emails: Emails the cluster items index into
+        clusters: Clustering of the emails
+        
+    Returns:
+        Dict mapping each primary to the rest of its group
+    """
+    similar_groups = {}
+    groups = [
+        sorted((emails[i] for i in component), key=lambda email: (len(email), email))
+        for component in clusters.components(min_size=2)
+    ]
+    for group in sorted(groups, key=lambda group: (len(group[0]), group[0])):
+        similar_groups[group[0]] = group[1:]
+    return similar_groups
\ No newline at end of file
@@ -0,0 +1,146 @@
+import math
+import logging
+import hashlib
+from typing import List, Optional
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter over strings."""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        # Optimal size and hash count for the target false-positive rate
+        self.num_bits = max(8, int(math.ceil(
+            -self.capacity * math.log(error_rate) / (math.log(2) ** 2)
+        )))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        
+    @staticmethod
+    def bytes_for(capacity: int, error_rate: float) -> int:
+        """Return the memory a filter of this capacity and error rate needs."""
+        bits = -max(1, capacity) * math.log(error_rate) / (math.log(2) ** 2)
+        return (max(8, int(math.ceil(bits))) + 7) // 8
+        
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+        
+    def _positions(self, item: str) -> List[int]:
+        """Bit positions of an item by double hashing one 128-bit digest."""
+        digest = hashlib.blake2b(item.encode('utf-8', 'replace'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+        
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+        
+        Returns:
+            True if the item was (probably) already present
+        """
+        present = True
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                present = False
+                self._bits[byte] |= 1 << bit
+        if not present:
+            self.count += 1
+        return present
+        
+    def __contains__(self, item: str) -> bool:
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                return False
+        return True
+        
+    def __len__(self) -> int:
+        return self.count
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows by adding slices as items arrive.
+    
+    Each new slice is `growth` times larger with a tighter error rate, so
+    the compound false-positive rate stays below error_rate however many
+    items are added. With max_bytes set, no slice is added past the cap:
+    once the last slice is full the filter is saturated and refuses new
+    items (add() reports them as absent without storing them, counted in
+    refused), so the false-positive rate never exceeds error_rate.
+    """
+    
+    def __init__(
+        self,
+        initial_capacity: int = 1000000,
+        error_rate: float = 0.001,
+        growth: int = 2,
+        tightening: float = 0.5,
+        max_bytes: Optional[int] = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.initial_capacity = max(1, initial_capacity)
+        self.error_rate = error_rate
+        self.growth = max(1, growth)
+        self.tightening = tightening
+        self.max_bytes = max_bytes
+        self.saturated = False
+        self.refused = 0
+        self.filters: List[BloomFilter] = []
+        self._add_slice()
+        
+    @property
+    def nbytes(self) -> int:
+        return sum(f.nbytes for f in self.filters)
+        
+    def _add_slice(self) -> bool:
+        """Add the next slice unless it would exceed max_bytes."""
+        index = len(self.filters)
+        capacity = self.initial_capacity * self.growth ** index
+        error_rate = self.error_rate * (1 - self.tightening) * self.tightening ** index
+        
+        if (
+            self.filters
+            and self.max_bytes is not None
+            and self.nbytes + BloomFilter.bytes_for(capacity, error_rate) > self.max_bytes
+        ):
+            if not self.saturated:
+                self.logger.error(
+                    f"Bloom filter reached its {self.max_bytes} byte cap at "
+                    f"{len(self)} items; new items are no longer tracked"
+                )
+                self.saturated = True
+            return False
+            
+        self.filters.append(BloomFilter(capacity, error_rate))
+        return True
+        
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+        
+        Returns:
+            True if the item was (probably) already present; False for new
+            items, including those refused once the filter is saturated
+        """
+        if item in self:
+            return True
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            if not self._add_slice():
+                self.refused += 1
+                return False
+            current = self.filters[-1]
+        current.add(item)
+        return False
+        
+    def __contains__(self, item: str) -> bool:
+        return any(item in f for f in reversed(self.filters))
+        
+    def __len__(self) -> int:
+        return sum(len(f) for f in self.filters)
\ No newline at end of file
@@ -0,0 +1,64 @@
+from typing import Dict, Iterable, List, Set
+
+def deletion_variants(term: str, max_distance: int) -> Set[str]:
+    """
+    Return every string obtained by deleting up to max_distance characters.
+    
+    Args:
+        term: String to generate variants for
+        max_distance: Maximum number of deletions
+        
+    Returns:
+        Set of variants, including the term itself
+    """
+    variants = {term}
+    frontier = {term}
+    for _ in range(max(0, max_distance)):
+        frontier = {
+            variant[:i] + variant[i + 1:]
+            for variant in frontier
+            for i in range(len(variant))
+        }
+        variants |= frontier
+    return variants
+
+class DeletionIndex:
+    """
+    Symmetric-deletion (SymSpell-style) candidate index.
+    
+    Two strings within Levenshtein distance max_distance always share a
+    variant with at most max_distance deletions from each, so indexing the
+    deletion variants of every term turns the search for near neighbours
+    into hash lookups. Candidates are a superset of the true matches and
+    must be verified with an exact distance.
+    """
+    
+    def __init__(self, max_distance: int = 2):
+        self.max_distance = max_distance
+        self.size = 0
+        # Keyed by variant hash to keep memory down; collisions only add
+        # candidates, which verification discards
+        self._buckets: Dict[int, List[int]] = {}
+        
+    def add(self, key: int, term: str):
+        """Index a term under an integer key (e.g. its input position)."""
+        for variant in deletion_variants(term, self.max_distance):
+            self._buckets.setdefault(hash(variant), []).append(key)
+        self.size += 1
+        
+    def add_many(self, terms: Iterable[str]):
+        """Index terms under their positions in the iterable."""
+        for key, term in enumerate(terms):
+            self.add(key, term)
+            
+    def candidates(self, term: str) -> Set[int]:
+        """Return the keys of indexed terms possibly within max_distance of term."""
+        keys: Set[int] = set()
+        for variant in deletion_variants(term, self.max_distance):
+            bucket = self._buckets.get(hash(variant))
+            if bucket:
+                keys.update(bucket)
+        return keys
+        
+    def __len__(self) -> int:
+        return self.size
\ No newline at end of file
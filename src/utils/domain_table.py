@@ -0,0 +1,162 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from tld import get_fld
+
+class DomainTable:
+    """
+    Intern table mapping email domains to small integer IDs.
+    
+    The first time a domain is seen it is normalized (stripped, lowercased),
+    stored once and given the next ID; its IDNA (ASCII) form and the ID of
+    its registrable domain are computed at the same time, so later uses are
+    list lookups. Per-address domain data can then be kept as int32 arrays
+    and grouped or counted with NumPy. ID 0 (NO_DOMAIN) stands for a
+    missing domain.
+    
+    IDs are only meaningful in the process that assigned them; pass domain
+    strings across process boundaries. IDs are never reused, so the table
+    holds every distinct normalized domain it has been given; intern only
+    the domains of data the caller keeps (batches, statistics, duplicate
+    history), not of every request. Raw spellings are normalized on each
+    lookup rather than stored.
+    """
+    
+    NO_DOMAIN = 0
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Normalized domain -> ID
+        self._ids: Dict[str, int] = {"": self.NO_DOMAIN}
+        self._domains: List[str] = [""]
+        self._idna: List[str] = [""]
+        self._registrable: List[int] = [self.NO_DOMAIN]
+        self._registrable_array: Optional[np.ndarray] = None
+        
+    def __len__(self) -> int:
+        return len(self._domains) - 1
+        
+    def intern(self, domain: str) -> int:
+        """Return the ID of a domain, adding it on first sight."""
+        domain_id = self._ids.get(domain)
+        if domain_id is not None:
+            return domain_id
+            
+        normalized = domain.strip().lower()
+        with self._lock:
+            domain_id = self._ids.get(normalized)
+            if domain_id is None:
+                domain_id = self._add(normalized)
+        return domain_id
+        
+    def id_of(self, email: str) -> int:
+        """Return the domain ID of an address (NO_DOMAIN without an @)."""
+        if '@' not in email:
+            return self.NO_DOMAIN
+        return self.intern(email.rpartition('@')[2])
+        
+    def ids_of(self, emails: Iterable[str]) -> np.ndarray:
+        """Return the domain IDs of many addresses as an int32 array."""
+        get = self._ids.get
+        ids = []
+        for email in emails:
+            if isinstance(email, str) and '@' in email:
+                domain = email.rpartition('@')[2]
+                domain_id = get(domain)
+                ids.append(domain_id if domain_id is not None else self.intern(domain))
+            else:
+                ids.append(self.NO_DOMAIN)
+        return np.array(ids, dtype=np.int32)
+        
+    def domain(self, domain_id: int) -> str:
+        """Return the normalized domain for an ID."""
+        return self._domains[domain_id]
+        
+    def idna(self, domain_id: int) -> str:
+        """Return the IDNA (ASCII) form of a domain."""
+        return self._idna[domain_id]
+        
+    def registrable_id(self, domain_id: int) -> int:
+        """Return the ID of a domain's registrable domain (e.g. example.co.uk)."""
+        return self._registrable[domain_id]
+        
+    def registrable(self, domain_id: int) -> str:
+        """Return a domain's registrable domain."""
+        return self._domains[self._registrable[domain_id]]
+        
+    def registrable_ids(self, domain_ids: np.ndarray) -> np.ndarray:
+        """Map an array of domain IDs to their registrable domain IDs."""
+        if self._registrable_array is None or len(self._registrable_array) != len(self._registrable):
+            self._registrable_array = np.array(self._registrable, dtype=np.int32)
+        return self._registrable_array[domain_ids]
+        
+    @staticmethod
+    def group_positions(domain_ids: np.ndarray) -> Dict[int, np.ndarray]:
+        """
+        Group positions by domain ID.
+        
+        Args:
+            domain_ids: Domain ID per address
+            
+        Returns:
+            Dict mapping each ID to the ascending positions that have it, in
+            order of first appearance
+        """
+        if not len(domain_ids):
+            return {}
+        order = np.argsort(domain_ids, kind="stable")
+        sorted_ids = domain_ids[order]
+        starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+        groups = np.split(order, starts[1:])
+        groups.sort(key=lambda positions: positions[0])
+        return {int(domain_ids[positions[0]]): positions for positions in groups}
+        
+    @staticmethod
+    def count(domain_ids: np.ndarray) -> np.ndarray:
+        """Count addresses per domain ID (index = ID)."""
+        return np.bincount(domain_ids, minlength=1)
+        
+    def top_domains(self, counts: np.ndarray, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Pick the most common domains.
+        
+        Args:
+            counts: Count per domain ID, e.g. from count()
+            limit: Number of domains to return
+            
+        Returns:
+            (domain, count) pairs, most common first; NO_DOMAIN is skipped
+        """
+        counts = np.array(counts)
+        counts[self.NO_DOMAIN] = 0
+        top = np.argsort(-counts, kind="stable")[:limit]
+        return [(self._domains[i], int(counts[i])) for i in top if counts[i]]
+        
+    def _add(self, normalized: str) -> int:
+        """Store a new normalized domain with its derived forms."""
+        domain_id = len(self._domains)
+        self._ids[normalized] = domain_id
+        self._domains.append(normalized)
+        self._idna.append(idna_form(normalized))
+        self._registrable.append(domain_id)
+        
+        registrable = get_fld(normalized, fix_protocol=True, fail_silently=True) or normalized
+        if registrable != normalized:
+            self._registrable[domain_id] = self.intern(registrable)
+        return domain_id
+
+def idna_form(normalized: str) -> str:
+    """Return the IDNA (ASCII) form of a normalized domain, or the domain if it has none."""
+    try:
+        return normalized.encode('idna').decode('ascii')
+    except UnicodeError:
+        return normalized
+
+_table: Optional[DomainTable] = None
+
+def get_domain_table() -> DomainTable:
+    """Return the process-wide domain table."""
+    global _table
+    if _table is None:
+        _table = DomainTable()
+    return _table
\ No newline at end of file
@@ -1,13 +1,19 @@
 import logging
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
 import pandas as pd
 from pathlib import Path
+from openpyxl import load_workbook
+from .result_writers import WRITERS, open_result_writer
 
 class FileHandler:
     """Handles file operations for email validation."""
     
-    def __init__(self):
+    # Formats read column-wise, where only the email column is loaded
+    TABULAR_FORMATS = ('.csv', '.xlsx', '.xls')
+    
+    def __init__(self, chunk_size: int = 100000):
         self.logger = logging.getLogger(__name__)
+        self.chunk_size = max(1, chunk_size)
         
     def read_file(self, file_path: str) -> List[str]:
         """
@@ -36,20 +42,51 @@ class FileHandler:
             self.logger.error(f"Error reading file {file_path}: {str(e)}")
             raise
             
-    def export_results(self, results: List[Dict], file_path: str):
+    def iter_chunks(self, file_path: str) -> Iterator[List[str]]:
+        """
+        Stream emails from file in chunks of at most chunk_size.
+        
+        Only the email column of CSV and Excel files is read, so memory use
+        stays bounded by the chunk size regardless of file width or length.
+        
+        Args:
+            file_path: Path to input file
+            
+        Yields:
+            Lists of email addresses
+        """
+        suffix = Path(file_path).suffix.lower()
+        
+        if suffix == '.csv':
+            yield from self._iter_csv(file_path)
+        elif suffix == '.xlsx':
+            yield from self._iter_xlsx(file_path)
+        elif suffix == '.xls':
+            yield from self._iter_xls(file_path)
+        elif suffix == '.txt':
+            yield from self._iter_text(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {suffix}")
+            
+    def export_results(self, results: Iterable[Dict], file_path: str):
         """
         Export validation results.
         
+        CSV, NDJSON, Parquet and xlsx exports are streamed in buffered
+        blocks, so results may be any iterable (e.g. a generator) and are
+        never all held in memory at once.
+        
         Args:
-            results: List of validation results
+            results: Validation results
             file_path: Output file path
         """
         try:
             path = Path(file_path)
             suffix = path.suffix.lower()
             
-            if suffix == '.csv':
-                self._export_csv(results, file_path)
+            if suffix in WRITERS:
+                with open_result_writer(file_path) as writer:
+                    writer.write_many(results)
             elif suffix == '.json':
                 self._export_json(results, file_path)
             else:
@@ -61,35 +98,88 @@ class FileHandler:
             
     def _read_csv(self, file_path: str) -> List[str]:
         """Read emails from CSV file."""
-        df = pd.read_csv(file_path)
-        # Try to find email column
-        email_columns = [col for col in df.columns if 'email' in col.lower()]
-        if email_columns:
-            return df[email_columns[0]].dropna().tolist()
-        # If no email column found, use first column
-        return df.iloc[:, 0].dropna().tolist()
+        return [email for chunk in self._iter_csv(file_path) for email in chunk]
         
     def _read_excel(self, file_path: str) -> List[str]:
         """Read emails from Excel file."""
-        df = pd.read_excel(file_path)
-        email_columns = [col for col in df.columns if 'email' in col.lower()]
-        if email_columns:
-            return df[email_columns[0]].dropna().tolist()
-        return df.iloc[:, 0].dropna().tolist()
+        if Path(file_path).suffix.lower() == '.xls':
+            chunks = self._iter_xls(file_path)
+        else:
+            chunks = self._iter_xlsx(file_path)
+        return [email for chunk in chunks for email in chunk]
         
     def _read_text(self, file_path: str) -> List[str]:
         """Read emails from text file."""
+        return [email for chunk in self._iter_text(file_path) for email in chunk]
+        
+    @staticmethod
+    def _email_column(columns: List) -> int:
+        """Return the index of the first column named like 'email', else 0."""
+        for index, column in enumerate(columns):
+            if column is not None and 'email' in str(column).lower():
+                return index
+        return 0
+        
+    def _iter_csv(self, file_path: str) -> Iterator[List[str]]:
+        """Stream the email column of a CSV file."""
+        header = pd.read_csv(file_path, nrows=0).columns
+        column = self._email_column(list(header))
+        
+        for chunk in pd.read_csv(
+            file_path,
+            usecols=[column],
+            dtype=str,
+            chunksize=self.chunk_size
+        ):
+            emails = chunk.iloc[:, 0].dropna().tolist()
+            if emails:
+                yield emails
+                
+    def _iter_xlsx(self, file_path: str) -> Iterator[List[str]]:
+        """Stream the email column of an xlsx workbook's first sheet from a read-only row stream."""
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            # The first sheet, as pd.read_excel reads, not the selected one
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            column = self._email_column(list(header))
+            
+            chunk = []
+            for row in rows:
+                value = row[column] if column < len(row) else None
+                if value is not None:
+                    chunk.append(str(value))
+                    if len(chunk) >= self.chunk_size:
+                        yield chunk
+                        chunk = []
+            if chunk:
+                yield chunk
+        finally:
+            workbook.close()
+            
+    def _iter_xls(self, file_path: str) -> Iterator[List[str]]:
+        """Read the email column of a legacy xls workbook."""
+        header = pd.read_excel(file_path, nrows=0).columns
+        column = self._email_column(list(header))
+        emails = pd.read_excel(file_path, usecols=[column], dtype=str).iloc[:, 0].dropna().tolist()
+        for start in range(0, len(emails), self.chunk_size):
+            yield emails[start:start + self.chunk_size]
+            
+    def _iter_text(self, file_path: str) -> Iterator[List[str]]:
+        """Stream emails from a text file, one per line."""
+        chunk = []
         with open(file_path, 'r') as f:
-            return [line.strip() for line in f if line.strip()]
+            for line in f:
+                if line.strip():
+                    chunk.append(line.strip())
+                    if len(chunk) >= self.chunk_size:
+                        yield chunk
+                        chunk = []
+        if chunk:
+            yield chunk
             
-    def _export_csv(self, results: List[Dict], file_path: str):
-        """Export results to CSV."""
-        df = pd.DataFrame(results)
-        # Flatten nested structures
-        df['issues'] = df['issues'].apply(lambda x: '|'.join(x))
-        df['suggestions'] = df['suggestions'].apply(lambda x: '|'.join(x))
-        df.to_csv(file_path, index=False)
-        
-    def _export_json(self, results: List[Dict], file_path: str):
+    def _export_json(self, results: Iterable[Dict], file_path: str):
         """Export results to JSON."""
-        pd.DataFrame(results).to_json(file_path, orient='records', indent=2)
\ No newline at end of file
+        pd.DataFrame(list(results)).to_json(file_path, orient='records', indent=2)
\ No newline at end of file
@@ -0,0 +1,96 @@
+from typing import Iterable, Optional, Tuple
+import numpy as np
+
+class QGramFilter:
+    """
+    Vectorized prefilter for Levenshtein candidate pairs.
+    
+    Terms are summarized by their length and by hashed q-gram count
+    signatures held in NumPy arrays. One edit changes a length by at most
+    one and destroys at most q q-grams while creating at most q, so two
+    terms within max_distance edits differ in length by at most
+    max_distance and their q-gram count vectors by at most 2*q*max_distance
+    in L1 norm. Folding q-grams into buckets can only shrink the L1
+    distance, so the test never discards a true match; survivors still
+    need an exact distance.
+    """
+    
+    def __init__(
+        self,
+        max_distance: int = 2,
+        qs: Tuple[int, ...] = (1, 2),
+        buckets: int = 32,
+        capacity: int = 1024
+    ):
+        self.max_distance = max_distance
+        self.qs = qs
+        self.buckets = buckets
+        self.size = 0
+        capacity = max(1, capacity)
+        self._lengths = np.zeros(capacity, dtype=np.int32)
+        self._signatures = np.zeros((capacity, len(qs) * buckets), dtype=np.int16)
+        # L1 bound per signature block (one block per q)
+        self._limits = np.array([2 * q * max_distance for q in qs], dtype=np.int32)
+        
+    def signature(self, term: str) -> np.ndarray:
+        """Return the hashed q-gram count signature of a term."""
+        codes = np.fromiter((ord(c) for c in term), dtype=np.int64, count=len(term))
+        blocks = []
+        for q in self.qs:
+            count = len(codes) - q + 1
+            hashes = np.zeros(max(0, count), dtype=np.int64)
+            for k in range(q):
+                hashes = hashes * 31 + codes[k:k + count]
+            blocks.append(np.bincount(hashes % self.buckets, minlength=self.buckets))
+        return np.concatenate(blocks).astype(np.int16)
+        
+    def add(self, term: str) -> int:
+        """
+        Append a term.
+        
+        Returns:
+            Position of the term in the filter
+        """
+        if self.size == len(self._lengths):
+            self._lengths = np.resize(self._lengths, 2 * self.size)
+            self._signatures = np.resize(self._signatures, (2 * self.size, self._signatures.shape[1]))
+        self._lengths[self.size] = len(term)
+        self._signatures[self.size] = self.signature(term)
+        self.size += 1
+        return self.size - 1
+        
+    def add_many(self, terms: Iterable[str]):
+        """Append terms in order."""
+        for term in terms:
+            self.add(term)
+            
+    def candidates(self, term: str, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Return positions of terms that may be within max_distance of term.
+        
+        Args:
+            term: Query term
+            positions: Restrict the test to these positions (all when None)
+            
+        Returns:
+            Ascending array of surviving positions
+        """
+        if positions is None:
+            positions = np.arange(self.size)
+        if not len(positions):
+            return positions
+            
+        # Length band first; it is the cheapest test and removes the most
+        lengths = self._lengths[positions]
+        positions = positions[np.abs(lengths - len(term)) <= self.max_distance]
+        if not len(positions):
+            return positions
+            
+        diff = np.abs(
+            self._signatures[positions].astype(np.int32) - self.signature(term).astype(np.int32)
+        )
+        l1 = diff.reshape(len(positions), len(self.qs), self.buckets).sum(axis=2)
+        return positions[(l1 <= self._limits).all(axis=1)]
+        
+    def __len__(self) -> int:
+        return self.size
\ No newline at end of file
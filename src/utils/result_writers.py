@@ -0,0 +1,225 @@
+import csv
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+from openpyxl import Workbook
+
+# Check name -> result key flattened into its own column
+CHECK_FLAGS = (
+    ("syntax", "is_valid"),
+    ("domain", "is_valid"),
+    ("spam", "is_suspicious"),
+    ("spam", "risk_score"),
+    ("disposable", "is_disposable"),
+    ("smtp", "is_valid"),
+    ("reputation", "blacklisted"),
+    ("duplicate", "is_duplicate"),
+    ("typo", "has_typos"),
+)
+
+# Fixed column order of flattened results, independent of which checks ran
+RESULT_COLUMNS = (
+    ["email", "is_valid", "score", "issues", "suggestions"]
+    + [f"{check}_{key}" for check, key in CHECK_FLAGS]
+    + ["checks"]
+)
+
+def flatten_result(result: Dict) -> Dict[str, Any]:
+    """
+    Flatten a validation result into the fixed RESULT_COLUMNS schema.
+    
+    Lists are joined with '|', per-check flags get their own columns (None
+    when the check did not run) and the full checks dict is kept as JSON.
+    
+    Args:
+        result: Validation result
+        
+    Returns:
+        Dict with exactly the RESULT_COLUMNS keys
+    """
+    checks = result.get("checks") or {}
+    row = {
+        "email": result.get("email"),
+        "is_valid": result.get("is_valid"),
+        "score": result.get("score"),
+        "issues": "|".join(result.get("issues") or []),
+        "suggestions": "|".join(result.get("suggestions") or []),
+    }
+    for check, key in CHECK_FLAGS:
+        value = (checks.get(check) or {}).get(key)
+        row[f"{check}_{key}"] = value
+    row["checks"] = json.dumps(checks, default=str)
+    return row
+
+class ResultWriter(ABC):
+    """
+    Append-only writer that buffers results and flushes them in blocks.
+    
+    Results can be written as they are produced, so exports never need the
+    whole result set in memory. Use as a context manager or call close().
+    Subclasses implement _write_block() and _close() for their format.
+    """
+    
+    def __init__(self, path: str, buffer_size: int = 10000):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.buffer_size = max(1, buffer_size)
+        self.written = 0
+        self._buffer: List[Dict] = []
+        self._closed = False
+        
+    def write(self, result: Dict):
+        """Buffer one result, flushing when the buffer is full."""
+        self._buffer.append(result)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+            
+    def write_many(self, results: Iterable[Dict]):
+        """Buffer results from any iterable, flushing as the buffer fills."""
+        for result in results:
+            self.write(result)
+            
+    def flush(self):
+        """Write the buffered results as one block."""
+        if not self._buffer:
+            return
+        self._write_block(self._buffer)
+        self.written += len(self._buffer)
+        self._buffer = []
+        
+    def close(self):
+        """Flush remaining results and finalize the file."""
+        if self._closed:
+            return
+        self.flush()
+        self._close()
+        self._closed = True
+        
+    @abstractmethod
+    def _write_block(self, results: List[Dict]):
+        """Write one block of results to the file."""
+        
+    @abstractmethod
+    def _close(self):
+        """Finalize and close the file."""
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class CsvResultWriter(ResultWriter):
+    """Writes flattened results to CSV."""
+    
+    def __init__(self, path: str, buffer_size: int = 10000):
+        super().__init__(path, buffer_size)
+        self._file = open(self.path, 'w', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=RESULT_COLUMNS)
+        self._writer.writeheader()
+        
+    def _write_block(self, results: List[Dict]):
+        self._writer.writerows(flatten_result(result) for result in results)
+        self._file.flush()
+        
+    def _close(self):
+        self._file.close()
+
+class NdjsonResultWriter(ResultWriter):
+    """Writes results as newline-delimited JSON, keeping nested checks."""
+    
+    def __init__(self, path: str, buffer_size: int = 10000):
+        super().__init__(path, buffer_size)
+        self._file = open(self.path, 'w')
+        
+    def _write_block(self, results: List[Dict]):
+        self._file.writelines(json.dumps(result, default=str) + "\n" for result in results)
+        self._file.flush()
+        
+    def _close(self):
+        self._file.close()
+
+class ParquetResultWriter(ResultWriter):
+    """Writes flattened results to Parquet, one row group per flushed block."""
+    
+    def __init__(self, path: str, buffer_size: int = 100000):
+        super().__init__(path, buffer_size)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow; install it with "
+                "pip install -e .[parquet]"
+            ) from e
+            
+        self._pa = pa
+        types = {
+            "email": pa.string(),
+            "score": pa.int64(),
+            "issues": pa.string(),
+            "suggestions": pa.string(),
+            "spam_risk_score": pa.float64(),
+            "checks": pa.string()
+        }
+        # Every other column is a boolean flag
+        self._schema = pa.schema([
+            (column, types.get(column, pa.bool_())) for column in RESULT_COLUMNS
+        ])
+        self._writer = pq.ParquetWriter(str(self.path), self._schema)
+        
+    def _write_block(self, results: List[Dict]):
+        rows = [flatten_result(result) for result in results]
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        self._writer.write_table(table, row_group_size=len(rows))
+        
+    def _close(self):
+        self._writer.close()
+
+class XlsxResultWriter(ResultWriter):
+    """Writes flattened results to xlsx using openpyxl's write-only mode."""
+    
+    def __init__(self, path: str, buffer_size: int = 10000):
+        super().__init__(path, buffer_size)
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("Results")
+        self._sheet.append(RESULT_COLUMNS)
+        
+    def _write_block(self, results: List[Dict]):
+        for result in results:
+            row = flatten_result(result)
+            self._sheet.append([row[column] for column in RESULT_COLUMNS])
+            
+    def _close(self):
+        self._workbook.save(self.path)
+
+WRITERS = {
+    '.csv': CsvResultWriter,
+    '.ndjson': NdjsonResultWriter,
+    '.jsonl': NdjsonResultWriter,
+    '.parquet': ParquetResultWriter,
+    '.xlsx': XlsxResultWriter,
+}
+
+def open_result_writer(path: str, buffer_size: Optional[int] = None) -> ResultWriter:
+    """
+    Open the streaming writer matching a file extension.
+    
+    Args:
+        path: Output file path
+        buffer_size: Results per flushed block (writer default when None)
+        
+    Returns:
+        Result writer
+        
+    Raises:
+        ValueError: If the format has no streaming writer
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in WRITERS:
+        raise ValueError(f"Unsupported export format: {suffix}")
+    if buffer_size is None:
+        return WRITERS[suffix](path)
+    return WRITERS[suffix](path, buffer_size)
\ No newline at end of file
@@ -3,12 +3,17 @@ from typing import Dict, List
 from collections import defaultdict
 import json
 from datetime import datetime
+import numpy as np
+from .domain_table import get_domain_table
 
 class StatsCollector:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.stats = defaultdict(int)
-        self.domain_stats = defaultdict(lambda: defaultdict(int))
+        # Per-domain counts, indexed by domain table ID
+        self.domains = get_domain_table()
+        self._domain_totals = np.zeros(1024, dtype=np.int64)
+        self._domain_valid = np.zeros(1024, dtype=np.int64)
         
     def collect_result(self, result: Dict):
         """
@@ -38,10 +43,13 @@ class StatsCollector:
                     self.stats["catchall"] += 1
                     
             # Collect domain statistics
-            if "@" in result["email"]:
-                domain = result["email"].split("@")[1]
-                self.domain_stats[domain]["total"] += 1
-                self.domain_stats[domain]["valid" if result.get("valid") else "invalid"] += 1
+            domain_id = self.domains.id_of(result["email"])
+            if domain_id:
+                if domain_id >= len(self._domain_totals):
+                    self._grow(domain_id + 1)
+                self._domain_totals[domain_id] += 1
+                if result.get("valid"):
+                    self._domain_valid[domain_id] += 1
                 
         except Exception as e:
             self.logger.error(f"Error collecting stats: {str(e)}")
@@ -57,13 +65,34 @@ class StatsCollector:
                     "disposable": self.stats["disposable"],
                     "catchall": self.stats["catchall"]
                 },
-                "top_domains": sorted(
-                    self.domain_stats.items(),
-                    key=lambda x: x[1]["total"],
-                    reverse=True
-                )[:10]
+                "top_domains": [
+                    (domain, self._domain_counts(self.domains.intern(domain)))
+                    for domain, _ in self.domains.top_domains(self._domain_totals, 10)
+                ]
             }
             
         except Exception as e:
             self.logger.error(f"Error generating summary: {str(e)}")
-            return {}
\ No newline at end of file
+            return {}
+            
+    @property
+    def domain_stats(self) -> Dict[str, Dict[str, int]]:
+        """Total, valid and invalid counts per domain."""
+        return {
+            self.domains.domain(domain_id): self._domain_counts(domain_id)
+            for domain_id in np.flatnonzero(self._domain_totals)
+        }
+        
+    def _domain_counts(self, domain_id: int) -> Dict[str, int]:
+        """Return the counts of one domain."""
+        total = int(self._domain_totals[domain_id])
+        valid = int(self._domain_valid[domain_id])
+        return {"total": total, "valid": valid, "invalid": total - valid}
+        
+    def _grow(self, size: int):
+        """Make room for domain IDs below size."""
+        size = max(size, 2 * len(self._domain_totals))
+        for name in ("_domain_totals", "_domain_valid"):
+            counts = np.zeros(size, dtype=np.int64)
+            counts[:len(getattr(self, name))] = getattr(self, name)
+            setattr(self, name, counts)
\ No newline at end of file
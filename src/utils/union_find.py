@@ -0,0 +1,49 @@
+from typing import Dict, Iterable, List, Tuple
+
+class UnionFind:
+    """Disjoint-set forest with path halving and union by size."""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+        
+    def find(self, item: int) -> int:
+        """Return the representative of an item's set."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+        
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets of two items.
+        
+        Returns:
+            False if they were already in the same set
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+        
+    def union_all(self, edges: Iterable[Tuple[int, int]]):
+        """Merge the sets joined by each edge."""
+        for a, b in edges:
+            self.union(a, b)
+            
+    def components(self, min_size: int = 1) -> List[List[int]]:
+        """
+        Return the sets with at least min_size items.
+        
+        Returns:
+            Lists of items, each ascending, ordered by their smallest item
+        """
+        groups: Dict[int, List[int]] = {}
+        for item in range(len(self.parent)):
+            groups.setdefault(self.find(item), []).append(item)
+        return [group for group in groups.values() if len(group) >= min_size]
\ No newline at end of file
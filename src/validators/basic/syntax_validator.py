@@ -1,7 +1,66 @@
 import logging
 import re
 from email.utils import parseaddr
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+class SyntaxIssue:
+    """Syntax issue bits, combined into one bitmask per address."""
+    MISSING_AT = 1
+    INVALID_FORMAT = 2
+    TOO_LONG = 4
+    LOCAL_TOO_LONG = 8
+    LOCAL_LEADING_DOT = 16
+    LOCAL_TRAILING_DOT = 32
+    LOCAL_CONSECUTIVE_DOTS = 64
+    DOMAIN_LEADING_HYPHEN = 128
+    DOMAIN_TRAILING_HYPHEN = 256
+    DOMAIN_CONSECUTIVE_DOTS = 512
+    STRICT_FORMAT = 1024
+    ERROR = 2048
+
+# Human-readable issues, in the order they are reported
+ISSUE_MESSAGES: Dict[int, str] = {
+    SyntaxIssue.MISSING_AT: "Missing @ symbol",
+    SyntaxIssue.INVALID_FORMAT: "Invalid email format",
+    SyntaxIssue.TOO_LONG: "Email too long (max 254 chars)",
+    SyntaxIssue.LOCAL_TOO_LONG: "Local part too long (max 64 chars)",
+    SyntaxIssue.LOCAL_LEADING_DOT: "Local part cannot start with dot",
+    SyntaxIssue.LOCAL_TRAILING_DOT: "Local part cannot end with dot",
+    SyntaxIssue.LOCAL_CONSECUTIVE_DOTS: "Local part cannot contain consecutive dots",
+    SyntaxIssue.DOMAIN_LEADING_HYPHEN: "Domain cannot start with hyphen",
+    SyntaxIssue.DOMAIN_TRAILING_HYPHEN: "Domain cannot end with hyphen",
+    SyntaxIssue.DOMAIN_CONSECUTIVE_DOTS: "Domain cannot contain consecutive dots",
+    SyntaxIssue.STRICT_FORMAT: "Failed strict format validation",
+    SyntaxIssue.ERROR: "Error during validation",
+}
+
+def issue_messages(mask: int) -> List[str]:
+    """Expand an issue bitmask into the human-readable issues."""
+    return [message for issue, message in ISSUE_MESSAGES.items() if mask & issue]
+
+@dataclass
+class SyntaxBatchResult:
+    """Syntax results for many addresses, as arrays aligned with the input."""
+    is_valid: np.ndarray
+    issues: np.ndarray
+    normalized: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.is_valid)
+
+    def issues_of(self, position: int) -> List[str]:
+        """Return the human-readable issues of one address."""
+        return issue_messages(int(self.issues[position]))
+
+    def result(self, position: int) -> Dict[str, any]:
+        """Return the result of one address in the format of validate()."""
+        return {
+            "is_valid": bool(self.is_valid[position]),
+            "issues": self.issues_of(position),
+            "normalized": self.normalized[position]
+        }
 
 class SyntaxValidator:
     def __init__(self):
@@ -15,70 +74,105 @@ class SyntaxValidator:
             \.                         # Dot before TLD
             [a-zA-Z]{2,}$             # TLD
         """, re.VERBOSE)
+        # Accepts exactly the addresses that pass every check in _diagnose
+        # and that parseaddr returns unchanged
+        self.fast_regex = re.compile(r"""
+            (?!.*\.\.)                 # No consecutive dots anywhere
+            (?!\.)                     # No dot at start
+            [a-zA-Z0-9._%+-]{1,64}     # Local part, at most 64 chars
+            (?<!\.)                    # No dot at end of local part
+            @
+            (?![-.])                   # No dot or hyphen after @
+            [a-zA-Z0-9.-]+
+            \.
+            [a-zA-Z]{2,}               # TLD
+        """, re.VERBOSE)
 
-    def validate(self, email: str) -> Dict[str, any]:
+    def validate(self, email: str, diagnostics: bool = False) -> Dict[str, any]:
         """
         Performs comprehensive syntax validation.
         
+        Well-formed addresses are accepted with a single match; the full
+        check-by-check breakdown runs only for addresses that fail it, or
+        for every address when diagnostics is True. Both give the same
+        results.
+        
         Args:
             email: Email to validate
+            diagnostics: Always run the full breakdown
             
         Returns:
             Dict containing validation results
         """
         try:
-            email = email.strip()
-            results = {
+            if not diagnostics:
+                stripped = email.strip()
+                if len(stripped) <= 254 and self.fast_regex.fullmatch(stripped):
+                    return {
+                        "is_valid": True,
+                        "issues": [],
+                        "normalized": stripped.lower()
+                    }
+            return self._diagnose(email)
+
+        except Exception as e:
+            self.logger.error(f"Error validating syntax for {email}: {str(e)}")
+            return {
                 "is_valid": False,
-                "issues": [],
+                "issues": ["Error during validation"],
                 "normalized": None
             }
 
-            # Basic format check
-            if not '@' in email:
-                results["issues"].append("Missing @ symbol")
-                return results
-
-            # Parse email address
-            name, addr = parseaddr(email)
-            if not addr:
-                results["issues"].append("Invalid email format")
-                return results
-
-            local_part, domain = addr.split('@')
-
-            # Length checks
-            if len(email) > 254:
-                results["issues"].append("Email too long (max 254 chars)")
-            if len(local_part) > 64:
-                results["issues"].append("Local part too long (max 64 chars)")
-
-            # Local part checks
-            if local_part.startswith('.'):
-                results["issues"].append("Local part cannot start with dot")
-            if local_part.endswith('.'):
-                results["issues"].append("Local part cannot end with dot")
-            if '..' in local_part:
-                results["issues"].append("Local part cannot contain consecutive dots")
-
-            # Domain checks
-            if domain.startswith('-'):
-                results["issues"].append("Domain cannot start with hyphen")
-            if domain.endswith('-'):
-                results["issues"].append("Domain cannot end with hyphen")
-            if '..' in domain:
-                results["issues"].append("Domain cannot contain consecutive dots")
-
-            # Strict regex check
-            if not self.email_regex.match(addr):
-                results["issues"].append("Failed strict format validation")
-
-            # Set final results
-            results["is_valid"] = len(results["issues"]) == 0
-            if results["is_valid"]:
-                results["normalized"] = addr.lower()
-
-            return results
+    def validate_many(self, emails: Sequence[str]) -> SyntaxBatchResult:
+        """
+        Validate the syntax of many addresses at once.
+        
+        Gives the same verdicts as validate() without building a dict per
+        address: issues are kept as SyntaxIssue bitmasks, expanded only on
+        request.
+        
+        Args:
+            emails: Sequence or NumPy array of addresses
+            
+        Returns:
+            SyntaxBatchResult with a bool validity array, a uint16 issue
+            bitmask array and an object array of normalized addresses (None
+            where invalid)
+        """
+        if isinstance(emails, np.ndarray):
+            emails = emails.tolist()
+        match = self.fast_regex.fullmatch
+        masks = []
+        normalized = []
+
+        for email in emails:
+            try:
+                stripped = email.strip()
+                if len(stripped) <= 254 and match(stripped):
+                    masks.append(0)
+                    normalized.append(stripped.lower())
+                    continue
+                mask, addr = self._issue_mask(email)
+            except Exception as e:
+                self.logger.error(f"Error validating syntax for {email}: {str(e)}")
+                mask, addr = SyntaxIssue.ERROR, None
+            masks.append(mask)
+            normalized.append(None if mask else addr.lower())
+
+        issues = np.array(masks, dtype=np.uint16)
+        normalized_array = np.empty(len(normalized), dtype=object)
+        normalized_array[:] = normalized
+        return SyntaxBatchResult(is_valid=issues == 0, issues=issues, normalized=normalized_array)
+
+    def _diagnose(self, email: str) -> Dict[str, any]:
+        """Run every syntax check and collect the issues found."""
+        try:
+            mask, addr = self._issue_mask(email)
+            return {
+                "is_valid": mask == 0,
+                "issues": issue_messages(mask),
+                "normalized": addr.lower() if mask == 0 else None
+            }
 
         except Exception as e:
             self.logger.error(f"Error validating syntax for {email}: {str(e)}")
@@ -86,4 +180,53 @@ class SyntaxValidator:
                 "is_valid": False,
                 "issues": ["Error during validation"],
                 "normalized": None
-            }
\ No newline at end of file
+            }
+
+    def _issue_mask(self, email: str) -> Tuple[int, Optional[str]]:
+        """
+        Run every syntax check.
+        
+        Returns:
+            Tuple of (SyntaxIssue bitmask, parsed address or None)
+        """
+        email = email.strip()
+
+        # Basic format check
+        if not '@' in email:
+            return SyntaxIssue.MISSING_AT, None
+
+        # Parse email address
+        name, addr = parseaddr(email)
+        if not addr:
+            return SyntaxIssue.INVALID_FORMAT, None
+
+        local_part, domain = addr.split('@')
+        mask = 0
+
+        # Length checks
+        if len(email) > 254:
+            mask |= SyntaxIssue.TOO_LONG
+        if len(local_part) > 64:
+            mask |= SyntaxIssue.LOCAL_TOO_LONG
+
+        # Local part checks
+        if local_part.startswith('.'):
+            mask |= SyntaxIssue.LOCAL_LEADING_DOT
+        if local_part.endswith('.'):
+            mask |= SyntaxIssue.LOCAL_TRAILING_DOT
+        if '..' in local_part:
+            mask |= SyntaxIssue.LOCAL_CONSECUTIVE_DOTS
+
+        # Domain checks
+        if domain.startswith('-'):
+            mask |= SyntaxIssue.DOMAIN_LEADING_HYPHEN
+        if domain.endswith('-'):
+            mask |= SyntaxIssue.DOMAIN_TRAILING_HYPHEN
+        if '..' in domain:
+            mask |= SyntaxIssue.DOMAIN_CONSECUTIVE_DOTS
+
+        # Strict regex check
+        if not self.email_regex.match(addr):
+            mask |= SyntaxIssue.STRICT_FORMAT
+
+        return mask, addr
\ No newline at end of file
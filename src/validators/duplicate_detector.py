@@ -1,12 +1,15 @@
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 import logging
 from Levenshtein import distance
+from ..utils.qgram_filter import QGramFilter
 
 class DuplicateDetector:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.seen_emails: Set[str] = set()
         self.similar_threshold = 2  # Levenshtein distance threshold
+        # Domain -> (prefilter over local parts, seen emails in filter order)
+        self.seen_by_domain: Dict[str, Tuple[QGramFilter, List[str]]] = {}
         
     def check_duplicate(self, email: str) -> Dict[str, bool]:
         """
@@ -29,8 +32,8 @@ class DuplicateDetector:
                     "reason": "Exact duplicate found"
                 }
                 
-            # Check for similar emails (typos, etc.)
-            for seen_email in self.seen_emails:
+            # Check for similar emails (typos, etc.) among prefilter survivors
+            for seen_email in self._candidates(email):
                 if self._is_similar(email, seen_email):
                     return {
                         "is_duplicate": True,
@@ -40,12 +43,26 @@ class DuplicateDetector:
                     
             # Add email to seen set
             self.seen_emails.add(email)
+            local_part, domain = email.split('@')
+            qgram_filter, domain_emails = self.seen_by_domain.setdefault(
+                domain, (QGramFilter(self.similar_threshold), [])
+            )
+            qgram_filter.add(local_part)
+            domain_emails.append(email)
             return {"is_duplicate": False, "type": None, "reason": None}
             
         except Exception as e:
             self.logger.error(f"Error checking duplicates for {email}: {str(e)}")
             return {"is_duplicate": False, "type": None, "reason": "Error during check"}
             
+    def _candidates(self, email: str) -> List[str]:
+        """Return seen emails of the same domain that pass the q-gram prefilter."""
+        local_part, domain = email.split('@')
+        if domain not in self.seen_by_domain:
+            return []
+        qgram_filter, domain_emails = self.seen_by_domain[domain]
+        return [domain_emails[i] for i in qgram_filter.candidates(local_part)]
+            
     def _is_similar(self, email1: str, email2: str) -> bool:
         """Check if two emails are similar based on Levenshtein distance."""
         if email1 == email2:
@@ -4,36 +4,70 @@ from .validator_factory import ValidatorFactory
 from ..cache.cache_manager import CacheManager
 from ..cache.cache_key_builder import CacheKeyBuilder
 
+DEFAULT_VALIDATION_OPTIONS = {
+    "check_syntax": True,
+    "check_domain": True,
+    "check_spam": True,
+    "check_disposable": True,
+    "check_smtp": True,
+    "check_reputation": True,
+    "check_duplicates": True,
+    "check_typos": True
+}
+
+# Profile that only runs checks needing no network access
+OFFLINE_VALIDATION_OPTIONS = {
+    **DEFAULT_VALIDATION_OPTIONS,
+    "check_domain": False,
+    "check_disposable": False,
+    "check_smtp": False,
+    "check_reputation": False
+}
+
 class EmailValidator:
     """Main email validation coordinator with caching."""
     
-    def __init__(self, cache_enabled: bool = True):
+    def __init__(self, cache_enabled: bool = True, duplicate_options: Optional[Dict] = None):
         self.logger = logging.getLogger(__name__)
         self.cache = CacheManager() if cache_enabled else None
         self.cache_key_builder = CacheKeyBuilder()
         
-        # Initialize validators
+        # Initialize validators; duplicate_options configures the duplicate
+        # detector, e.g. {"probabilistic": True, "max_memory_mb": 256}
         self.syntax_validator = ValidatorFactory.create('syntax')
         self.domain_validator = ValidatorFactory.create('domain')
         self.spam_detector = ValidatorFactory.create('spam')
         self.disposable_detector = ValidatorFactory.create('disposable')
         self.smtp_validator = ValidatorFactory.create('smtp')
         self.reputation_validator = ValidatorFactory.create('reputation')
-        self.duplicate_detector = ValidatorFactory.create('duplicate')
+        self.duplicate_detector = ValidatorFactory.create(
+            'duplicate', **(duplicate_options or {})
+        )
         self.typo_detector = ValidatorFactory.create('typo')
 
-    async def validate(self, email: str, validation_options: Optional[Dict] = None) -> Dict:
+    async def validate(
+        self,
+        email: str,
+        validation_options: Optional[Dict] = None,
+        precomputed_checks: Optional[Dict[str, Dict]] = None
+    ) -> Dict:
         """
         Perform comprehensive email validation with caching.
         
         Args:
             email: Email to validate
             validation_options: Optional validation configuration
+            precomputed_checks: Optional check results keyed by check name
+                (e.g. from validate_domain or a batch worker process) that
+                are used instead of running those checks again
             
         Returns:
             Dict containing validation results
         """
         try:
+            precomputed = precomputed_checks or {}
+            cache_key = None
+
             # Check cache first if enabled
             if self.cache:
                 cache_key = self.cache_key_builder.build_validation_key(
@@ -44,16 +78,7 @@ class EmailValidator:
                     self.logger.info(f"Cache hit for email: {email}")
                     return cached_result
 
-            options = validation_options or {
-                "check_syntax": True,
-                "check_domain": True,
-                "check_spam": True,
-                "check_disposable": True,
-                "check_smtp": True,
-                "check_reputation": True,
-                "check_duplicates": True,
-                "check_typos": True
-            }
+            options = validation_options or DEFAULT_VALIDATION_OPTIONS
 
             results = {
                 "email": email,
@@ -65,7 +90,9 @@ class EmailValidator:
             }
 
             # Basic syntax check (always performed)
-            syntax_result = self.syntax_validator.validate(email)
+            syntax_result = (
+                precomputed.get("syntax") or self.syntax_validator.validate(email)
+            )
             results["checks"]["syntax"] = syntax_result
             if not syntax_result["is_valid"]:
                 results["issues"].extend(syntax_result["issues"])
@@ -75,12 +102,9 @@ class EmailValidator:
             # Domain validation with caching
             if options.get("check_domain"):
                 domain = email.split('@')[1]
-                mx_cache_key = self.cache_key_builder.build_mx_key(domain)
-                
-                domain_result = await self.cache.get(mx_cache_key)
-                if not domain_result:
-                    domain_result = await self.domain_validator.validate(domain)
-                    await self.cache.set(mx_cache_key, domain_result, ttl=3600)
+                domain_result = (
+                    precomputed.get("domain") or await self._check_domain(domain)
+                )
                     
                 results["checks"]["domain"] = domain_result
                 if not domain_result["is_valid"]:
@@ -89,7 +113,9 @@ class EmailValidator:
 
             # Spam detection
             if options.get("check_spam"):
-                spam_result = self.spam_detector.analyze(email)
+                spam_result = (
+                    precomputed.get("spam") or self.spam_detector.analyze(email)
+                )
                 results["checks"]["spam"] = spam_result
                 if spam_result["is_suspicious"]:
                     results["issues"].extend(spam_result["issues"])
@@ -97,7 +123,10 @@ class EmailValidator:
 
             # Disposable email check
             if options.get("check_disposable"):
-                disposable_result = await self.disposable_detector.check(email)
+                disposable_result = (
+                    precomputed.get("disposable")
+                    or await self.disposable_detector.check(email)
+                )
                 results["checks"]["disposable"] = disposable_result
                 if disposable_result["is_disposable"]:
                     results["issues"].append("Disposable email detected")
@@ -114,12 +143,10 @@ class EmailValidator:
             # Reputation check with caching
             if options.get("check_reputation"):
                 domain = email.split('@')[1]
-                rep_cache_key = self.cache_key_builder.build_reputation_key(domain)
-                
-                reputation_result = await self.cache.get(rep_cache_key)
-                if not reputation_result:
-                    reputation_result = await self.reputation_validator.check_reputation(email)
-                    await self.cache.set(rep_cache_key, reputation_result, ttl=3600)
+                reputation_result = (
+                    precomputed.get("reputation")
+                    or await self._check_reputation(domain, email)
+                )
                     
                 results["checks"]["reputation"] = reputation_result
                 if reputation_result["blacklisted"]:
@@ -128,7 +155,9 @@ class EmailValidator:
 
             # Duplicate check
             if options.get("check_duplicates"):
-                duplicate_result = self.duplicate_detector.check(email)
+                duplicate_result = (
+                    precomputed.get("duplicate") or self.duplicate_detector.check(email)
+                )
                 results["checks"]["duplicate"] = duplicate_result
                 if duplicate_result["is_duplicate"]:
                     results["issues"].extend(duplicate_result["issues"])
@@ -136,7 +165,9 @@ class EmailValidator:
 
             # Typo detection
             if options.get("check_typos"):
-                typo_result = self.typo_detector.check(email)
+                typo_result = (
+                    precomputed.get("typo") or self.typo_detector.check(email)
+                )
                 results["checks"]["typo"] = typo_result
                 if typo_result["has_typos"]:
                     results["issues"].extend(typo_result["issues"])
@@ -156,6 +187,68 @@ class EmailValidator:
                 "suggestions": []
             }
 
+    async def validate_domain(
+        self,
+        domain: str,
+        validation_options: Optional[Dict] = None,
+        email: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Run the domain-scoped checks for a domain once.
+        
+        Batch callers use this to share one DNS/registration and reputation
+        lookup across every address of a domain, passing the result to
+        validate() as precomputed_checks.
+        
+        Args:
+            domain: Domain to check
+            validation_options: Optional validation configuration
+            email: Representative address for checks that take an email
+            
+        Returns:
+            Dict mapping check name to its result
+        """
+        options = validation_options or DEFAULT_VALIDATION_OPTIONS
+        checks = {}
+
+        try:
+            if options.get("check_domain"):
+                checks["domain"] = await self._check_domain(domain)
+
+            if options.get("check_reputation"):
+                checks["reputation"] = await self._check_reputation(
+                    domain, email or f"postmaster@{domain}"
+                )
+
+        except Exception as e:
+            self.logger.error(f"Error validating domain {domain}: {str(e)}")
+
+        return checks
+
+    async def _check_domain(self, domain: str) -> Dict:
+        """Validate a domain, consulting the cache when enabled."""
+        mx_cache_key = self.cache_key_builder.build_mx_key(domain)
+
+        domain_result = await self.cache.get(mx_cache_key) if self.cache else None
+        if not domain_result:
+            domain_result = await self.domain_validator.validate(domain)
+            if self.cache:
+                await self.cache.set(mx_cache_key, domain_result, ttl=3600)
+
+        return domain_result
+
+    async def _check_reputation(self, domain: str, email: str) -> Dict:
+        """Check domain reputation, consulting the cache when enabled."""
+        rep_cache_key = self.cache_key_builder.build_reputation_key(domain)
+
+        reputation_result = await self.cache.get(rep_cache_key) if self.cache else None
+        if not reputation_result:
+            reputation_result = await self.reputation_validator.check_reputation(email)
+            if self.cache:
+                await self.cache.set(rep_cache_key, reputation_result, ttl=3600)
+
+        return reputation_result
+
     async def _finalize_results(self, results: Dict, cache_key: Optional[str] = None) -> Dict:
         """Finalize validation results and cache if enabled."""
         # Ensure score is within bounds
@@ -0,0 +1,178 @@
+import os
+import json
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from tld import get_tld
+from ...utils.deletion_index import DeletionIndex
+from .keyboard_distance import KeyboardDistance
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), '../../../data/common_domains.json')
+
+class DomainSuggester:
+    """
+    Suggests known mail domains close to a mistyped one.
+    
+    The corpus is a list of domains ordered by popularity, most popular
+    first. Domains are compared by name (everything before the public
+    suffix) within the same suffix, so "ibm.com" is measured against
+    "aim" and the other .com names rather than as a whole string. Every
+    name is indexed by its deletion variants (SymSpell), so a lookup
+    costs a fixed number of hash probes however large the corpus is.
+    Candidates are scored together with the keyboard-weighted distance
+    (KeyboardDistance) and ranked by distance, then popularity.
+    
+    Short names are real domains more often than typos, so the allowed
+    distance scales with the name: nothing is suggested for names shorter
+    than min_length, at most one edit is allowed below short_length and
+    max_distance from there on.
+    
+    A name the corpus has under other suffixes is also matched on its
+    suffix, whether or not the typed suffix is a public one (gmail.co,
+    gmail.om, gmail.con): suffixes within one edit match, and a suffix
+    that is the start of a corpus suffix missing at most two characters
+    (gmail.c, yahoo.co) counts as a single adjacent-key slip, so the most
+    popular completion ranks first.
+    
+    The index finds every name within max_distance plain edits; names
+    only within the cutoff once keyboard weights apply (e.g. three
+    neighbouring-key slips) are found when they share a deletion variant.
+    """
+    
+    def __init__(
+        self,
+        domains: Sequence[str],
+        max_distance: int = 2,
+        keyboard: Optional[KeyboardDistance] = None,
+        min_length: int = 4,
+        short_length: int = 6
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.max_distance = max_distance
+        self.keyboard = keyboard or KeyboardDistance()
+        self.min_length = min_length
+        self.short_length = short_length
+        self.domains: List[str] = []
+        self.ranks: Dict[str, int] = {}
+        self.index = DeletionIndex(max_distance)
+        self._names: List[str] = []
+        self._suffixes: List[str] = []
+        self._by_name: Dict[str, List[int]] = {}
+        for domain in domains:
+            domain = domain.strip().lower()
+            if domain and domain not in self.ranks:
+                key = len(self.domains)
+                name, suffix, _ = self.split(domain)
+                self.ranks[domain] = key
+                self.index.add(key, name)
+                self.domains.append(domain)
+                self._names.append(name)
+                self._suffixes.append(suffix)
+                self._by_name.setdefault(name, []).append(key)
+        self._suffix_array = np.array(self._suffixes, dtype=object)
+        self._codes, self._lengths = self.keyboard.encode(self._names)
+        
+    @staticmethod
+    def split(domain: str) -> Tuple[str, str, bool]:
+        """
+        Split a domain into its name and public suffix.
+        
+        Args:
+            domain: Lowercased domain
+            
+        Returns:
+            (name, suffix, known): known is False when the domain has no
+            public suffix, in which case the suffix is the last label
+        """
+        suffix = get_tld(domain, fix_protocol=True, fail_silently=True)
+        if suffix and len(suffix) < len(domain):
+            return domain[:-len(suffix) - 1], suffix, True
+        name, _, suffix = domain.rpartition('.')
+        return name, suffix, False
+        
+    def cutoff(self, name: str) -> float:
+        """Return the largest distance allowed for suggestions to a name."""
+        if len(name) < self.min_length:
+            return -1
+        if len(name) < self.short_length:
+            return min(1, self.max_distance)
+        return self.max_distance
+                
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_CORPUS, max_distance: int = 2) -> "DomainSuggester":
+        """
+        Load a corpus from a JSON list of domains ordered by popularity.
+        
+        Args:
+            path: Corpus file
+            max_distance: Maximum edit distance of suggestions
+            
+        Returns:
+            DomainSuggester over the corpus (empty if the file is missing)
+        """
+        try:
+            with open(path, 'r') as f:
+                return cls(json.load(f), max_distance)
+        except FileNotFoundError:
+            logging.getLogger(__name__).warning("Common domains file not found, using empty corpus")
+            return cls([], max_distance)
+            
+    def __contains__(self, domain: str) -> bool:
+        return domain in self.ranks
+        
+    def __len__(self) -> int:
+        return len(self.domains)
+        
+    def suggest(self, domain: str, limit: int = 3) -> List[Tuple[str, float]]:
+        """
+        Find known domains close to a domain.
+        
+        Args:
+            domain: Domain to look up (lowercased)
+            limit: Maximum number of suggestions
+            
+        Returns:
+            (domain, distance) pairs, closest then most popular first;
+            empty when the domain is itself known
+        """
+        if domain in self.ranks:
+            return []
+            
+        name, suffix, known = self.split(domain)
+        matches = self._suffix_matches(name, suffix)
+        if known:
+            matches += self._name_matches(name, suffix)
+        matches.sort()
+        return [(self.domains[key], score) for score, key in matches[:limit]]
+            
+    def _name_matches(self, name: str, suffix: str) -> List[Tuple[float, int]]:
+        """Score corpus names close to a name under the same suffix."""
+        keys = np.fromiter(self.index.candidates(name), dtype=np.int64)
+        keys = keys[self._suffix_array[keys] == suffix] if len(keys) else keys
+        if not len(keys):
+            return []
+        scores = self.keyboard.distances(name, self._codes[keys], self._lengths[keys])
+        close = scores <= self.cutoff(name)
+        return [(float(score), int(key)) for score, key in zip(scores[close], keys[close])]
+        
+    def _suffix_matches(self, name: str, suffix: str) -> List[Tuple[float, int]]:
+        """Score the corpus suffixes of a name against a mistyped suffix."""
+        matches = []
+        for key in self._by_name.get(name, []):
+            other = self._suffixes[key]
+            if other.startswith(suffix) and len(other) - len(suffix) <= 2:
+                matches.append((self.keyboard.adjacent_cost, key))
+                continue
+            score = self.keyboard.distance(suffix, other)
+            if score <= 1:
+                matches.append((score, key))
+        return matches
+
+_default: Optional[DomainSuggester] = None
+
+def get_default_suggester() -> DomainSuggester:
+    """Return the suggester over the bundled corpus, built once per process."""
+    global _default
+    if _default is None:
+        _default = DomainSuggester.from_file()
+    return _default
\ No newline at end of file
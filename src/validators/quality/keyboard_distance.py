@@ -0,0 +1,148 @@
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence, Tuple
+import numpy as np
+
+# Key rows of each layout, top to bottom, with the horizontal offset of
+# each row in key widths (the stagger of a standard keyboard)
+LAYOUTS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "qwerty": (
+        ("1234567890-=", 0.0),
+        ("qwertyuiop[]", 0.5),
+        ("asdfghjkl;'", 0.75),
+        ("zxcvbnm,./", 1.25),
+    ),
+    "azerty": (
+        ("1234567890-=", 0.0),
+        ("azertyuiop", 0.5),
+        ("qsdfghjklm", 0.75),
+        ("wxcvbn,;:!", 1.25),
+    ),
+}
+
+# Characters outside ASCII share the last row and column of the cost table
+OTHER = 128
+PADDING = -1
+
+@lru_cache(maxsize=None)
+def substitution_costs(layouts: Tuple[str, ...], adjacent_cost: float) -> np.ndarray:
+    """
+    Build the substitution cost table for a set of keyboard layouts.
+    
+    Args:
+        layouts: Layout names from LAYOUTS
+        adjacent_cost: Cost of replacing a character with one on a
+            neighbouring key in any of the layouts
+            
+    Returns:
+        (OTHER + 1, OTHER + 1) array indexed by character code; 0 on the
+        diagonal, adjacent_cost for neighbouring keys and 1 elsewhere
+    """
+    costs = np.ones((OTHER + 1, OTHER + 1))
+    for name in layouts:
+        positions = {
+            char: (column + offset, row)
+            for row, (keys, offset) in enumerate(LAYOUTS[name])
+            for column, char in enumerate(keys)
+        }
+        for a, (ax, ay) in positions.items():
+            for b, (bx, by) in positions.items():
+                if a != b and abs(ay - by) <= 1 and abs(ax - bx) <= 1:
+                    costs[ord(a), ord(b)] = min(costs[ord(a), ord(b)], adjacent_cost)
+    np.fill_diagonal(costs, 0.0)
+    costs[OTHER, OTHER] = 1.0
+    costs.setflags(write=False)
+    return costs
+
+class KeyboardDistance:
+    """
+    Keyboard-aware weighted edit distance.
+    
+    An optimal-string-alignment (restricted Damerau-Levenshtein) distance in
+    which substituting a character for one on a neighbouring key costs
+    adjacent_cost instead of 1, and swapping two adjacent characters costs
+    transposition_cost, so "gmsil.com" is closer to gmail.com than
+    "gxail.com" is, and "gmial.com" is one edit away rather than two.
+    Neighbours come from the precomputed substitution_costs() table of the
+    configured layouts; a key adjacent in any of them counts.
+    
+    distances() scores one term against many candidates at once: the
+    candidates are encoded into a padded code matrix and the dynamic
+    programme advances one row of the term at a time over all of them, with
+    insertions resolved by a running minimum, so the Python-level work
+    depends only on the term's length.
+    """
+    
+    def __init__(
+        self,
+        layouts: Sequence[str] = ("qwerty", "azerty"),
+        adjacent_cost: float = 0.5,
+        transposition_cost: float = 1.0,
+        indel_cost: float = 1.0
+    ):
+        self.layouts = tuple(layouts)
+        self.adjacent_cost = adjacent_cost
+        self.transposition_cost = transposition_cost
+        self.indel_cost = indel_cost
+        self.costs = substitution_costs(self.layouts, adjacent_cost)
+        
+    @staticmethod
+    def encode(terms: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode terms as a padded matrix of character codes.
+        
+        Args:
+            terms: Terms to encode
+            
+        Returns:
+            (codes, lengths): int32 array of shape (len(terms), longest
+            term) padded with PADDING, and the length of each term
+        """
+        terms = list(terms)
+        lengths = np.array([len(term) for term in terms], dtype=np.int64)
+        codes = np.full((len(terms), int(lengths.max(initial=0))), PADDING, dtype=np.int32)
+        for i, term in enumerate(terms):
+            codes[i, :len(term)] = [ord(char) for char in term]
+        return codes, lengths
+        
+    def distance(self, a: str, b: str) -> float:
+        """Return the weighted distance between two strings."""
+        return float(self.distances(a, *self.encode([b]))[0])
+        
+    def distances(self, term: str, codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Score a term against encoded candidates.
+        
+        Args:
+            term: Term to score
+            codes: Candidate codes, as returned by encode()
+            lengths: Candidate lengths, as returned by encode()
+            
+        Returns:
+            Weighted distance to each candidate
+        """
+        indel = self.indel_cost
+        count, width = codes.shape
+        steps = indel * np.arange(width + 1)
+        cost_index = np.where((codes < 0) | (codes > OTHER), OTHER, codes)
+        
+        before = None
+        previous = np.broadcast_to(steps, (count, width + 1))
+        for i, char in enumerate(term):
+            code = ord(char)
+            substitution = np.where(codes == code, 0.0, self.costs[min(code, OTHER)][cost_index])
+            
+            row = np.empty((count, width + 1))
+            row[:, 0] = (i + 1) * indel
+            np.minimum(previous[:, 1:] + indel, previous[:, :-1] + substitution, out=row[:, 1:])
+            if before is not None and width > 1 and char != term[i - 1]:
+                swapped = (codes[:, :-1] == code) & (codes[:, 1:] == ord(term[i - 1]))
+                np.minimum(
+                    row[:, 2:],
+                    np.where(swapped, before[:, :-2] + self.transposition_cost, np.inf),
+                    out=row[:, 2:]
+                )
+            # Insertions: row[j] = min over k <= j of row[k] + (j - k) * indel
+            row = np.minimum.accumulate(row - steps, axis=1) + steps
+            before, previous = previous, row
+            
+        return previous[np.arange(count), lengths]
\ No newline at end of file
@@ -1,11 +1,39 @@
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 import re
-from Levenshtein import distance
+import numpy as np
+import pandas as pd
+from ...cache.lru_cache import LRUCache
+from .domain_suggester import DomainSuggester, get_default_suggester
+
+DOMAIN_VERDICT_CACHE_SIZE = 50000
+
+_domain_verdicts: Optional[LRUCache] = None
+
+def get_domain_verdict_cache() -> LRUCache:
+    """Return the process-wide cache of domain typo verdicts."""
+    global _domain_verdicts
+    if _domain_verdicts is None:
+        _domain_verdicts = LRUCache(DOMAIN_VERDICT_CACHE_SIZE)
+    return _domain_verdicts
 
 class TypoDetector:
-    def __init__(self):
+    """
+    Detects likely typos in email addresses.
+    
+    Domain verdicts depend only on the domain, so they are memoized in an
+    LRU cache; detectors using the default suggester share the
+    process-wide get_domain_verdict_cache(), so the API and batch
+    validation pay for each domain once. Local part checks run for every
+    address.
+    """
+
+    def __init__(self, suggester: DomainSuggester = None, verdict_cache: LRUCache = None):
         self.logger = logging.getLogger(__name__)
+        self.suggester = suggester or get_default_suggester()
+        if verdict_cache is None:
+            verdict_cache = get_domain_verdict_cache() if suggester is None else LRUCache(DOMAIN_VERDICT_CACHE_SIZE)
+        self.verdict_cache = verdict_cache
         self.common_domains = {
             'gmail.com': ['gmai.com', 'gmial.com', 'gmal.com', 'gmale.com'],
             'yahoo.com': ['yaho.com', 'yahooo.com', 'yahou.com'],
@@ -31,35 +59,7 @@ class TypoDetector:
         try:
             email = email.lower().strip()
             local_part, domain = email.split('@')
-            
-            results = {
-                "has_typos": False,
-                "suggestions": [],
-                "issues": [],
-                "confidence": 0
-            }
-
-            # Check domain typos
-            domain_check = self._check_domain_typos(domain)
-            if domain_check["has_typos"]:
-                results["has_typos"] = True
-                results["suggestions"].extend(
-                    f"{local_part}@{d}" for d in domain_check["suggestions"]
-                )
-                results["confidence"] = max(results["confidence"], domain_check["confidence"])
-                results["issues"].extend(domain_check["issues"])
-
-            # Check local part typos
-            local_check = self._check_local_part_typos(local_part)
-            if local_check["has_typos"]:
-                results["has_typos"] = True
-                results["suggestions"].extend(
-                    f"{s}@{domain}" for s in local_check["suggestions"]
-                )
-                results["confidence"] = max(results["confidence"], local_check["confidence"])
-                results["issues"].extend(local_check["issues"])
-
-            return results
+            return self._combine(local_part, domain, self._check_domain_typos(domain))
 
         except Exception as e:
             self.logger.error(f"Error checking typos for {email}: {str(e)}")
@@ -70,7 +70,75 @@ class TypoDetector:
                 "confidence": 0
             }
 
+    def check_many(self, emails: Sequence[str]) -> List[Dict[str, any]]:
+        """
+        Check many addresses, looking each distinct domain up once.
+        
+        Gives the same results as check() for every address; domains are
+        factorized so the domain verdicts are fetched per unique domain and
+        broadcast back, and only the local part checks run per address.
+        
+        Args:
+            emails: Emails to check
+            
+        Returns:
+            Typo detection results aligned with emails
+        """
+        if not len(emails):
+            return []
+        parts = [email.lower().strip().split('@') for email in emails]
+        domains = np.array([p[1] if len(p) == 2 else None for p in parts], dtype=object)
+        codes, uniques = pd.factorize(domains)
+        verdicts = [self._check_domain_typos(domain) for domain in uniques]
+
+        results = []
+        for i, email in enumerate(emails):
+            if codes[i] >= 0:
+                local_part, domain = parts[i]
+                results.append(self._combine(local_part, domain, verdicts[codes[i]]))
+            else:
+                results.append(self.check(email))
+        return results
+
+    def _combine(self, local_part: str, domain: str, domain_check: Dict[str, any]) -> Dict[str, any]:
+        """Merge a domain verdict with the local part checks of one address."""
+        results = {
+            "has_typos": False,
+            "suggestions": [],
+            "issues": [],
+            "confidence": 0
+        }
+
+        # Check domain typos
+        if domain_check["has_typos"]:
+            results["has_typos"] = True
+            results["suggestions"].extend(
+                f"{local_part}@{d}" for d in domain_check["suggestions"]
+            )
+            results["confidence"] = max(results["confidence"], domain_check["confidence"])
+            results["issues"].extend(domain_check["issues"])
+
+        # Check local part typos
+        local_check = self._check_local_part_typos(local_part)
+        if local_check["has_typos"]:
+            results["has_typos"] = True
+            results["suggestions"].extend(
+                f"{s}@{domain}" for s in local_check["suggestions"]
+            )
+            results["confidence"] = max(results["confidence"], local_check["confidence"])
+            results["issues"].extend(local_check["issues"])
+
+        return results
+
     def _check_domain_typos(self, domain: str) -> Dict[str, any]:
+        """Check for common domain typos, memoized per domain."""
+        results = self.verdict_cache.get(domain)
+        if results is None:
+            results = self._find_domain_typos(domain)
+            self.verdict_cache.set(domain, results)
+        return results
+
+    def _find_domain_typos(self, domain: str) -> Dict[str, any]:
         """Check for common domain typos."""
         results = {
             "has_typos": False,
@@ -79,6 +147,10 @@ class TypoDetector:
             "confidence": 0
         }
 
+        # Known domains are never typos
+        if domain in self.suggester:
+            return results
+
         # Check against known typos
         for correct_domain, typos in self.common_domains.items():
             if domain in typos:
@@ -90,16 +162,16 @@ class TypoDetector:
                 })
                 return results
 
-        # Check for similar domains
-        for correct_domain in self.common_domains.keys():
-            if distance(domain, correct_domain) <= 2:
-                results.update({
-                    "has_typos": True,
-                    "suggestions": [correct_domain],
-                    "issues": [f"Similar to {correct_domain}"],
-                    "confidence": 0.7
-                })
-                return results
+        # Check for similar domains, closest and most popular first
+        matches = self.suggester.suggest(domain)
+        if matches:
+            best = matches[0][0]
+            results.update({
+                "has_typos": True,
+                "suggestions": [match for match, _ in matches],
+                "issues": [f"Similar to {best}"],
+                "confidence": 0.7
+            })
 
         return results
 
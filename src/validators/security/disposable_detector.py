@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 import aiohttp
 import json
 import os
@@ -15,7 +15,7 @@ class DisposableDetector:
         try:
             domains_file = os.path.join(
                 os.path.dirname(__file__), 
-                '../../data/disposable_domains.json'
+                '../../../data/disposable_domains.json'
             )
             with open(domains_file, 'r') as f:
                 self.disposable_domains = set(json.load(f))
@@ -34,6 +34,12 @@ class DisposableDetector:
         """
         try:
             domain = email.split('@')[1].lower()
+
+            # Check against known disposable domains
+            local_result = self.check_local(domain)
+            if local_result:
+                return local_result
+
             results = {
                 "is_disposable": False,
                 "confidence": 0,
@@ -41,13 +47,6 @@ class DisposableDetector:
                 "issues": []
             }
 
-            # Check against known disposable domains
-            if domain in self.disposable_domains:
-                results["is_disposable"] = True
-                results["confidence"] = 1.0
-                results["sources"].append("local_database")
-                return results
-
             # Check external API
             try:
                 async with aiohttp.ClientSession() as session:
@@ -72,4 +71,25 @@ class DisposableDetector:
                 "confidence": 0,
                 "sources": [],
                 "issues": [f"Check failed: {str(e)}"]
-            }
\ No newline at end of file
+            }
+
+    def check_local(self, domain: str) -> Optional[Dict[str, any]]:
+        """
+        Check a domain against the local disposable domain list only.
+        
+        Args:
+            domain: Lowercased domain to check
+            
+        Returns:
+            Disposable result if the domain is listed, None when only the
+            external API could decide
+        """
+        if domain not in self.disposable_domains:
+            return None
+
+        return {
+            "is_disposable": True,
+            "confidence": 1.0,
+            "sources": ["local_database"],
+            "issues": []
+        }
\ No newline at end of file
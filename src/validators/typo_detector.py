@@ -1,6 +1,7 @@
 import logging
 from typing import Dict, List
 import re
+from .quality.domain_suggester import get_default_suggester
 
 class TypoDetector:
     def __init__(self):
@@ -35,6 +36,12 @@ class TypoDetector:
                 if domain in typos:
                     suggestions.append(f"{local_part}@{correct_domain}")
                     
+            # Fall back to the closest common domain
+            if not suggestions:
+                suggestions.extend(
+                    f"{local_part}@{match}" for match, _ in get_default_suggester().suggest(domain, limit=1)
+                )
+                
             # Check for common local part typos
             if domain in self.common_domains:
                 # Double letters
@@ -24,12 +24,13 @@ class ValidatorFactory:
     }
 
     @classmethod
-    def create(cls, validator_type: str):
+    def create(cls, validator_type: str, **kwargs):
         """
         Create a validator instance.
         
         Args:
             validator_type: Type of validator to create
+            **kwargs: Constructor arguments for the validator
             
         Returns:
             Validator instance
@@ -37,4 +38,4 @@ class ValidatorFactory:
         validator_class = cls._validators.get(validator_type)
         if not validator_class:
             raise ValueError(f"Unknown validator type: {validator_type}")
-        return validator_class()
\ No newline at end of file
+        return validator_class(**kwargs)
\ No newline at end of file
@@ -5,6 +5,7 @@ import seaborn as sns
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from ..utils.domain_table import get_domain_table
 
 class ChartGenerator:
     """Generates various visualization charts for validation results"""
@@ -119,9 +120,10 @@ class ChartGenerator:
         try:
             plt.figure(figsize=(12, 6))
             
-            # Extract domains
-            domains = df['email'].apply(lambda x: x.split('@')[1])
-            domain_counts = domains.value_counts().head(10)
+            # Count domains through the shared domain table
+            table = get_domain_table()
+            top_domains = table.top_domains(table.count(table.ids_of(df['email'])), 10)
+            domain_counts = pd.Series(dict(top_domains), dtype=int)
             
             # Create bar plot
             sns.barplot(x=domain_counts.values, y=domain_counts.index)
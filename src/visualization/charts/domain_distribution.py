@@ -4,6 +4,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 from .base_chart import BaseChart
+from ...utils.domain_table import get_domain_table
 
 class DomainDistributionChart(BaseChart):
     """Generates domain distribution bar chart"""
@@ -16,9 +17,10 @@ class DomainDistributionChart(BaseChart):
                 
             self.setup_plot(config)
             
-            # Extract domains
-            domains = df['email'].apply(lambda x: x.split('@')[1])
-            domain_counts = domains.value_counts().head(10)
+            # Count domains through the shared domain table
+            table = get_domain_table()
+            top_domains = table.top_domains(table.count(table.ids_of(df['email'])), 10)
+            domain_counts = pd.Series(dict(top_domains), dtype=int)
             
             # Create bar plot
             sns.barplot(x=domain_counts.values, y=domain_counts.index)
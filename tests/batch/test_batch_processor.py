@@ -0,0 +1,135 @@
+import pytest
+from src.batch.batch_processor import BatchProcessor
+from src.validators.basic.syntax_validator import SyntaxValidator
+
+class StubValidator:
+    """Records calls instead of performing network validation."""
+    
+    def __init__(self):
+        self.domain_calls = []
+        self.syntax_validator = SyntaxValidator()
+        
+    async def validate_domain(self, domain, validation_options=None, email=None):
+        self.domain_calls.append(domain)
+        return {"domain": {"is_valid": True, "domain": domain}}
+        
+    async def validate(self, email, validation_options=None, precomputed_checks=None):
+        return {"email": email, "checks": dict(precomputed_checks or {})}
+
+@pytest.fixture
+def emails():
+    return [f"user{i}@domain{i % 3}.com" for i in range(20)]
+
+@pytest.mark.asyncio
+async def test_results_keep_input_order(emails):
+    processor = BatchProcessor(StubValidator(), batch_size=4, per_host_limit=2)
+    
+    results = await processor.process_emails(emails)
+    
+    assert [r["email"] for r in results] == emails
+
+@pytest.mark.asyncio
+async def test_domain_checks_run_once_per_domain(emails):
+    validator = StubValidator()
+    processor = BatchProcessor(validator, batch_size=4, per_host_limit=2)
+    
+    results = await processor.process_emails(emails)
+    
+    assert sorted(validator.domain_calls) == ["domain0.com", "domain1.com", "domain2.com"]
+    for result in results:
+        assert result["checks"]["domain"]["domain"] == result["email"].split("@")[1]
+
+@pytest.mark.asyncio
+async def test_no_domain_checks_for_invalid_syntax(emails):
+    validator = StubValidator()
+    processor = BatchProcessor(validator, batch_size=4)
+    invalid = ["no-at-sign", "bad..dots@invalid-one.com", "user@invalid-two"]
+    
+    results = await processor.process_emails(invalid + emails[:3])
+    
+    assert sorted(validator.domain_calls) == ["domain0.com", "domain1.com", "domain2.com"]
+    assert [r["checks"]["syntax"]["is_valid"] for r in results] == [False] * 3 + [True] * 3
+
+@pytest.mark.asyncio
+async def test_progress_callback(emails):
+    processor = BatchProcessor(StubValidator(), batch_size=6)
+    updates = []
+    processor.set_progress_callback(lambda done, total: updates.append((done, total)))
+    
+    await processor.process_emails(emails)
+    
+    assert updates[-1] == (20, 20)
+
+@pytest.mark.asyncio
+async def test_without_domain_affinity(emails):
+    processor = BatchProcessor(StubValidator(), batch_size=6, domain_affinity=False)
+    
+    results = await processor.process_emails(emails)
+    
+    assert [r["email"] for r in results] == emails
+
+class FailingValidator(StubValidator):
+    """Fails every address after the first few batches."""
+    
+    def __init__(self, fail_after):
+        super().__init__()
+        self.calls = 0
+        self.fail_after = fail_after
+        
+    async def validate(self, email, validation_options=None, precomputed_checks=None):
+        self.calls += 1
+        if self.calls > self.fail_after:
+            raise RuntimeError("worker died")
+        return await super().validate(email, validation_options, precomputed_checks)
+
+@pytest.mark.asyncio
+async def test_resume_skips_checkpointed_work(emails, tmp_path):
+    checkpoint_path = str(tmp_path / "job.ckpt")
+    failing = BatchProcessor(
+        FailingValidator(fail_after=8),
+        batch_size=4,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=1
+    )
+    partial = await failing.process_emails(emails)
+    assert [r["email"] for r in partial] == emails
+    assert len(failing.failed_positions) == len(emails) - 8
+    assert failing.tracker.failed_batches == (len(emails) - 8) // 4
+    assert all(not partial[i]["checks"] and not partial[i]["is_valid"] for i in failing.failed_positions)
+    
+    validator = FailingValidator(fail_after=len(emails))
+    processor = BatchProcessor(
+        validator,
+        batch_size=4,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=1
+    )
+    results = await processor.process_emails(emails, resume=True)
+    
+    assert [r["email"] for r in results] == emails
+    assert validator.calls == len(emails) - 8
+    assert not processor.failed_positions
+    assert not (tmp_path / "job.ckpt").exists()
+
+class CountingValidator(StubValidator):
+    """Counts the addresses it validates."""
+    
+    def __init__(self):
+        super().__init__()
+        self.validated = []
+        
+    async def validate(self, email, validation_options=None, precomputed_checks=None):
+        self.validated.append(email)
+        return {"email": email, "is_valid": True, "score": 80, "checks": {"syntax": {}}}
+
+@pytest.mark.asyncio
+async def test_validation_index_skips_fresh_addresses(tmp_path, emails):
+    index_path = str(tmp_path / "validated.npy")
+    await BatchProcessor(CountingValidator(), batch_size=4, index_path=index_path).process_emails(emails[:10])
+    
+    validator = CountingValidator()
+    results = await BatchProcessor(validator, batch_size=4, index_path=index_path).process_emails(emails)
+    
+    assert sorted(validator.validated) == sorted(emails[10:])
+    assert [r["email"] for r in results] == emails
+    assert all(r["from_index"] for r in results[:10])
\ No newline at end of file
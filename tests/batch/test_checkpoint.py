@@ -0,0 +1,53 @@
+import pytest
+from src.batch.checkpoint import BatchCheckpoint
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return BatchCheckpoint(str(tmp_path / "job.ckpt"))
+
+def test_resume_returns_saved_results(checkpoint):
+    job_id = BatchCheckpoint.job_id(["a@example.com", "b@example.com"])
+    checkpoint.start(job_id, 2)
+    checkpoint.record([1], [{"email": "b@example.com"}])
+    checkpoint.flush()
+    
+    completed = checkpoint.start(job_id, 2, resume=True)
+    
+    assert completed == {1: {"email": "b@example.com"}}
+
+def test_unflushed_results_are_not_saved(checkpoint):
+    job_id = BatchCheckpoint.job_id(["a@example.com"])
+    checkpoint.start(job_id, 1)
+    checkpoint.record([0], [{"email": "a@example.com"}])
+    
+    assert checkpoint.start(job_id, 1, resume=True) == {}
+
+def test_different_job_starts_over(checkpoint):
+    checkpoint.start(BatchCheckpoint.job_id(["a@example.com"]), 1)
+    checkpoint.record([0], [{"email": "a@example.com"}])
+    checkpoint.flush()
+    
+    other_job = BatchCheckpoint.job_id(["a@example.com"], {"check_smtp": False})
+    
+    assert checkpoint.start(other_job, 1, resume=True) == {}
+
+def test_torn_line_is_dropped(checkpoint):
+    job_id = BatchCheckpoint.job_id(["a@example.com", "b@example.com"])
+    checkpoint.start(job_id, 2)
+    checkpoint.record([0], [{"email": "a@example.com"}])
+    checkpoint.flush()
+    with open(checkpoint.path, "a") as f:
+        f.write('{"i": 1, "r": {"ema')
+        
+    assert checkpoint.start(job_id, 2, resume=True) == {0: {"email": "a@example.com"}}
+    
+    checkpoint.record([1], [{"email": "b@example.com"}])
+    checkpoint.flush()
+    
+    assert len(checkpoint.start(job_id, 2, resume=True)) == 2
+
+def test_clear_removes_file(checkpoint):
+    checkpoint.start("job", 0)
+    checkpoint.clear()
+    
+    assert not checkpoint.path.exists()
\ No newline at end of file
@@ -0,0 +1,102 @@
+import pytest
+from src.batch.batch_processor import BatchProcessor
+from src.batch.cpu_checks import (
+    run_offline_checks,
+    expand_offline_results,
+    enabled_offline_checks
+)
+from src.validators.email_validator import EmailValidator, OFFLINE_VALIDATION_OPTIONS
+
+@pytest.fixture
+def emails():
+    return [
+        "john.doe@example.com",
+        "jane@gmai.com",
+        "john.doe@example.com",
+        "jon.doe@example.com",
+        "test123456@example.com",
+        "invalid-email",
+        "info@company.org",
+        "JANE@gmai.com"
+    ]
+
+def test_enabled_offline_checks():
+    options = {"check_spam": True, "check_typos": True, "check_smtp": True, "check_duplicates": True}
+    
+    assert enabled_offline_checks(options) == ("spam", "typo")
+
+def test_invalid_syntax_skips_other_checks():
+    rows = run_offline_checks(["invalid-email"], ("spam", "typo"))
+    checks = expand_offline_results(rows, ("spam", "typo"))
+    
+    assert list(checks[0]) == ["syntax"]
+    assert not checks[0]["syntax"]["is_valid"]
+
+def test_chunks_keep_domains_together(emails):
+    processor = BatchProcessor(EmailValidator(cache_enabled=False), cpu_chunk_size=2)
+    
+    chunks = processor._build_offline_chunks(emails, list(range(len(emails))))
+    
+    chunk_of = {}
+    for number, chunk in enumerate(chunks):
+        for position in chunk:
+            domain = emails[position].split("@")[-1].lower()
+            assert chunk_of.setdefault(domain, number) == number
+
+@pytest.mark.asyncio
+async def test_process_pool_matches_sequential(emails):
+    sequential = BatchProcessor(EmailValidator(cache_enabled=False), batch_size=3)
+    pooled = BatchProcessor(
+        EmailValidator(cache_enabled=False),
+        batch_size=3,
+        cpu_workers=2,
+        cpu_chunk_size=3
+    )
+    
+    try:
+        expected = await sequential.process_emails(emails, OFFLINE_VALIDATION_OPTIONS)
+        results = await pooled.process_emails(emails, OFFLINE_VALIDATION_OPTIONS)
+    finally:
+        pooled.close()
+        
+    assert results == expected
+
+@pytest.mark.asyncio
+async def test_pooled_duplicates_use_validator_history(emails):
+    validator = EmailValidator(cache_enabled=False)
+    await validator.validate("john.doe@example.com", OFFLINE_VALIDATION_OPTIONS)
+    pooled = BatchProcessor(validator, batch_size=3, cpu_workers=1, cpu_chunk_size=3)
+    
+    try:
+        results = await pooled.process_emails(emails, OFFLINE_VALIDATION_OPTIONS)
+    finally:
+        pooled.close()
+        
+    assert results[0]["checks"]["duplicate"]["duplicate_type"] == "exact"
+
+@pytest.mark.asyncio
+async def test_offline_checks_run_per_window(emails):
+    pooled = BatchProcessor(
+        EmailValidator(cache_enabled=False),
+        batch_size=2,
+        domain_affinity=False,
+        cpu_workers=1,
+        cpu_chunk_size=2
+    )
+    progress = []
+    pooled.set_progress_callback(lambda done, total: progress.append(done))
+    chunk_sizes = []
+    run_offline_checks = pooled._run_offline_checks
+    
+    async def tracking(emails, positions, validation_options):
+        chunk_sizes.append(len(positions))
+        return await run_offline_checks(emails, positions, validation_options)
+    pooled._run_offline_checks = tracking
+    
+    try:
+        await pooled.process_emails(emails, OFFLINE_VALIDATION_OPTIONS)
+    finally:
+        pooled.close()
+        
+    assert chunk_sizes == [2, 2, 2, 2]
+    assert progress == [2, 4, 6, 8]
\ No newline at end of file
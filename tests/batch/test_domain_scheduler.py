@@ -0,0 +1,60 @@
+import pytest
+from collections import Counter
+from src.batch.domain_scheduler import DomainScheduler
+
+@pytest.fixture
+def emails():
+    return (
+        [f"user{i}@gmail.com" for i in range(25)] +
+        [f"user{i}@yahoo.com" for i in range(7)] +
+        [f"user{i}@example.com" for i in range(3)] +
+        ["invalid-email"]
+    )
+
+def test_every_position_scheduled_once(emails):
+    scheduler = DomainScheduler(batch_size=10, per_host_limit=4)
+    
+    positions = [p for batch in scheduler.schedule(emails) for p in batch]
+    
+    assert sorted(positions) == list(range(len(emails)))
+
+def test_batch_size_and_per_host_limit(emails):
+    scheduler = DomainScheduler(batch_size=10, per_host_limit=4)
+    
+    for batch in scheduler.schedule(emails):
+        assert len(batch) <= 10
+        per_domain = Counter(scheduler.group_key(emails[p]) for p in batch)
+        assert max(per_domain.values()) <= 4
+
+def test_domains_run_in_consecutive_batches(emails):
+    scheduler = DomainScheduler(batch_size=10, per_host_limit=4)
+    batches = list(scheduler.schedule(emails))
+    
+    seen_in = {}
+    for number, batch in enumerate(batches):
+        for p in batch:
+            seen_in.setdefault(scheduler.domain_of(emails[p]), set()).add(number)
+            
+    for numbers in seen_in.values():
+        assert max(numbers) - min(numbers) + 1 == len(numbers)
+
+def test_groups_by_mx_provider():
+    scheduler = DomainScheduler(
+        batch_size=10,
+        per_host_limit=2,
+        mx_providers={"company.com": "google.com", "gmail.com": "google.com"}
+    )
+    emails = ["a@gmail.com", "b@company.com", "c@gmail.com", "d@other.com"]
+    
+    groups = scheduler.group(emails)
+    
+    assert groups == {"google.com": [0, 1, 2], "other.com": [3]}
+    for batch in scheduler.schedule(emails):
+        assert sum(scheduler.group_key(emails[p]) == "google.com" for p in batch) <= 2
+
+def test_domain_of():
+    assert DomainScheduler.domain_of("User@Example.COM ") == "example.com"
+    assert DomainScheduler.domain_of("invalid-email") == ""
+
+def test_empty_input():
+    assert list(DomainScheduler().schedule([])) == []
\ No newline at end of file
@@ -0,0 +1,114 @@
+import pytest
+from src.batch.batch_processor import BatchProcessor
+from src.batch.offline_screener import OfflineScreener
+from src.cache.validation_index import ValidationIndex
+from src.validators.email_validator import DEFAULT_VALIDATION_OPTIONS, EmailValidator
+
+class RecordingSMTP:
+    def __init__(self):
+        self.verified = []
+        
+    async def verify(self, email):
+        self.verified.append(email)
+        return {"is_valid": True, "mx_found": True, "smtp_check": True, "issues": []}
+
+class RecordingDomain:
+    def __init__(self):
+        self.validated = []
+        
+    async def validate(self, domain):
+        self.validated.append(domain)
+        return {"is_valid": True, "has_mx": True, "domain_age": 1000, "issues": []}
+
+class RecordingReputation:
+    async def check_reputation(self, email):
+        return {"reputation_score": 100, "blacklisted": False, "issues": []}
+
+@pytest.fixture
+def validator():
+    validator = EmailValidator(cache_enabled=False)
+    validator.smtp_validator = RecordingSMTP()
+    validator.domain_validator = RecordingDomain()
+    validator.reputation_validator = RecordingReputation()
+    validator.disposable_detector.disposable_domains = {"tempmail.com"}
+    return validator
+
+@pytest.fixture
+def emails():
+    return [
+        "invalid-email",
+        "test123456@example.com",
+        "maria.lopez@example.com",
+        "maria.lopez@example.com",
+        "daniel.smith@tempmail.com",
+        "bad..dots@nowhere.org"
+    ]
+
+@pytest.mark.asyncio
+async def test_screen_rejects_unrecoverable_addresses(validator, emails):
+    screener = OfflineScreener(validator)
+    
+    final, checks = await screener.screen(emails)
+    
+    assert final[0] is not None and not final[0]["is_valid"]
+    assert final[2] is None
+    assert final[5] is not None
+    assert "syntax" in checks[2] and "spam" in checks[2]
+    assert "smtp" not in checks[2]
+    assert checks[4]["disposable"]["is_disposable"]
+    assert screener.rejected == sum(result is not None for result in final)
+
+@pytest.mark.asyncio
+async def test_tiered_batch_skips_network_for_rejected(validator, emails):
+    processor = BatchProcessor(validator, batch_size=10, tiered=True)
+    
+    results = await processor.process_emails(emails)
+    
+    assert [r["email"] for r in results] == emails
+    assert "invalid-email" not in validator.smtp_validator.verified
+    assert "bad..dots@nowhere.org" not in validator.smtp_validator.verified
+    assert "nowhere.org" not in validator.domain_validator.validated
+    assert "maria.lopez@example.com" in validator.smtp_validator.verified
+    assert results[2]["checks"]["smtp"]["smtp_check"]
+    assert results[4]["checks"]["disposable"]["sources"] == ["local_database"]
+
+@pytest.mark.asyncio
+async def test_tiered_matches_untiered_verdicts(emails):
+    def make_validator():
+        validator = EmailValidator(cache_enabled=False)
+        validator.smtp_validator = RecordingSMTP()
+        validator.domain_validator = RecordingDomain()
+        validator.reputation_validator = RecordingReputation()
+        validator.disposable_detector.disposable_domains = {"tempmail.com"}
+        return validator
+        
+    tiered = await BatchProcessor(make_validator(), tiered=True).process_emails(emails)
+    untiered = await BatchProcessor(make_validator()).process_emails(emails)
+    
+    assert [r["is_valid"] for r in tiered] == [r["is_valid"] for r in untiered]
+
+@pytest.mark.asyncio
+async def test_screen_checks_syntax_once_per_chunk(validator, emails):
+    calls = []
+    validate_many = validator.syntax_validator.validate_many
+    validator.syntax_validator.validate_many = lambda batch: calls.append(len(batch)) or validate_many(batch)
+    validator.syntax_validator.validate = lambda email: pytest.fail("per-address syntax check")
+    screener = OfflineScreener(validator)
+    
+    final, checks = await screener.screen(emails)
+    
+    assert calls == [len(emails)]
+    assert not checks[0]["syntax"]["is_valid"]
+    assert checks[2]["typo"] == validator.typo_detector.check(emails[2])
+
+@pytest.mark.asyncio
+async def test_offline_rejections_not_indexed(validator, emails, tmp_path):
+    index_path = str(tmp_path / "validated.npy")
+    processor = BatchProcessor(validator, batch_size=10, tiered=True, index_path=index_path)
+    
+    results = await processor.process_emails(emails)
+    
+    found = ValidationIndex(index_path).lookup(emails, options=DEFAULT_VALIDATION_OPTIONS)
+    assert not results[0]["is_valid"] and not results[5]["is_valid"]
+    assert found["key"][0] == 0 and found["key"][5] == 0
+    assert found["key"][2] != 0
\ No newline at end of file
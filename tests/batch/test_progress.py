@@ -0,0 +1,56 @@
+import pytest
+from src.batch.batch_processor import BatchProcessor
+from src.batch.progress import ProgressTracker
+from src.validators.basic.syntax_validator import SyntaxValidator
+
+class StubValidator:
+    """Returns canned results without network validation."""
+    
+    def __init__(self):
+        self.syntax_validator = SyntaxValidator()
+        
+    async def validate_domain(self, domain, validation_options=None, email=None):
+        return {"domain": {"is_valid": True, "domain": domain}}
+        
+    async def validate(self, email, validation_options=None, precomputed_checks=None):
+        return {"email": email, "checks": dict(precomputed_checks or {})}
+
+def test_snapshot_percentiles_and_hit_rates():
+    tracker = ProgressTracker(total=10)
+    for ms in range(1, 101):
+        tracker.record_latency("validation", ms / 1000)
+    tracker.record_cache("domain_checks", hits=3, misses=1)
+    tracker.advance(4)
+    
+    event = tracker.snapshot()
+    
+    assert event.processed == 4
+    assert event.stage_latency["validation"]["samples"] == 100
+    assert event.stage_latency["validation"]["p50"] == pytest.approx(0.0505)
+    assert event.stage_latency["validation"]["p99"] > event.stage_latency["validation"]["p95"]
+    assert event.cache_hit_rates == {"domain_checks": 0.75}
+    assert event.eta_seconds is not None
+
+def test_poll_is_throttled():
+    tracker = ProgressTracker(total=10, min_interval=60)
+    
+    assert tracker.poll() is not None
+    assert tracker.poll() is None
+    assert tracker.poll(force=True) is not None
+
+@pytest.mark.asyncio
+async def test_batch_processor_emits_events():
+    emails = [f"user{i}@domain{i % 3}.com" for i in range(20)]
+    processor = BatchProcessor(StubValidator(), batch_size=5, progress_interval=0)
+    events = []
+    processor.set_progress_event_callback(events.append)
+    
+    await processor.process_emails(emails)
+    
+    final = events[-1]
+    assert final.processed == final.total == 20
+    assert final.in_flight == 0
+    assert final.failed_batches == 0
+    assert {"validation", "domain_lookup"} <= set(final.stage_latency)
+    assert final.cache_hit_rates["domain_checks"] == pytest.approx(17 / 20)
+    assert final.to_dict()["eta_seconds"] == 0
\ No newline at end of file
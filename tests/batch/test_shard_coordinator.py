@@ -0,0 +1,92 @@
+import json
+import pytest
+from src.batch.shard_coordinator import ShardCoordinator, ShardLauncher
+
+NO_NETWORK_OPTIONS = {
+    "check_domain": False,
+    "check_spam": True,
+    "check_disposable": False,
+    "check_smtp": False,
+    "check_reputation": False,
+    "check_duplicates": True,
+    "check_typos": False
+}
+
+@pytest.fixture
+def emails():
+    return [
+        "a@example.com",
+        "b@mail.example.com",
+        "c@gmail.com",
+        "invalid-email",
+        "d@example.co.uk",
+        "a@example.com",
+        "e@yahoo.com",
+        "f@shop.example.co.uk"
+    ]
+
+def test_registrable_domain():
+    assert ShardCoordinator.registrable_domain("x@mail.example.co.uk") == "example.co.uk"
+    assert ShardCoordinator.registrable_domain("x@gmail.com") == "gmail.com"
+
+def test_partition_keeps_registrable_domains_together(emails, tmp_path):
+    coordinator = ShardCoordinator(num_shards=3, work_dir=str(tmp_path))
+    
+    paths = coordinator.partition(emails)
+    
+    shard_of = {}
+    positions = []
+    for shard, path in enumerate(paths):
+        for line in path.read_text().splitlines():
+            position, email = line.split("\t", 1)
+            positions.append(int(position))
+            domain = ShardCoordinator.registrable_domain(email)
+            assert shard_of.setdefault(domain, shard) == shard
+    assert sorted(positions) == list(range(len(emails)))
+
+def test_merge_restores_input_order(tmp_path):
+    shard_a = tmp_path / "a.ndjson"
+    shard_b = tmp_path / "b.ndjson"
+    shard_a.write_text("".join(json.dumps({"i": i, "r": {"n": i}}) + "\n" for i in (0, 3, 4)))
+    shard_b.write_text("".join(json.dumps({"i": i, "r": {"n": i}}) + "\n" for i in (1, 2)))
+    coordinator = ShardCoordinator(num_shards=2, work_dir=str(tmp_path))
+    
+    written = coordinator.merge([shard_a, shard_b], str(tmp_path / "out.ndjson"))
+    
+    lines = (tmp_path / "out.ndjson").read_text().splitlines()
+    assert written == 5
+    assert [json.loads(line)["n"] for line in lines] == [0, 1, 2, 3, 4]
+
+@pytest.mark.asyncio
+async def test_failed_worker_raises(emails, tmp_path):
+    class FailingLauncher(ShardLauncher):
+        async def launch(self, command, shard):
+            return 1
+            
+    coordinator = ShardCoordinator(2, str(tmp_path), launcher=FailingLauncher())
+    
+    with pytest.raises(RuntimeError):
+        await coordinator.run(emails, str(tmp_path / "out.ndjson"))
+
+@pytest.mark.asyncio
+async def test_local_workers_end_to_end(emails, tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("\n".join(emails))
+    output_path = tmp_path / "out.ndjson"
+    coordinator = ShardCoordinator(
+        num_shards=3,
+        work_dir=str(tmp_path / "work"),
+        validation_options=NO_NETWORK_OPTIONS
+    )
+    
+    written = await coordinator.run_file(str(input_path), str(output_path))
+    
+    results = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert written == len(emails)
+    assert [r["email"] for r in results] == emails
+    assert not results[3]["checks"]["syntax"]["is_valid"]
+    assert results[5]["checks"]["duplicate"]["is_duplicate"]
+
+def test_launcher_base_is_abstract():
+    with pytest.raises(TypeError):
+        ShardLauncher()
\ No newline at end of file
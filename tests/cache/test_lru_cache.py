@@ -0,0 +1,26 @@
+from src.cache.lru_cache import LRUCache
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.metrics.evictions == 1
+    assert cache.metrics.total_entries == 2
+
+def test_counts_hits_and_misses():
+    cache = LRUCache()
+    cache.set("a", 1)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert (cache.metrics.hits, cache.metrics.misses) == (1, 1)
+    
+    cache.clear()
+    
+    assert len(cache) == 0
+    assert cache.get("a") is None
\ No newline at end of file
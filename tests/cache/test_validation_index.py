@@ -0,0 +1,78 @@
+import time
+import pytest
+from src.cache.validation_index import ValidationIndex
+from src.validators.email_validator import DEFAULT_VALIDATION_OPTIONS, OFFLINE_VALIDATION_OPTIONS
+
+def make_result(email, is_valid=True, score=90):
+    return {
+        "email": email,
+        "is_valid": is_valid,
+        "score": score,
+        "issues": [],
+        "checks": {"syntax": {"is_valid": is_valid}},
+        "suggestions": []
+    }
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "index" / "validated.npy")
+
+def test_lookup_after_flush_and_reopen(index_path):
+    index = ValidationIndex(index_path)
+    index.record([make_result(f"user{i}@example.com", i % 2 == 0, i) for i in range(100)])
+    index.flush()
+    
+    reopened = ValidationIndex(index_path)
+    found = reopened.lookup(["USER4@example.com ", "user5@example.com", "missing@example.com"])
+    
+    assert len(reopened) == 100
+    assert list(found["is_valid"][:2]) == [True, False]
+    assert list(found["score"][:2]) == [4, 5]
+    assert found["key"][2] == 0
+    assert reopened.metrics.hits == 2 and reopened.metrics.misses == 1
+
+def test_pending_verdicts_are_visible_and_newest_wins(index_path):
+    index = ValidationIndex(index_path)
+    index.record([make_result("a@example.com", True, 90)])
+    index.flush()
+    index.record([make_result("a@example.com", False, 10)])
+    
+    assert not index.lookup(["a@example.com"])["is_valid"][0]
+    index.flush()
+    assert len(index) == 1
+    assert ValidationIndex(index_path).lookup(["a@example.com"])["score"][0] == 10
+
+def test_freshness_window(index_path):
+    index = ValidationIndex(index_path)
+    now = time.time()
+    index.record([make_result("old@example.com")], checked_at=now - 10 * 86400)
+    index.record([make_result("new@example.com")], checked_at=now - 3600)
+    index.flush()
+    
+    fresh = index.fresh_results(["old@example.com", "new@example.com"], max_age_seconds=7 * 86400)
+    
+    assert list(fresh) == [1]
+    assert fresh[1]["from_index"] and fresh[1]["is_valid"]
+
+def test_failed_and_indexed_results_not_recorded(index_path):
+    index = ValidationIndex(index_path)
+    index.record([
+        {"email": "error@example.com", "is_valid": False, "score": 0, "checks": {}},
+        {**make_result("copy@example.com"), "from_index": True},
+        None
+    ])
+    
+    assert len(index) == 0
+
+def test_verdicts_are_scoped_to_validation_options(index_path):
+    index = ValidationIndex(index_path)
+    index.record([make_result("cheap@example.com")], options=OFFLINE_VALIDATION_OPTIONS)
+    index.flush()
+    
+    full = index.fresh_results(["cheap@example.com"], 86400, options=DEFAULT_VALIDATION_OPTIONS)
+    offline = index.fresh_results(["cheap@example.com"], 86400, options=OFFLINE_VALIDATION_OPTIONS)
+    
+    assert full == {}
+    assert list(offline) == [0]
+    same_checks = {"check_smtp": False, "check_syntax": True}
+    assert index.key_of("a@example.com", same_checks) == index.key_of("a@example.com", {"check_syntax": True})
\ No newline at end of file
@@ -72,4 +72,63 @@ def test_case_sensitivity(deduplicator):
     results = deduplicator.deduplicate(emails)
     
     assert len(results["unique_emails"]) == 1
-    assert results["stats"]["exact_duplicates"] == 2
\ No newline at end of file
+    assert results["stats"]["exact_duplicates"] == 2
+
+def _component_groups(emails, threshold):
+    """Reference all-pairs connected components of similar local parts."""
+    from Levenshtein import distance
+    local_parts = [email.split('@')[0].lower() for email in emails]
+    neighbours = {
+        i: {j for j in range(len(emails)) if j != i and distance(local_parts[i], local_parts[j]) <= threshold}
+        for i in range(len(emails))
+    }
+    seen, groups = set(), {}
+    for start in range(len(emails)):
+        if start in seen or not neighbours[start]:
+            continue
+        component, stack = set(), [start]
+        while stack:
+            i = stack.pop()
+            if i not in component:
+                component.add(i)
+                stack.extend(neighbours[i])
+        seen |= component
+        members = sorted((emails[i] for i in component), key=lambda email: (len(email), email))
+        groups[members[0]] = members[1:]
+    return groups
+
+def _random_emails(seed, count=300):
+    import random
+    rng = random.Random(seed)
+    names = ["john", "jon", "johnny", "jane", "janet", "joan", "j.doe", "jdoe", "doe.j"]
+    return list(dict.fromkeys(
+        f"{rng.choice(names)}{rng.choice(['', '1', '12', '.x', 'x'])}{rng.randint(0, 9)}@example.com"
+        for _ in range(count)
+    ))
+
+@pytest.mark.parametrize("threshold", [0, 1, 2, 3, 4])
+def test_similar_groups_are_connected_components(threshold):
+    emails = _random_emails(threshold)
+    deduplicator = BatchDeduplicator(similarity_threshold=threshold)
+    
+    assert deduplicator.find_similar_groups(emails) == _component_groups(emails, threshold)
+
+def test_chains_do_not_depend_on_input_order(deduplicator):
+    chain = ["abcd@example.com", "abcdef@example.com", "abcdefgh@example.com"]
+    
+    for emails in (chain, chain[::-1], [chain[1], chain[0], chain[2]]):
+        results = deduplicator.deduplicate(emails)
+        assert dict(results["similar_groups"]) == {
+            "abcd@example.com": ["abcdef@example.com", "abcdefgh@example.com"]
+        }
+
+@pytest.mark.parametrize("threshold", [2, 3])
+def test_parallel_matches_sequential(threshold):
+    emails = _random_emails(threshold, count=400)
+    sequential = BatchDeduplicator(similarity_threshold=threshold).deduplicate(emails)
+    parallel = BatchDeduplicator(
+        similarity_threshold=threshold, workers=2, parallel_min_size=10
+    ).deduplicate(emails)
+    
+    assert parallel["similar_groups"] == sequential["similar_groups"]
+    assert parallel["stats"] == sequential["stats"]
\ No newline at end of file
@@ -0,0 +1,28 @@
+import pytest
+from src.preprocessing.deduplicator import Deduplicator
+
+@pytest.fixture
+def deduplicator():
+    return Deduplicator(similarity_threshold=2)
+
+def test_similar_grouped_under_shortest(deduplicator):
+    emails = [
+        "john.smith@example.com",
+        "johnsmith@example.com",
+        "john.smith1@example.com",
+        "mary.jones@example.com",
+        "john.smith1@other.com"
+    ]
+    
+    unique, similar_groups = deduplicator.deduplicate(emails)
+    
+    assert set(unique) == {"john.smith@example.com", "mary.jones@example.com", "john.smith1@other.com"}
+    assert similar_groups == {
+        "john.smith@example.com": ["johnsmith@example.com", "john.smith1@example.com"]
+    }
+
+def test_invalid_addresses_kept(deduplicator):
+    unique, similar_groups = deduplicator.deduplicate(["not-an-email", "a@example.com", "b@example.com"])
+    
+    assert set(unique) == {"not-an-email", "a@example.com"}
+    assert similar_groups == {"a@example.com": ["b@example.com"]}
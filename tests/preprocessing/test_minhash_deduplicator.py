@@ -0,0 +1,50 @@
+import pytest
+from src.preprocessing.minhash_deduplicator import MinHashDeduplicator
+from src.preprocessing.batch_deduplicator import BatchDeduplicator
+
+@pytest.fixture
+def emails():
+    firsts = ["john", "mary", "james", "linda", "robert", "susan", "wei", "ahmed"]
+    lasts = ["smith", "jones", "garcia", "nguyen", "patel", "brown"]
+    return [
+        f"{first}{sep}{last}{number}@example.com"
+        for first in firsts
+        for last in lasts
+        for sep in (".", "_", "")
+        for number in ("", "1", "12")
+    ]
+
+def test_groups_are_verified_subsets_of_exact_groups(emails):
+    approximate = MinHashDeduplicator().find_similar_groups(emails)
+    exact = BatchDeduplicator().find_similar_groups(emails)
+    
+    exact_group_of = {
+        member: primary
+        for primary, members in exact.items()
+        for member in [primary] + members
+    }
+    for primary, members in approximate.items():
+        assert {exact_group_of[email] for email in [primary] + members} == {exact_group_of[primary]}
+
+def test_measure_recall_reports_against_exact(emails):
+    report = MinHashDeduplicator().measure_recall(emails, sample_size=200)
+    
+    assert report["sample_size"] == 200
+    assert report["exact_pairs"] > 0
+    assert report["recall"] > 0.9
+    assert report["precision"] == 1.0
+
+def test_fewer_bands_lower_recall(emails):
+    strict = MinHashDeduplicator(num_bands=2, rows_per_band=6).measure_recall(emails)
+    default = MinHashDeduplicator().measure_recall(emails)
+    
+    assert strict["recall"] < default["recall"]
+
+def test_deterministic(emails):
+    assert MinHashDeduplicator().find_similar_groups(emails) == MinHashDeduplicator().find_similar_groups(emails[::-1])
+
+def test_batch_deduplicator_approximate_mode(emails):
+    results = BatchDeduplicator(approximate=True, recall_sample_size=100).deduplicate(emails)
+    
+    assert results["stats"]["similar"] > 0
+    assert 0 < results["stats"]["approximate_recall"] <= 1
\ No newline at end of file
@@ -0,0 +1,70 @@
+import asyncio
+import random
+import pytest
+from src.preprocessing.preprocessor import EmailPreprocessor
+from src.preprocessing.parallel_preprocessor import ParallelPreprocessor, PreprocessingBudgetExceeded
+
+@pytest.fixture
+def emails():
+    rng = random.Random(5)
+    names = ["john.smith", "johnsmith", "mary.jones", "m.jones", "wei.li", "anna", "bad name", "@x"]
+    domains = [f"domain{i}.com" for i in range(40)] + ["Example.com", "broken"]
+    return [f"{rng.choice(names)}{rng.randint(0, 300)}@{rng.choice(domains)}" for _ in range(6000)]
+
+@pytest.fixture
+def parallel():
+    preprocessor = ParallelPreprocessor(workers=2, chunk_size=700, min_chunk_size=100, inline_max_size=0)
+    yield preprocessor
+    preprocessor.close()
+
+@pytest.mark.asyncio
+async def test_matches_in_process_preprocess(parallel, emails):
+    results = await parallel.preprocess(emails)
+    expected = await EmailPreprocessor().preprocess(emails)
+    
+    assert results["stats"].pop("cpu_milliseconds") >= 0
+    assert results == expected
+    assert expected["stats"]["similar_emails"] > 0
+
+@pytest.mark.asyncio
+async def test_cpu_budget_exceeded(parallel, emails):
+    with pytest.raises(PreprocessingBudgetExceeded):
+        await parallel.preprocess(emails, cpu_budget_seconds=1e-6)
+        
+    # The pool stays usable for the next request
+    assert (await parallel.preprocess(emails[:500]))["original_count"] == 500
+
+@pytest.mark.asyncio
+async def test_cancellation(parallel, emails):
+    task = asyncio.create_task(parallel.preprocess(emails * 5))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert (await parallel.preprocess(emails[:500]))["original_count"] == 500
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive(parallel, emails):
+    ticks = 0
+    
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+            
+    beat = asyncio.create_task(heartbeat())
+    await parallel.preprocess(emails * 5)
+    beat.cancel()
+    
+    assert ticks > 10
+
+@pytest.mark.asyncio
+async def test_small_requests_run_inline(emails):
+    parallel = ParallelPreprocessor(workers=2, inline_max_size=250)
+    
+    results = await parallel.preprocess(emails[:250])
+    
+    assert parallel.executor is None
+    assert results == await EmailPreprocessor().preprocess(emails[:250])
\ No newline at end of file
@@ -0,0 +1,71 @@
+import random
+import pytest
+import pandas as pd
+from src.preprocessing.preprocessor import EmailPreprocessor
+
+def random_inputs(count, seed=0):
+    rng = random.Random(seed)
+    pieces = [
+        "john", "Mary", "x", "1", ".", "..", "_", "-", "+", "%", "@", "@@", " ", "\t", "\n",
+        "example", "Example", "com", ".com", ".c", ".co.uk", "é", "ü", "ß", "K", "!", "#", "'",
+        "(", ")", "<", ">", "\"", ",", ";", "\x1c", " ", "a" * 70, "b" * 250
+    ]
+    inputs = ["", None, " John.Smith@Example.COM ", "user@domain", "@example.com"]
+    while len(inputs) < count:
+        inputs.append("".join(rng.choice(pieces) for _ in range(rng.randint(1, 8))))
+        inputs.append(
+            rng.choice(["", " ", "\t"]) + rng.choice(pieces[:10]) + rng.choice(pieces[:10]) + "@"
+            + rng.choice(["example", "exa-mple", "-example", ".example", "ex..ample", "éx"])
+            + rng.choice([".com", ".org", ".c", ".co.uk", ".c0m", ""]) + rng.choice(["", " ", "\n"])
+        )
+    return inputs
+
+@pytest.mark.asyncio
+async def test_fast_path_matches_reference_path():
+    emails = random_inputs(20000)
+    
+    fast = await EmailPreprocessor(fast_path=True).preprocess(emails)
+    reference = await EmailPreprocessor(fast_path=False).preprocess(emails)
+    
+    assert fast == reference
+    assert fast["stats"]["total_valid"] > 1000
+    assert fast["stats"]["invalid_count"] > 1000
+
+@pytest.mark.asyncio
+async def test_issues_reported_for_rejected_addresses():
+    results = await EmailPreprocessor().preprocess([" A.B@Example.com", "no-at-sign.com", "x@y.c"])
+    
+    assert results["processed_emails"] == ["a.b@example.com"]
+    assert results["invalid_format"] == [
+        {"email": "no-at-sign.com", "issues": ["Missing @ symbol"]},
+        {"email": "x@y.c", "issues": ["Failed format validation"]}
+    ]
+
+def test_column_mode_matches_row_path():
+    preprocessor = EmailPreprocessor()
+    emails = random_inputs(5000, seed=1)
+    
+    frame = preprocessor.preprocess_column(pd.Series(emails, index=range(10, 10 + len(emails))))
+    
+    assert list(frame.index) == list(range(10, 10 + len(emails)))
+    for email, row in zip(emails, frame.itertuples()):
+        cleaned = preprocessor.cleaner.clean_email(email)
+        assert row.email == cleaned
+        if not cleaned:
+            assert not row.is_valid and row.issues is None
+            continue
+        validation = preprocessor.format_validator.validate_format(cleaned)
+        assert row.is_valid == validation["is_valid"]
+        if row.is_valid:
+            assert row.domain == cleaned.split('@')[1] and row.issues is None
+        else:
+            assert row.domain is None and row.issues == validation["issues"]
+
+def test_column_mode_validity_mask_and_domains():
+    frame = EmailPreprocessor().preprocess_column(
+        pd.Series([" A.B@Example.com", None, "no-at.com", "a b@c.org"])
+    )
+    
+    assert frame["is_valid"].tolist() == [True, False, False, True]
+    assert frame["domain"].tolist() == ["example.com", None, None, "c.org"]
+    assert frame["issues"].tolist() == [None, None, ["Missing @ symbol"], None]
\ No newline at end of file
@@ -0,0 +1,87 @@
+import random
+import pytest
+from src.preprocessing.preprocessor import EmailPreprocessor
+from src.preprocessing.streaming_preprocessor import DedupState, StreamingPreprocessor
+
+@pytest.fixture
+def emails():
+    rng = random.Random(3)
+    names = ["john.smith", "johnsmith", "mary.jones", "m.jones", "wei.li", "ahmed.khan", "anna"]
+    domains = ["example.com", "Example.com", "other.org", "bad", "x.c"]
+    return [
+        rng.choice(["", " "]) + rng.choice(names) + rng.choice(["", "1", "12"]) + "@" + rng.choice(domains)
+        for _ in range(400)
+    ]
+
+def chunked(emails, size):
+    return [emails[i:i + size] for i in range(0, len(emails), size)]
+
+@pytest.mark.asyncio
+async def test_stream_matches_batch_preprocess(emails):
+    streaming = StreamingPreprocessor()
+    
+    streamed = [email for chunk in streaming.stream(chunked(emails, 37)) for email in chunk]
+    expected = await EmailPreprocessor().preprocess(emails)
+    
+    assert streamed == expected["processed_emails"]
+    for key in ("total_cleaned", "total_valid", "total_unique", "exact_duplicates", "invalid_count"):
+        assert streaming.stats[key] == expected["stats"][key]
+    assert streaming.stats["chunks"] == 11
+    assert streaming.invalid_format == expected["invalid_format"]
+
+def test_merged_workers_match_single_stream(emails):
+    single = StreamingPreprocessor()
+    expected = [email for chunk in single.stream(chunked(emails, 50)) for email in chunk]
+    
+    workers = [StreamingPreprocessor(), StreamingPreprocessor()]
+    yielded = []
+    for number, chunk in enumerate(chunked(emails, 50)):
+        yielded.extend(workers[number % 2].process_chunk(chunk))
+    repeated = workers[0].merge(workers[1])
+    
+    remaining = list(yielded)
+    for email in repeated:
+        remaining.remove(email)
+    assert sorted(remaining) == sorted(expected)
+    assert sorted(workers[0].state.unique) == sorted(expected)
+    for key in ("original_count", "total_valid", "total_unique", "exact_duplicates", "invalid_count"):
+        assert workers[0].stats[key] == single.stats[key]
+
+def test_similar_emails_grouped_in_arrival_order():
+    state = DedupState(similarity_threshold=2)
+    
+    added = [state.add(email) for email in [
+        "john.smith@example.com", "johnsmith@example.com", "john.smith@other.com",
+        "johnsmith1@example.com", "JohnSmith@example.com"
+    ]]
+    
+    assert added == [True, True, True, True, False]
+    assert state.similar_groups == {
+        "john.smith@example.com": ["johnsmith@example.com", "johnsmith1@example.com"]
+    }
+    assert state.duplicates == {"johnsmith@example.com": ["JohnSmith@example.com"]}
+
+def test_large_threshold_groups_similar_emails():
+    state = DedupState(similarity_threshold=3)
+    
+    for email in ["abcdef@example.com", "abcxyz@example.com", "zzzzzz@example.com"]:
+        state.add(email)
+        
+    assert state.similar_groups == {"abcdef@example.com": ["abcxyz@example.com"]}
+
+def test_index_memory_per_address():
+    rng = random.Random(5)
+    state = DedupState()
+    for _ in range(20000):
+        state.add("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(10)) + "@example.com")
+        
+    # At most 1 + 10 + 45 deletion variants of 12 bytes each, plus the tail buffer
+    assert state.index.nbytes / len(state) < 12 * 56 + 64
+
+@pytest.mark.asyncio
+async def test_astream_yields_before_reading_later_chunks(emails):
+    streaming = StreamingPreprocessor()
+    
+    async for chunk in streaming.astream(chunked(emails, 100)):
+        assert streaming.stats["chunks"] == 1
+        break
\ No newline at end of file
@@ -0,0 +1,48 @@
+from src.utils.bloom_filter import BloomFilter, ScalableBloomFilter
+
+def test_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"user{i}@example.com" for i in range(1000)]
+    
+    # Only false positives can report an unseen item as present
+    assert sum(bloom.add(item) for item in items) < 30
+    assert all(item in bloom for item in items)
+    assert bloom.add(items[0]) is True
+
+def test_false_positive_rate_near_target():
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"user{i}@example.com")
+        
+    false_positives = sum(f"other{i}@example.org" in bloom for i in range(10000))
+    
+    assert false_positives / 10000 < 0.02
+
+def test_scalable_filter_grows():
+    bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"user{i}@example.com")
+        
+    assert len(bloom.filters) > 1
+    assert all(f"user{i}@example.com" in bloom for i in range(1000))
+
+def test_memory_cap_stops_growth():
+    cap = BloomFilter.bytes_for(100, 0.005) + 100
+    bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01, max_bytes=cap)
+    for i in range(1000):
+        bloom.add(f"user{i}@example.com")
+        
+    assert len(bloom.filters) == 1
+    assert bloom.saturated
+    assert bloom.nbytes <= cap
+    assert all(f"user{i}@example.com" in bloom for i in range(100))
+
+def test_saturated_filter_refuses_new_items():
+    bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01, max_bytes=1)
+    for i in range(1000):
+        bloom.add(f"user{i}@example.com")
+        
+    assert len(bloom) == 100
+    assert bloom.refused == 900 - sum(f"user{i}@example.com" in bloom for i in range(100, 1000))
+    false_positives = sum(f"other{i}@example.org" in bloom for i in range(10000))
+    assert false_positives / 10000 < 0.02
\ No newline at end of file
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from src.utils.domain_table import DomainTable, get_domain_table
+from src.utils.stats_collector import StatsCollector
+from src.cache.cache_key_builder import CacheKeyBuilder
+
+@pytest.fixture
+def table():
+    return DomainTable()
+
+def test_same_domain_same_id(table):
+    ids = table.ids_of(["a@Example.com", "b@example.com ", "c@other.org", "no-domain", None])
+    
+    assert ids.dtype == np.int32
+    assert ids[0] == ids[1] != ids[2]
+    assert ids[3] == ids[4] == DomainTable.NO_DOMAIN
+    assert table.domain(ids[0]) == "example.com"
+    assert len(table) == 2
+
+def test_idna_and_registrable_forms(table):
+    unicode_id = table.intern("Bücher.de")
+    sub_id = table.id_of("user@mail.example.co.uk")
+    
+    assert table.idna(unicode_id) == "xn--bcher-kva.de"
+    assert table.registrable(sub_id) == "example.co.uk"
+    assert table.registrable(table.intern("example.co.uk")) == "example.co.uk"
+    assert table.registrable_ids(np.array([sub_id, unicode_id])).tolist() == [
+        table.intern("example.co.uk"), unicode_id
+    ]
+
+def test_grouping_and_counting(table):
+    ids = table.ids_of(["a@x.com", "b@y.com", "c@x.com", "d", "e@y.com", "f@x.com"])
+    
+    groups = table.group_positions(ids)
+    
+    assert [table.domain(domain_id) for domain_id in groups] == ["x.com", "y.com", ""]
+    assert groups[table.intern("x.com")].tolist() == [0, 2, 5]
+    assert table.top_domains(table.count(ids)) == [("x.com", 3), ("y.com", 2)]
+
+def test_shared_by_subsystems():
+    collector = StatsCollector()
+    for email, valid in [("a@Shared-Example.com", True), ("b@shared-example.com", False)]:
+        collector.collect_result({"email": email, "valid": valid})
+        
+    assert collector.domain_stats["shared-example.com"] == {"total": 2, "valid": 1, "invalid": 1}
+    assert get_domain_table().intern("SHARED-EXAMPLE.COM") == get_domain_table().intern("shared-example.com")
+    assert CacheKeyBuilder.build_mx_key("bücher.de") == CacheKeyBuilder.build_mx_key("xn--bcher-kva.de")
+
+def test_raw_spellings_are_not_stored(table):
+    for spelling in ["Example.com", "EXAMPLE.COM", " example.com", "example.com"]:
+        table.intern(spelling)
+        
+    assert len(table) == 1
+    assert len(table._ids) == 2
+
+def test_cache_keys_do_not_grow_the_table():
+    before = len(get_domain_table())
+    
+    for i in range(100):
+        CacheKeyBuilder.build_domain_key(f"Request-{i}.example")
+        
+    assert len(get_domain_table()) == before
+    assert CacheKeyBuilder.build_domain_key("Bücher.DE") == "domain:xn--bcher-kva.de"
\ No newline at end of file
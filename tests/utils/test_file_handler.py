@@ -0,0 +1,67 @@
+import pytest
+from openpyxl import Workbook
+from src.utils.file_handler import FileHandler
+
+@pytest.fixture
+def handler():
+    return FileHandler(chunk_size=2)
+
+def test_csv_reads_email_column_in_chunks(tmp_path, handler):
+    path = tmp_path / "export.csv"
+    path.write_text(
+        "id,name,Email Address,notes\n"
+        "1,A,a@example.com,x\n"
+        "2,B,,y\n"
+        "3,C,c@example.com,z\n"
+        "4,D,d@example.com,w\n"
+    )
+    
+    chunks = list(handler.iter_chunks(str(path)))
+    
+    assert chunks == [["a@example.com"], ["c@example.com", "d@example.com"]]
+    assert handler.read_file(str(path)) == ["a@example.com", "c@example.com", "d@example.com"]
+
+def test_csv_without_email_header_uses_first_column(tmp_path, handler):
+    path = tmp_path / "plain.csv"
+    path.write_text("address,score\na@example.com,1\nb@example.com,2\n")
+    
+    assert handler.read_file(str(path)) == ["a@example.com", "b@example.com"]
+
+def test_xlsx_streams_email_column(tmp_path, handler):
+    path = tmp_path / "export.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["id", "email", "notes"])
+    for i in range(5):
+        sheet.append([i, f"user{i}@example.com" if i != 2 else None, "n"])
+    workbook.save(path)
+    
+    chunks = list(handler.iter_chunks(str(path)))
+    
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+    assert handler.read_file(str(path)) == [
+        "user0@example.com", "user1@example.com", "user3@example.com", "user4@example.com"
+    ]
+
+def test_xlsx_reads_first_sheet_not_selected_one(tmp_path, handler):
+    path = tmp_path / "export.xlsx"
+    workbook = Workbook()
+    workbook.active.append(["email"])
+    workbook.active.append(["first@example.com"])
+    other = workbook.create_sheet("Other")
+    other.append(["email"])
+    other.append(["other@example.com"])
+    workbook.active = 1
+    workbook.save(path)
+    
+    assert handler.read_file(str(path)) == ["first@example.com"]
+
+def test_text_chunks(tmp_path, handler):
+    path = tmp_path / "emails.txt"
+    path.write_text("a@example.com\n\nb@example.com\nc@example.com\n")
+    
+    assert list(handler.iter_chunks(str(path))) == [["a@example.com", "b@example.com"], ["c@example.com"]]
+
+def test_unsupported_format(tmp_path, handler):
+    with pytest.raises(ValueError):
+        list(handler.iter_chunks(str(tmp_path / "emails.pdf")))
\ No newline at end of file
@@ -0,0 +1,31 @@
+import random
+import numpy as np
+from Levenshtein import distance
+from src.utils.qgram_filter import QGramFilter
+
+def _random_terms(rng, count):
+    alphabet = "abcdefghij._0123"
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+
+def test_never_discards_a_true_match():
+    rng = random.Random(3)
+    terms = _random_terms(rng, 2000)
+    for max_distance in (1, 2, 3):
+        qgram_filter = QGramFilter(max_distance, capacity=4)
+        qgram_filter.add_many(terms)
+        for query in _random_terms(rng, 50) + terms[:50]:
+            survivors = set(qgram_filter.candidates(query).tolist())
+            matches = {i for i, term in enumerate(terms) if distance(query, term) <= max_distance}
+            assert matches <= survivors
+
+def test_discards_distant_terms():
+    qgram_filter = QGramFilter(2)
+    qgram_filter.add_many(["john.smith", "john.smyth", "mary.jones", "js", "johnsmith2024"])
+    
+    assert qgram_filter.candidates("john.smith").tolist() == [0, 1]
+
+def test_restricted_positions():
+    qgram_filter = QGramFilter(1)
+    qgram_filter.add_many(["abc", "abd", "abc"])
+    
+    assert qgram_filter.candidates("abc", np.array([1, 2])).tolist() == [1, 2]
\ No newline at end of file
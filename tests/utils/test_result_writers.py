@@ -0,0 +1,91 @@
+import csv
+import json
+import sys
+import pytest
+from openpyxl import load_workbook
+from src.utils.result_writers import (
+    RESULT_COLUMNS,
+    CsvResultWriter,
+    NdjsonResultWriter,
+    ResultWriter,
+    XlsxResultWriter,
+    flatten_result,
+    open_result_writer
+)
+
+def make_result(i):
+    checks = {"syntax": {"is_valid": True, "issues": []}}
+    if i % 2:
+        checks["typo"] = {"has_typos": True, "suggestions": ["gmail.com"]}
+    return {
+        "email": f"user{i}@example.com",
+        "is_valid": i % 3 != 0,
+        "score": 100 - i,
+        "issues": ["a", "b"] if i % 3 == 0 else [],
+        "checks": checks,
+        "suggestions": []
+    }
+
+def test_flatten_uses_fixed_schema():
+    row = flatten_result(make_result(1))
+    
+    assert list(row) == RESULT_COLUMNS
+    assert row["syntax_is_valid"] is True
+    assert row["typo_has_typos"] is True
+    assert row["smtp_is_valid"] is None
+    assert json.loads(row["checks"])["typo"]["suggestions"] == ["gmail.com"]
+
+def test_csv_writer_flushes_in_blocks(tmp_path):
+    path = tmp_path / "out.csv"
+    writer = CsvResultWriter(str(path), buffer_size=4)
+    writer.write_many(make_result(i) for i in range(10))
+    
+    assert writer.written == 8
+    writer.close()
+    
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 10
+    assert rows[0]["issues"] == "a|b"
+    assert list(rows[0]) == RESULT_COLUMNS
+
+def test_ndjson_keeps_nested_results(tmp_path):
+    path = tmp_path / "out.ndjson"
+    with NdjsonResultWriter(str(path), buffer_size=3) as writer:
+        writer.write_many(make_result(i) for i in range(5))
+        
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines == [make_result(i) for i in range(5)]
+
+def test_xlsx_writer(tmp_path):
+    path = tmp_path / "out.xlsx"
+    with XlsxResultWriter(str(path), buffer_size=2) as writer:
+        writer.write_many(make_result(i) for i in range(5))
+        
+    rows = list(load_workbook(path, read_only=True).active.iter_rows(values_only=True))
+    assert list(rows[0]) == RESULT_COLUMNS
+    assert len(rows) == 6
+
+def test_parquet_writer_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    with open_result_writer(str(path), buffer_size=4) as writer:
+        writer.write_many(make_result(i) for i in range(10))
+        
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_rows == 10
+    assert parquet_file.metadata.num_row_groups == 3
+
+def test_parquet_writer_names_the_extra(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    
+    with pytest.raises(ImportError, match=r"\[parquet\]"):
+        open_result_writer(str(tmp_path / "out.parquet"))
+
+def test_base_writer_is_abstract(tmp_path):
+    with pytest.raises(TypeError):
+        ResultWriter(str(tmp_path / "out.txt"))
+
+def test_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        open_result_writer(str(tmp_path / "out.pdf"))
\ No newline at end of file
@@ -0,0 +1,37 @@
+import random
+from Levenshtein import distance
+from src.utils.similarity_index import SimilarityIndex, TAIL_SIZE
+
+def _random_terms(rng, count):
+    alphabet = "abcdefghij._0123"
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+
+def test_never_misses_a_true_match():
+    rng = random.Random(3)
+    terms = _random_terms(rng, 2000)
+    for max_distance in (1, 2, 3):
+        index = SimilarityIndex(max_distance)
+        for term in terms:
+            index.add(term)
+        for query in _random_terms(rng, 50) + terms[:50]:
+            survivors = set(index.candidates(query).tolist())
+            matches = {i for i, term in enumerate(terms) if distance(query, term) <= max_distance}
+            assert matches <= survivors
+
+def test_scopes_are_separate():
+    index = SimilarityIndex(1)
+    assert index.add("john", "example.com") == 0
+    assert index.add("john", "example.org") == 1
+    
+    assert index.candidates("jon", "example.com").tolist() == [0]
+    assert index.candidates("jon", "example.net").tolist() == []
+
+def test_memory_per_term_is_bounded_by_its_variants():
+    index = SimilarityIndex(2)
+    for i in range(20000):
+        index.add(f"user{i:06d}")
+        
+    # At most 1 + 10 + 45 variants of a 10-character term, 12 bytes each
+    assert index.entries <= 56 * len(index)
+    assert index.nbytes <= 12 * index.entries + 12 * TAIL_SIZE
+    assert 1234 in index.candidates("user001234").tolist()
\ No newline at end of file
@@ -0,0 +1,15 @@
+from src.utils.union_find import UnionFind
+
+def test_components():
+    clusters = UnionFind(6)
+    clusters.union_all([(0, 2), (2, 4), (3, 5)])
+    
+    assert clusters.components() == [[0, 2, 4], [1], [3, 5]]
+    assert clusters.components(min_size=2) == [[0, 2, 4], [3, 5]]
+
+def test_union_reports_merges():
+    clusters = UnionFind(3)
+    
+    assert clusters.union(0, 1)
+    assert not clusters.union(1, 0)
+    assert clusters.find(0) == clusters.find(1) != clusters.find(2)
\ No newline at end of file
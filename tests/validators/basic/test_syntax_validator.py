@@ -0,0 +1,59 @@
+import random
+import numpy as np
+import pytest
+from src.validators.basic.syntax_validator import SyntaxIssue, SyntaxValidator
+
+@pytest.fixture
+def validator():
+    return SyntaxValidator()
+
+def random_addresses(count, seed=0):
+    rng = random.Random(seed)
+    pieces = ["a", "B", "7", ".", "..", "_", "%", "+", "-", "@", " ", "é", "<", ">", '"', "x" * 65]
+    tails = [".com", ".c", ".co.uk", "-.io", ".c0m", "@x.org", ""]
+    addresses = []
+    for _ in range(count):
+        head = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 10)))
+        addresses.append(rng.choice(["", " ", "\t"]) + head + rng.choice(tails) + rng.choice(["", "\n"]))
+    return addresses + ["Name <user@example.com>", "a" * 250 + "@example.com", "user@example.com"]
+
+def test_fast_path_matches_diagnostics(validator):
+    accepted = 0
+    for address in random_addresses(50000):
+        result = validator.validate(address)
+        assert result == validator.validate(address, diagnostics=True), address
+        accepted += result["is_valid"]
+    assert accepted > 500
+
+def test_issues_only_for_failures(validator):
+    assert validator.validate(" John.Smith@Example.com ") == {
+        "is_valid": True,
+        "issues": [],
+        "normalized": "john.smith@example.com"
+    }
+    assert validator.validate("john..smith.@example.com")["issues"] == [
+        "Local part cannot end with dot",
+        "Local part cannot contain consecutive dots"
+    ]
+
+def test_validate_many_matches_validate(validator):
+    addresses = random_addresses(20000, seed=1)
+    
+    batch = validator.validate_many(np.array(addresses, dtype=object))
+    
+    assert batch.is_valid.dtype == bool and batch.issues.dtype == np.uint16
+    assert len(batch) == len(addresses)
+    for position, address in enumerate(addresses):
+        assert batch.result(position) == validator.validate(address, diagnostics=True), address
+
+def test_issue_bitmask(validator):
+    batch = validator.validate_many(["user@example.com", "no-at-sign", ".user.@-example.com", None])
+    
+    assert batch.is_valid.tolist() == [True, False, False, False]
+    assert batch.normalized.tolist() == ["user@example.com", None, None, None]
+    assert batch.issues[1] == SyntaxIssue.MISSING_AT
+    assert batch.issues[2] == (
+        SyntaxIssue.LOCAL_LEADING_DOT | SyntaxIssue.LOCAL_TRAILING_DOT
+        | SyntaxIssue.DOMAIN_LEADING_HYPHEN | SyntaxIssue.STRICT_FORMAT
+    )
+    assert batch.issues_of(3) == ["Error during validation"]
\ No newline at end of file
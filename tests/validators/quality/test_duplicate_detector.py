@@ -0,0 +1,90 @@
+import random
+import string
+import tracemalloc
+from src.validators.quality.duplicate_detector import DuplicateDetector
+
+def test_exact_mode_detects_similar():
+    detector = DuplicateDetector()
+    detector.check("john.smith@example.com")
+    
+    result = detector.check("john.smyth@example.com")
+    
+    assert result["duplicate_type"] == "similar"
+
+def test_probabilistic_mode_detects_exact_duplicates():
+    detector = DuplicateDetector(probabilistic=True, initial_capacity=100)
+    
+    assert not detector.check("John@Example.com")["is_duplicate"]
+    result = detector.check("john@example.com ")
+    
+    assert result["is_duplicate"]
+    assert result["duplicate_type"] == "probable"
+    assert not detector.seen_emails
+
+def test_probabilistic_mode_with_confirmation():
+    confirmed = {"a@example.com"}
+    detector = DuplicateDetector(probabilistic=True, confirm=lambda email: email in confirmed)
+    detector.check("a@example.com")
+    detector.check("b@example.com")
+    
+    assert detector.check("a@example.com")["duplicate_type"] == "exact"
+    assert not detector.check("b@example.com")["is_duplicate"]
+
+def test_similar_only_within_domain():
+    detector = DuplicateDetector()
+    detector.check("john.smith@example.com")
+    detector.check("john.smith@other.com")
+    
+    result = detector.check("john.smith1@other.com")
+    
+    assert result["similar_to"] == "john.smith@other.com"
+    assert result["similarity_score"] == 1
+    assert not detector.check("completely.different@example.com")["is_duplicate"]
+
+def test_similar_prefers_closest():
+    detector = DuplicateDetector()
+    detector.check("abcdefgh@example.com")
+    detector.check("abcdwxyz@example.com")
+    
+    assert detector.check("abcdwxyh@example.com")["similar_to"] == "abcdwxyz@example.com"
+    assert detector.check("abcdefgz@example.com")["similar_to"] == "abcdefgh@example.com"
+
+def test_exact_mode_memory_per_address():
+    rng = random.Random(2)
+    emails = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(12)) + f"@domain{rng.randrange(500)}.com"
+        for _ in range(5000)
+    ]
+    detector = DuplicateDetector()
+    detector.check("warmup@example.com")
+    
+    tracemalloc.start()
+    try:
+        for email in emails:
+            detector.check(email)
+        used = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        
+    # 79 deletion variants at 12 bytes each, plus the seen set and order
+    assert used / len(emails) < 1536
+
+def test_similar_lookup_comparisons_do_not_grow_with_domain():
+    rng = random.Random(4)
+    
+    def local_part():
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(10))
+        
+    detector = DuplicateDetector()
+    per_check = []
+    for size in (2000, 8000):
+        while len(detector.seen_order) < size:
+            detector.check(f"{local_part()}@gmail.com")
+        before = detector.comparisons
+        for _ in range(100):
+            detector.check(f"{local_part()}@gmail.com")
+        per_check.append((detector.comparisons - before) / 100)
+        
+    near = detector.seen_order[0].replace("@", "x@")
+    assert detector.check(near)["similar_to"] == detector.seen_order[0]
+    assert per_check[1] <= per_check[0] + 1 < 2
\ No newline at end of file
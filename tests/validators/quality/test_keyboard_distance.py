@@ -0,0 +1,60 @@
+import random
+import string
+import numpy as np
+from Levenshtein import distance
+from src.validators.quality.keyboard_distance import KeyboardDistance
+
+def reference_distance(keyboard, a, b):
+    rows = [[j * keyboard.indel_cost for j in range(len(b) + 1)]]
+    for i in range(1, len(a) + 1):
+        row = [i * keyboard.indel_cost]
+        for j in range(1, len(b) + 1):
+            substitution = 0.0 if a[i - 1] == b[j - 1] else keyboard.costs[min(ord(a[i - 1]), 128), min(ord(b[j - 1]), 128)]
+            best = min(
+                rows[i - 1][j] + keyboard.indel_cost,
+                row[j - 1] + keyboard.indel_cost,
+                rows[i - 1][j - 1] + substitution
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                best = min(best, rows[i - 2][j - 2] + keyboard.transposition_cost)
+            row.append(best)
+        rows.append(row)
+    return rows[-1][-1]
+
+def test_adjacent_keys_cost_less():
+    keyboard = KeyboardDistance()
+    
+    assert keyboard.distance("gmsil.com", "gmail.com") == 0.5
+    assert keyboard.distance("gxail.com", "gmail.com") == 1.0
+    assert keyboard.distance("gmial.com", "gmail.com") == 1.0
+    assert keyboard.distance("gmail.com", "gmail.com") == 0.0
+
+def test_layouts():
+    assert KeyboardDistance(layouts=("qwerty",)).distance("qmail.com", "amail.com") == 0.5
+    assert KeyboardDistance(layouts=("qwerty",)).distance("zmail.com", "amail.com") == 0.5
+    assert KeyboardDistance(layouts=("qwerty",)).distance("wmail.com", "zmail.com") == 1.0
+    assert KeyboardDistance(layouts=("azerty",)).distance("wmail.com", "zmail.com") == 1.0
+    assert KeyboardDistance(layouts=("azerty",)).distance("wmail.com", "qmail.com") == 0.5
+
+def test_unit_costs_match_damerau_levenshtein():
+    keyboard = KeyboardDistance(adjacent_cost=1.0)
+    
+    assert keyboard.distance("gmial.com", "gmail.com") == 1.0
+    assert keyboard.distance("gmail.com", "gmial.com") == distance("gmail.com", "gmial.com") - 1
+    assert keyboard.distance("", "abc") == 3.0
+    assert keyboard.distance("abc", "") == 3.0
+
+def test_vectorized_matches_reference():
+    keyboard = KeyboardDistance(transposition_cost=0.75)
+    rng = random.Random(11)
+    alphabet = string.ascii_lowercase[:8] + ".-é"
+    terms = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+        for _ in range(200)
+    ]
+    codes, lengths = keyboard.encode(terms)
+    
+    for term in terms[:40]:
+        expected = [reference_distance(keyboard, term, other) for other in terms]
+        
+        assert np.allclose(keyboard.distances(term, codes, lengths), expected)
\ No newline at end of file
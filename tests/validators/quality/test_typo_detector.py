@@ -0,0 +1,149 @@
+import random
+import string
+from Levenshtein import distance
+from src.validators.quality.domain_suggester import DomainSuggester, get_default_suggester
+from src.cache.lru_cache import LRUCache
+from src.validators.quality.typo_detector import TypoDetector, get_domain_verdict_cache
+
+def test_known_domains_are_not_typos():
+    detector = TypoDetector()
+    
+    for email in ["john@gmail.com", "john@yahoo.com", "john@gmx.de", "john@yahoo.co.uk"]:
+        assert not detector.check(email)["has_typos"]
+
+def test_suggests_closest_known_domain():
+    detector = TypoDetector()
+    
+    result = detector.check("john@protonmial.com")
+    
+    assert result["has_typos"]
+    assert result["suggestions"][0] == "john@protonmail.com"
+    assert result["issues"] == ["Similar to protonmail.com"]
+
+def test_known_typos_keep_high_confidence():
+    result = TypoDetector().check("john@gmai.com")
+    
+    assert result["suggestions"] == ["john@gmail.com"]
+    assert result["confidence"] == 0.9
+
+def test_popularity_breaks_ties():
+    suggester = DomainSuggester(["mail.com", "gmail.com", "ymail.com"])
+    
+    assert suggester.suggest("xmail.com") == [("mail.com", 1), ("gmail.com", 1), ("ymail.com", 1)]
+    assert suggester.suggest("xmail.com", limit=1) == [("mail.com", 1)]
+    assert suggester.suggest("gmail.com") == []
+
+def test_short_real_domains_are_not_typos():
+    detector = TypoDetector()
+    
+    for domain in ["ibm.com", "cnn.com", "bbc.com", "hp.com", "ge.com", "bt.com", "meta.com", "sap.com", "abc.com"]:
+        result = detector.check(f"john@{domain}")
+        
+        assert not result["has_typos"], domain
+        assert not result["issues"], domain
+
+def test_cutoff_scales_with_name_length():
+    suggester = DomainSuggester(["aol.com", "gmail.com", "yahoo.com", "gmx.de"])
+    
+    assert suggester.suggest("aim.com") == []
+    assert suggester.suggest("yahop.com") == [("yahoo.com", 0.5)]
+    assert suggester.suggest("yhaoo.com") == [("yahoo.com", 1)]
+    assert suggester.suggest("yahxx.com") == []
+    assert suggester.suggest("gmail.de") == []
+    assert suggester.suggest("gmail.con") == [("gmail.com", 0.5)]
+
+def test_suffix_typos_of_known_names():
+    detector = TypoDetector(verdict_cache=LRUCache())
+    
+    for domain, expected in [
+        ("gmail.co", "gmail.com"),
+        ("gmail.cm", "gmail.com"),
+        ("gmail.om", "gmail.com"),
+        ("gmail.c", "gmail.com"),
+        ("hotmail.co", "hotmail.com"),
+        ("outlook.co", "outlook.com"),
+        ("yahoo.co", "yahoo.com"),
+    ]:
+        result = detector.check(f"john@{domain}")
+        
+        assert result["has_typos"], domain
+        assert result["suggestions"][0] == f"john@{expected}", domain
+
+def test_suffix_typos_stay_close():
+    suggester = DomainSuggester(["gmail.com", "yahoo.com", "yahoo.co.uk", "mail.ru"])
+    
+    assert suggester.suggest("yahoo.co") == [("yahoo.com", 0.5)]
+    assert suggester.suggest("gmail.de") == []
+    assert suggester.suggest("mail.de") == []
+    assert suggester.suggest("gmail.cz") == []
+
+def test_suggest_matches_brute_force():
+    domains = get_default_suggester().domains
+    suggester = DomainSuggester(domains)
+    names, suffixes, _ = zip(*(suggester.split(domain) for domain in domains))
+    codes, lengths = suggester.keyboard.encode(names)
+    rng = random.Random(3)
+    
+    for _ in range(300):
+        chars = list(rng.choice(domains))
+        for _ in range(rng.randint(1, 3)):
+            chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase)
+        typo = "".join(chars)
+        name, suffix, known = suggester.split(typo)
+        if typo in suggester or not known:
+            continue
+        cutoff = suggester.cutoff(name)
+        scores = dict(zip(domains, suggester.keyboard.distances(name, codes, lengths)))
+        matches = suggester.suggest(typo, limit=len(domains))
+        found = {domain for domain, _ in matches}
+        
+        by_name = [(domain, score) for domain, score in matches if suggester.split(domain)[1] == suffix]
+        by_suffix = [domain for domain, _ in matches if suggester.split(domain)[1] != suffix]
+        
+        assert all(score == scores[domain] <= cutoff for domain, score in by_name)
+        assert all(suggester.split(domain)[0] == name for domain in by_suffix)
+        assert found >= {
+            domain for domain, other, other_suffix in zip(domains, names, suffixes)
+            if other_suffix == suffix and distance(name, other) <= cutoff
+        }
+        assert matches == sorted(matches, key=lambda match: (match[1], suggester.ranks[match[0]]))
+
+def test_lookup_cost_does_not_grow_with_corpus():
+    rng = random.Random(5)
+    domains = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12))) + ".com"
+        for _ in range(5000)
+    ]
+    suggester = DomainSuggester(domains)
+    typos = [domain[1:] for domain in rng.sample(domains, 500)]
+    
+    # Candidates scored per lookup, independent of wall-clock time
+    scored = [len(suggester.index.candidates(suggester.split(typo)[0])) for typo in typos]
+    
+    assert sum(scored) / len(typos) < 0.01 * len(domains)
+    assert all(suggester.suggest(typo) for typo in typos)
+
+def test_domain_verdicts_are_memoized():
+    cache = LRUCache()
+    detector = TypoDetector(verdict_cache=cache)
+    
+    first = detector.check("john@gmial.com")
+    second = detector.check("jane@gmial.com")
+    
+    assert second["suggestions"] == ["jane@gmail.com"]
+    assert first["suggestions"] == ["john@gmail.com"]
+    assert (cache.metrics.hits, cache.metrics.misses) == (1, 1)
+
+def test_default_detectors_share_verdicts():
+    assert TypoDetector().verdict_cache is TypoDetector().verdict_cache
+    assert TypoDetector(DomainSuggester(["example.com"])).verdict_cache is not get_domain_verdict_cache()
+
+def test_check_many_matches_check():
+    cache = LRUCache()
+    detector = TypoDetector(verdict_cache=cache)
+    emails = ["john@gmial.com", "jane@GMIAL.com", "qwerty@example.com", "aaaalice@yahoo.com", "broken"]
+    
+    results = detector.check_many(emails)
+    
+    assert results == [TypoDetector(verdict_cache=LRUCache()).check(email) for email in emails]
+    assert cache.metrics.misses == 3
\ No newline at end of file